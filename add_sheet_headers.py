@@ -5,17 +5,16 @@ Run once to set up the spreadsheet schema.
 """
 
 import os
-import json
 from dotenv import load_dotenv
-from google.oauth2 import service_account
 from googleapiclient.discovery import build
 
+from email_outreach_flow import col_to_letter, service_account_credentials
+
 # Load environment variables
 load_dotenv()
 
 # Configuration
 GOOGLE_SHEETS_ID = os.getenv("GOOGLE_SHEETS_ID", "")
-SERVICE_ACCOUNT_SOURCE = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON", "service-account.json")
 
 # New headers to add for email outreach + follow-up tracking
 NEW_HEADERS = [
@@ -31,18 +30,13 @@ NEW_HEADERS = [
     "EmailCount",        # Number of emails sent (0, 1, 2, or 3)
     "LastEmailSentAt",   # Timestamp of most recent email
     "NextFollowUpDate",  # When to send next follow-up
+    "PreparedFollowUp",  # Follow-up generated overnight by prepare_followups.py
+    "JobKey",            # Dedup key (build_job_key) read by job_automation_langchain.py
 ]
 
 def make_credentials(scopes):
-    """Create service account credentials."""
-    source = SERVICE_ACCOUNT_SOURCE
-    if os.path.isfile(source):
-        with open(source, "r", encoding="utf-8") as f:
-            raw_json = f.read()
-    else:
-        raw_json = source
-    info = json.loads(raw_json)
-    return service_account.Credentials.from_service_account_info(info, scopes=scopes)
+    """Create service account credentials (shared with email_outreach_flow)."""
+    return service_account_credentials(tuple(scopes))
 
 def get_current_headers(service, spreadsheet_id, sheet_name="Sheet1"):
     """Get existing headers from row 1."""
@@ -62,20 +56,8 @@ def add_headers(service, spreadsheet_id, current_headers, new_headers, sheet_nam
         print("All headers already exist. Nothing to add.")
         return
 
-    # Calculate starting column (after existing headers)
-    start_col = len(current_headers) + 1
-    start_col_letter = chr(ord('A') + len(current_headers)) if len(current_headers) < 26 else f"A{chr(ord('A') + len(current_headers) - 26)}"
-
-    # For columns beyond Z, use AA, AB, etc.
-    if len(current_headers) >= 26:
-        first = len(current_headers) // 26
-        second = len(current_headers) % 26
-        if first == 0:
-            start_col_letter = chr(ord('A') + second)
-        else:
-            start_col_letter = chr(ord('A') + first - 1) + chr(ord('A') + second)
-    else:
-        start_col_letter = chr(ord('A') + len(current_headers))
+    # Starting column (after existing headers): A..Z, AA, AB, ...
+    start_col_letter = col_to_letter(len(current_headers))
 
     # Update the header row
     range_name = f"{sheet_name}!{start_col_letter}1"
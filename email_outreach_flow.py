@@ -18,33 +18,61 @@ Or as systemd service (see /etc/systemd/system/email-outreach.*)
 
 import os
 import json
+import asyncio
 import base64
+import functools
+import hashlib
 import random
+import re
+import sqlite3
+import threading
 import time
-from datetime import datetime, timedelta
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta
+from email.header import Header
+from email.utils import formataddr, parseaddr
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
+import httplib2
 from dotenv import load_dotenv
+from google_auth_httplib2 import AuthorizedHttp
 from google.oauth2 import service_account
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from openai import OpenAI
+from googleapiclient.model import JsonModel
+from openai import AsyncOpenAI, OpenAI
 import click
 
+try:
+    import orjson  # Optional: faster parsing of API and model JSON responses
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
 
+def json_loads(data):
+    """Parse JSON with orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> str:
+    """Serialize compact JSON with orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     GOOGLE_SHEETS_ID: str = os.getenv("GOOGLE_SHEETS_ID", "")
     GOOGLE_SERVICE_ACCOUNT_JSON: str = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON", "service-account.json")
@@ -63,11 +91,30 @@ class Config:
     DAILY_EMAIL_LIMIT: int = 350      # Target 250-400 emails/day
     MIN_DELAY_SECONDS: int = 30       # Minimum wait between emails
     MAX_DELAY_SECONDS: int = 90       # Maximum wait between emails
+    SEND_CONCURRENCY: int = 8         # Emails in flight at once (each waits its own random delay)
+    SEND_BATCH_SIZE: int = 1          # Emails per Gmail batch request (max 100); 1 = one send per delay
+    API_NUM_RETRIES: int = 5          # Exponential backoff retries on Google API 429/5xx responses
+    SHEETS_FLUSH_ROWS: int = 25       # Row updates buffered before one Sheets batchUpdate
 
     # Follow-up settings
     FOLLOW_UP_DAYS: int = 3           # Days between emails
     MAX_EMAILS_PER_CONTACT: int = 3   # Maximum emails to send per person
 
+    # OpenAI response cache (skips regenerating identical prompts)
+    EMAIL_MODEL: str = "gpt-4o-mini"
+    EMAIL_TEMPERATURE: float = 0.0    # Every generation is cached; deterministic output maximizes hits
+    PROMPT_CACHE_PATH: str = os.getenv("PROMPT_CACHE_PATH", ".email_prompt_cache.sqlite3")
+    PROMPT_CACHE_TTL_DAYS: int = 7
+    EMAIL_BATCH_SIZE: int = 15        # Jobs per batched OpenAI request
+    GENERATION_CONCURRENCY: int = 4   # Batched OpenAI requests in flight at once
+
+    # Gmail history cursor for incremental reply detection
+    GMAIL_STATE_PATH: str = os.getenv("GMAIL_STATE_PATH", ".gmail_state.json")
+    GMAIL_RETRY_PAUSE_SECONDS: int = 5  # Pause before re-fetching message gets a batch rejected (429s)
+
+    # Overnight follow-up generation via the OpenAI Batch API (prepare_followups.py)
+    FOLLOWUP_BATCH_STATE_PATH: str = os.getenv("FOLLOWUP_BATCH_STATE_PATH", ".followup_batch.json")
+
 config = Config()
 
 
@@ -98,130 +145,481 @@ STRENGTHS:
 """
 
 
+# Static system prompt shared by every email. Built once at import (never per call)
+# so it stays byte-identical and OpenAI's automatic prompt caching can reuse the prefix.
+SYSTEM_PROMPT = """You write short outreach emails for a CS student seeking an internship.
+
+CANDIDATE PROFILE:
+""" + CANDIDATE_PROFILE + """
+The user message gives the EMAIL TYPE and JOB DETAILS. Follow the instructions for that type.
+
+INITIAL OUTREACH (cold email):
+1. Write a SHORT, direct, professional email (under 150 words)
+2. Use recipient's first name if available, otherwise "Hi there"
+3. Mention the specific job title and company
+4. Highlight 2-3 relevant skills from matched skills
+5. Include the resume link naturally in the email
+6. End with clear call to action (brief call or conversation)
+7. Be confident but not arrogant
+
+FOLLOW-UP #1 (sent 3 days after initial email, no response yet):
+1. Keep it SHORT (under 100 words)
+2. Reference the original email naturally
+3. Add new value - mention something specific from job description
+4. Connect your experience to their needs
+5. Use subject "Re: <original subject>" to thread the conversation
+6. Be helpful, not pushy
+
+FOLLOW-UP #2 (final attempt, 6 days after initial email, no response to 2 emails):
+1. Very SHORT (under 75 words)
+2. Acknowledge this is last follow-up
+3. Keep door open for future opportunities
+4. Offer LinkedIn connection: linkedin.com/in/carlos-luna
+5. Be gracious, not desperate
+6. Use subject "Re: <original subject>"
+
+ALL EMAILS:
+- NO emojis, NO exclamation marks
+
+OUTPUT FORMAT (JSON):
+{"subject": "...", "body": "..."}
+"""
+
+# Per-job user messages, filled with str.format_map (plain strings, not f-strings)
+INITIAL_PROMPT_TEMPLATE = """EMAIL TYPE: INITIAL OUTREACH
+
+JOB DETAILS:
+- Recipient: {recipient_name}
+- Company: {company_name}
+- Position: {job_title}
+- Matched Skills: {matched_skills}
+- Resume Link: {resume_url}
+- Job Description (excerpt): {job_description}
+"""
+
+FOLLOWUP_1_PROMPT_TEMPLATE = """EMAIL TYPE: FOLLOW-UP #1
+Original subject was: "{original_subject}"
+
+JOB DETAILS:
+- Recipient: {recipient_name}
+- Company: {company_name}
+- Position: {job_title}
+- Matched Skills: {matched_skills}
+- Job Description (excerpt): {job_description}
+"""
+
+FOLLOWUP_2_PROMPT_TEMPLATE = """EMAIL TYPE: FOLLOW-UP #2
+Original subject was: "{original_subject}"
+
+JOB DETAILS:
+- Recipient: {recipient_name}
+- Company: {company_name}
+- Position: {job_title}
+"""
+
+# Completion token caps sized to each type's word limit plus the JSON wrapper
+EMAIL_MAX_TOKENS = {"initial": 300, "followup_1": 200, "followup_2": 150}
+
+
+# =============================================================================
+# GOOGLE API TRANSPORT
+# =============================================================================
+
+@functools.lru_cache(maxsize=None)
+def service_account_credentials(scopes: Tuple[str, ...]):
+    """
+    Service-account credentials for the given scopes, loaded once per process.
+    GOOGLE_SERVICE_ACCOUNT_JSON may be a file path or the raw JSON itself.
+    """
+    source = config.GOOGLE_SERVICE_ACCOUNT_JSON
+    if os.path.isfile(source):
+        with open(source, "rb") as f:
+            raw_json = f.read()
+    else:
+        raw_json = source
+    info = json_loads(raw_json)
+    return service_account.Credentials.from_service_account_info(info, scopes=list(scopes))
+
+
+class OrjsonModel(JsonModel):
+    """googleapiclient response model that decodes bodies with orjson."""
+
+    def deserialize(self, content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+
+
+def build_service(api: str, version: str, creds):
+    """
+    Build a googleapiclient service over its own persistent httplib2 connection.
+    httplib2.Http is not thread-safe, so callers keep one service per thread;
+    within a thread every request reuses the same keep-alive TLS connection.
+    The discovery document comes from the copy bundled with the library.
+    """
+    http = AuthorizedHttp(creds, http=httplib2.Http(cache=None))
+    model = OrjsonModel() if orjson is not None else None
+    return build(api, version, http=http, model=model, static_discovery=True, cache_discovery=False)
+
+
 # =============================================================================
 # GOOGLE SHEETS CLIENT
 # =============================================================================
 
+# Dates are written as "YYYY-MM-DD HH:MM:SS", so the date part compares lexically
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _sent_date(value: str) -> str:
+    """YYYY-MM-DD prefix of a LastEmailSentAt cell, or "" when it is not a date."""
+    value = value.strip()
+    return value[:10] if _ISO_DATE.match(value) else ""
+
+
+def _idx_to_letters(col_index: int) -> str:
+    """Bijective base-26: 0=A, 25=Z, 26=AA, 701=ZZ, 702=AAA."""
+    letters = ""
+    n = col_index + 1
+    while n:
+        n, r = divmod(n - 1, 26)
+        letters = chr(ord('A') + r) + letters
+    return letters
+
+
+# A..ZZ precomputed; wider sheets fall back to the arithmetic
+_COL_LETTERS = [_idx_to_letters(i) for i in range(702)]
+
+
+def col_to_letter(col_index: int) -> str:
+    """Convert a 0-based column index to its A1-notation letters."""
+    if col_index < len(_COL_LETTERS):
+        return _COL_LETTERS[col_index]
+    return _idx_to_letters(col_index)
+
+
+# Columns the outreach flow reads; everything else (resume paths, ATS scores,
+# slide links, ...) is never fetched
+OUTREACH_COLUMNS = (
+    "Name", "Email", "CompanyName", "JobTitle", "JobDescription", "MatchedSkills",
+    "ResumePdfUrl", "EmailStatus", "EmailCount", "LastEmailSentAt", "DraftedEmail",
+    "PreparedFollowUp",
+)
+
+
 class GoogleSheetsClient:
     """Client for Google Sheets operations with follow-up support."""
 
     def __init__(self):
-        source = config.GOOGLE_SERVICE_ACCOUNT_JSON
-        if os.path.isfile(source):
-            with open(source, "r", encoding="utf-8") as f:
-                raw_json = f.read()
-        else:
-            raw_json = source
-        info = json.loads(raw_json)
-        scopes = ['https://www.googleapis.com/auth/spreadsheets']
-        self.creds = service_account.Credentials.from_service_account_info(info, scopes=scopes)
-        self.service = build('sheets', 'v4', credentials=self.creds)
+        self.creds = service_account_credentials(('https://www.googleapis.com/auth/spreadsheets',))
+        self._local = threading.local()
+        self._header_index: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self._columns_cache: Dict[Tuple[str, str], Dict[str, List]] = {}
+
+    @property
+    def service(self):
+        """Sheets service for the calling thread (googleapiclient objects are not thread-safe)."""
+        if getattr(self._local, "service", None) is None:
+            self._local.service = build_service('sheets', 'v4', self.creds)
+        return self._local.service
+
+    def get_columns(self, spreadsheet_id: str, sheet_name: str = "Sheet1", use_cache: bool = True) -> Dict[str, List]:
+        """
+        Read the OUTREACH_COLUMNS of the sheet column-wise:
+        {"_row_number": [2, 3, ...], header: [cell, ...]}.
+        Only those columns are requested (one batchGet, column-major), using the
+        cached header row to locate them.
+        Cached for the rest of the run and kept in sync by update_rows.
+        """
+        key = (spreadsheet_id, sheet_name)
+        if use_cache and key in self._columns_cache:
+            return self._columns_cache[key]
 
-    def get_all_rows(self, spreadsheet_id: str, sheet_name: str = "Sheet1") -> List[Dict]:
-        """Read all rows from sheet as list of dicts."""
         try:
-            result = self.service.spreadsheets().values().get(
+            header_index = self.get_header_index(spreadsheet_id, sheet_name)
+            headers = [header for header in OUTREACH_COLUMNS if header in header_index]
+            if not headers:
+                return {}
+            ranges = []
+            for header in headers:
+                letter = col_to_letter(header_index[header])
+                ranges.append(f"{sheet_name}!{letter}2:{letter}")
+
+            result = self.service.spreadsheets().values().batchGet(
                 spreadsheetId=spreadsheet_id,
-                range=f"{sheet_name}!A:Z"
-            ).execute()
-
-            values = result.get('values', [])
-            if not values or len(values) < 2:
-                return []
-
-            headers = values[0]
-            rows = []
-            for i, row in enumerate(values[1:], start=2):
-                row_dict = {"_row_number": i}
-                for j, header in enumerate(headers):
-                    row_dict[header] = row[j] if j < len(row) else ""
-                rows.append(row_dict)
-            return rows
+                ranges=ranges,
+                majorDimension="COLUMNS",
+                fields='valueRanges/values'
+            ).execute(num_retries=config.API_NUM_RETRIES)
+
+            # Each range comes back as [[cell, ...]] with trailing blanks trimmed
+            cells = [(value_range.get('values') or [[]])[0] for value_range in result.get('valueRanges', [])]
+            n = max((len(column) for column in cells), default=0)
+            if not n:
+                return {}
+
+            columns = {"_row_number": list(range(2, n + 2))}
+            for header, column in zip(headers, cells):
+                columns[header] = column + [""] * (n - len(column))
+            columns["_last_sent_date"] = [_sent_date(value) for value in columns.get("LastEmailSentAt", [""] * n)]
+            self._columns_cache[key] = columns
+            return columns
         except HttpError as e:
             print(f"Error reading sheet: {e}")
+            return {}
+
+    @staticmethod
+    def _row_at(columns: Dict[str, List], index: int) -> Dict:
+        return {header: values[index] for header, values in columns.items()}
+
+    def get_all_rows(self, spreadsheet_id: str, sheet_name: str = "Sheet1", use_cache: bool = True) -> List[Dict]:
+        """Read all rows from sheet as list of dicts."""
+        columns = self.get_columns(spreadsheet_id, sheet_name, use_cache)
+        if not columns:
             return []
+        return [self._row_at(columns, i) for i in range(len(columns["_row_number"]))]
+
+    def classify_rows(self, spreadsheet_id: str, sheet_name: str = "Sheet1",
+                      as_of: Optional[date] = None) -> Dict[str, List[Dict]]:
+        """
+        Classify every row in a single pass over the cached columns; only the
+        selected rows are turned into dicts. `as_of` (default today) is the day
+        follow-ups are due on.
+        Returns {"pending": [...], "followup_1": [...], "followup_2": [...],
+        "active": [...]} where "active" is every conversation awaiting a reply.
+        """
+        # A follow-up is due when the last email went out on or before this date
+        cutoff = ((as_of or datetime.now().date()) - timedelta(days=config.FOLLOW_UP_DAYS)).isoformat()
+        classified = {"pending": [], "followup_1": [], "followup_2": [], "active": []}
+
+        columns = self.get_columns(spreadsheet_id, sheet_name)
+        if not columns:
+            return classified
+        n = len(columns["_row_number"])
+        blank = [""] * n
+        emails = columns.get("Email", blank)
+        statuses = [status.strip().lower() for status in columns.get("EmailStatus", blank)]
+        last_sent_raw = columns.get("LastEmailSentAt", blank)
+        last_sent = columns["_last_sent_date"]  # parsed once at read time
+        counts = columns.get("EmailCount", blank)
+
+        with_email = [i for i in range(n) if emails[i].strip()]
+        classified["pending"] = [self._row_at(columns, i) for i in with_email if statuses[i] == "pending"]
+        classified["active"] = [
+            self._row_at(columns, i) for i in with_email
+            if statuses[i] in ("sent", "followed_up_1", "followed_up_2") and last_sent_raw[i].strip()
+        ]
+
+        # Follow-up is due 3+ days after the last email; malformed dates are skipped
+        due = [
+            i for i in with_email
+            if statuses[i] in ("sent", "followed_up_1")
+            and last_sent[i] and last_sent[i] <= cutoff
+        ]
+
+        for i in due:
+            email_status = statuses[i]
+            email_count = int(counts[i] or "0")
+            if email_status == "sent" and email_count == 1:
+                classified["followup_1"].append(self._row_at(columns, i))
+            elif email_status == "followed_up_1" and email_count == 2:
+                classified["followup_2"].append(self._row_at(columns, i))
+
+        return classified
 
     def get_pending_emails(self, spreadsheet_id: str) -> List[Dict]:
         """Get rows where EmailStatus is 'pending' and Email is not empty."""
-        all_rows = self.get_all_rows(spreadsheet_id)
-        pending = []
-        for row in all_rows:
-            email_status = row.get("EmailStatus", "").strip().lower()
-            email = row.get("Email", "").strip()
-            if email_status == "pending" and email:
-                pending.append(row)
-        return pending
+        return self.classify_rows(spreadsheet_id)["pending"]
 
     def get_followups_due(self, spreadsheet_id: str) -> Tuple[List[Dict], List[Dict]]:
         """
         Get rows where follow-up is due.
         Returns (followup_1_due, followup_2_due) sorted by priority.
         """
-        all_rows = self.get_all_rows(spreadsheet_id)
-        today = datetime.now().date()
-
-        followup_1 = []  # EmailStatus = "sent", EmailCount = 1, 3+ days ago
-        followup_2 = []  # EmailStatus = "followed_up_1", EmailCount = 2, 3+ days ago
-
-        for row in all_rows:
-            email_status = row.get("EmailStatus", "").strip().lower()
-            email = row.get("Email", "").strip()
-            email_count = int(row.get("EmailCount", "0") or "0")
-            last_sent = row.get("LastEmailSentAt", "").strip()
-
-            if not email or not last_sent:
-                continue
+        classified = self.classify_rows(spreadsheet_id)
+        return classified["followup_1"], classified["followup_2"]
 
-            # Parse last sent date
-            try:
-                last_sent_date = datetime.strptime(last_sent[:10], "%Y-%m-%d").date()
-                days_since = (today - last_sent_date).days
-            except ValueError:
-                continue
-
-            # Check if follow-up is due (3+ days since last email)
-            if days_since >= config.FOLLOW_UP_DAYS:
-                if email_status == "sent" and email_count == 1:
-                    followup_1.append(row)
-                elif email_status == "followed_up_1" and email_count == 2:
-                    followup_2.append(row)
+    def get_header_index(self, spreadsheet_id: str, sheet_name: str = "Sheet1") -> Dict[str, int]:
+        """Return {header: column index} for row 1, fetched once per sheet and cached."""
+        key = (spreadsheet_id, sheet_name)
+        if key not in self._header_index:
+            result = self.service.spreadsheets().values().get(
+                spreadsheetId=spreadsheet_id,
+                range=f"{sheet_name}!1:1",
+                fields='values'
+            ).execute(num_retries=config.API_NUM_RETRIES)
+            headers = result.get('values', [[]])[0]
+            self._header_index[key] = {header: i for i, header in enumerate(headers)}
+        return self._header_index[key]
 
-        return followup_1, followup_2
+    def invalidate_headers(self):
+        """Drop cached header rows (call after the sheet schema changes, e.g. add_sheet_headers.py)."""
+        self._header_index.clear()
 
     def update_row(self, spreadsheet_id: str, row_number: int, updates: Dict[str, str], sheet_name: str = "Sheet1"):
-        """Update specific cells in a row."""
+        """Update specific cells in a row with a single batchUpdate call."""
+        self.update_rows(spreadsheet_id, {row_number: updates}, sheet_name)
+
+    def update_rows(self, spreadsheet_id: str, row_updates: Dict[int, Dict[str, str]],
+                    sheet_name: str = "Sheet1") -> bool:
+        """Update cells across several rows with a single batchUpdate call. Returns False if the write failed."""
         try:
-            # Get headers to find column indices
-            result = self.service.spreadsheets().values().get(
+            header_index = self.get_header_index(spreadsheet_id, sheet_name)
+
+            data = [
+                {
+                    "range": f"{sheet_name}!{self._col_to_letter(header_index[field])}{row_number}",
+                    "values": [[value]]
+                }
+                for row_number, updates in row_updates.items()
+                for field, value in updates.items()
+                if field in header_index
+            ]
+            if not data:
+                return True
+
+            self.service.spreadsheets().values().batchUpdate(
                 spreadsheetId=spreadsheet_id,
-                range=f"{sheet_name}!1:1"
-            ).execute()
-            headers = result.get('values', [[]])[0]
+                body={"valueInputOption": "RAW", "data": data}
+            ).execute(num_retries=config.API_NUM_RETRIES)
 
-            # Build update requests
-            for field, value in updates.items():
-                if field in headers:
-                    col_index = headers.index(field)
-                    col_letter = self._col_to_letter(col_index)
-                    range_name = f"{sheet_name}!{col_letter}{row_number}"
-                    self.service.spreadsheets().values().update(
-                        spreadsheetId=spreadsheet_id,
-                        range=range_name,
-                        valueInputOption='RAW',
-                        body={'values': [[value]]}
-                    ).execute()
+            for row_number, updates in row_updates.items():
+                self._apply_to_cache(spreadsheet_id, sheet_name, row_number, updates)
+            return True
 
         except HttpError as e:
-            print(f"Error updating row {row_number}: {e}")
+            click.secho(f"   [ERROR] Error updating rows {sorted(row_updates)}: {e}", fg="red")
+            return False
+
+    def _apply_to_cache(self, spreadsheet_id: str, sheet_name: str, row_number: int, updates: Dict[str, str]):
+        """Keep the cached columns in sync with a successful write instead of re-reading the sheet."""
+        columns = self._columns_cache.get((spreadsheet_id, sheet_name))
+        if not columns:
+            return
+        index = row_number - 2
+        if 0 <= index < len(columns["_row_number"]) and columns["_row_number"][index] == row_number:
+            for field, value in updates.items():
+                if field in columns:
+                    columns[field][index] = value
+            if "LastEmailSentAt" in updates:
+                columns["_last_sent_date"][index] = _sent_date(updates["LastEmailSentAt"])
+        else:
+            # Row layout no longer matches; force a fresh read next time
+            del self._columns_cache[(spreadsheet_id, sheet_name)]
 
     def _col_to_letter(self, col_index: int) -> str:
         """Convert column index to letter (0=A, 25=Z, 26=AA, etc.)"""
-        if col_index < 26:
-            return chr(ord('A') + col_index)
-        else:
-            first = col_index // 26 - 1
-            second = col_index % 26
-            return chr(ord('A') + first) + chr(ord('A') + second)
+        return col_to_letter(col_index)
+
+
+class SheetsBatch:
+    """
+    Buffer row updates and write them with one values.batchUpdate per flush.
+    Flushes automatically every SHEETS_FLUSH_ROWS rows so a crashed run loses
+    at most that many status writes; call flush() at the end of each phase.
+    """
+
+    def __init__(self, sheets: GoogleSheetsClient, spreadsheet_id: str, sheet_name: str = "Sheet1",
+                 flush_rows: Optional[int] = None):
+        self.sheets = sheets
+        self.spreadsheet_id = spreadsheet_id
+        self.sheet_name = sheet_name
+        self.flush_rows = flush_rows or config.SHEETS_FLUSH_ROWS
+        self.pending: Dict[int, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def full(self) -> bool:
+        return len(self.pending) >= self.flush_rows
+
+    def queue(self, row_number: int, updates: Dict[str, str]):
+        with self._lock:
+            self.pending.setdefault(row_number, {}).update(updates)
+
+    def flush(self) -> bool:
+        """
+        Write the buffered updates. Returns False if the write failed; the failed
+        updates are re-queued (under any newer ones) for the next flush.
+        """
+        with self._lock:
+            pending, self.pending = self.pending, {}
+        if not pending or self.sheets.update_rows(self.spreadsheet_id, pending, self.sheet_name):
+            return True
+        with self._lock:
+            for row_number, updates in pending.items():
+                self.pending[row_number] = {**updates, **self.pending.get(row_number, {})}
+        return False
+
+
+def original_subject_for(job_data: Dict) -> str:
+    """Recover the first email's subject from DraftedEmail (used to thread follow-ups)."""
+    original_subject = ""
+    drafted = job_data.get("DraftedEmail", "")
+    start = drafted.find("Subject:") if drafted else -1
+    if start != -1:
+        start += len("Subject:")
+        end = drafted.find("\n", start)
+        original_subject = drafted[start:end if end != -1 else None].strip()
+        # Remove "Re: " prefix if present to get original
+        original_subject = original_subject.removeprefix("Re: ").strip()
+    return original_subject or f"Interest in {job_data.get('JobTitle', 'Unknown')}"
+
+
+def prepared_email_for(job_data: Dict, email_type: str) -> Optional[Dict[str, str]]:
+    """Return the email prepare_followups.py stored for this row, if it matches email_type."""
+    try:
+        prepared = json_loads(job_data.get("PreparedFollowUp", "") or "null")
+    except ValueError:
+        return None
+    if not isinstance(prepared, dict) or prepared.get("type") != email_type:
+        return None
+    if not prepared.get("subject") or not prepared.get("body"):
+        return None
+    return {"subject": str(prepared["subject"]), "body": str(prepared["body"])}
+
+
+# =============================================================================
+# PROMPT CACHE (SQLite)
+# =============================================================================
+
+class PromptCache:
+    """Disk cache of generated emails keyed by a SHA-256 of model + prompt + temperature."""
+
+    def __init__(self, path: str = None, ttl_days: int = None):
+        self.path = path or config.PROMPT_CACHE_PATH
+        self.ttl_seconds = (ttl_days if ttl_days is not None else config.PROMPT_CACHE_TTL_DAYS) * 86400
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS prompt_cache "
+            "(key TEXT PRIMARY KEY, subject TEXT, body TEXT, ts REAL)"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(prompt: str, model: str, temperature: float) -> str:
+        payload = json.dumps({"model": model, "prompt": prompt, "temperature": temperature}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        """Return the cached email for key, or None if missing or expired."""
+        row = self.conn.execute(
+            "SELECT subject, body, ts FROM prompt_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if not row:
+            return None
+        subject, body, ts = row
+        if time.time() - ts > self.ttl_seconds:
+            self.conn.execute("DELETE FROM prompt_cache WHERE key = ?", (key,))
+            self.conn.commit()
+            return None
+        return {"subject": subject, "body": body}
+
+    def set(self, key: str, email: Dict[str, str]):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO prompt_cache (key, subject, body, ts) VALUES (?, ?, ?, ?)",
+            (key, email["subject"], email["body"], time.time())
+        )
+        self.conn.commit()
 
 
 # =============================================================================
@@ -231,145 +629,206 @@ class GoogleSheetsClient:
 class EmailGenerator:
     """Generate personalized outreach emails using OpenAI."""
 
-    def __init__(self):
+    def __init__(self, cache: Optional[PromptCache] = None):
         self.client = OpenAI(api_key=config.OPENAI_API_KEY)
+        try:
+            self.cache = cache or PromptCache()
+        except sqlite3.Error as e:
+            click.secho(f"[WARN] Prompt cache unavailable, generating without it: {e}", fg="yellow")
+            self.cache = None
+
+    def generate(self, job_data: Dict, email_type: str) -> Dict[str, str]:
+        """Generate one email of the given type ('initial', 'followup_1' or 'followup_2')."""
+        if email_type == 'initial':
+            return self.generate_initial_email(job_data)
+        original_subject = original_subject_for(job_data)
+        if email_type == 'followup_1':
+            return self.generate_followup_1(job_data, original_subject)
+        return self.generate_followup_2(job_data, original_subject)
 
     def generate_initial_email(self, job_data: Dict) -> Dict[str, str]:
         """Generate first contact email with resume link."""
-        recipient_name = job_data.get("Name", "Hiring Manager")
-        company_name = job_data.get("CompanyName", "your company")
-        job_title = job_data.get("JobTitle", "the open position")
-        matched_skills = job_data.get("MatchedSkills", "")
-        job_description = job_data.get("JobDescription", "")[:2000]
-        resume_url = job_data.get("ResumePdfUrl", "")
-
-        prompt = f"""Write a cold outreach email for a CS student seeking an internship.
-
-CANDIDATE PROFILE:
-{CANDIDATE_PROFILE}
-
-JOB DETAILS:
-- Recipient: {recipient_name}
-- Company: {company_name}
-- Position: {job_title}
-- Matched Skills: {matched_skills}
-- Resume Link: {resume_url}
-- Job Description (excerpt): {job_description[:1000]}
-
-INSTRUCTIONS:
-1. Write a SHORT, direct, professional email (under 150 words)
-2. Use recipient's first name if available, otherwise "Hi there"
-3. Mention the specific job title and company
-4. Highlight 2-3 relevant skills from matched skills
-5. Include the resume link naturally in the email
-6. End with clear call to action (brief call or conversation)
-7. Be confident but not arrogant
-8. NO emojis, NO exclamation marks
-
-OUTPUT FORMAT (JSON):
-{{"subject": "...", "body": "..."}}
-"""
-
-        return self._generate(prompt, job_title, company_name, recipient_name)
+        recipient_name, company_name, job_title = self._names(job_data)
+        prompt = self._user_prompt('initial', job_data)
+        return self._generate(SYSTEM_PROMPT, prompt, job_title, company_name, recipient_name,
+                              max_tokens=EMAIL_MAX_TOKENS['initial'])
 
     def generate_followup_1(self, job_data: Dict, original_subject: str) -> Dict[str, str]:
         """Generate first follow-up email (gentle bump)."""
-        recipient_name = job_data.get("Name", "Hiring Manager")
-        company_name = job_data.get("CompanyName", "your company")
-        job_title = job_data.get("JobTitle", "the open position")
-        matched_skills = job_data.get("MatchedSkills", "")
-        job_description = job_data.get("JobDescription", "")[:1500]
-
-        prompt = f"""Write a follow-up email for a previous outreach about an internship.
-
-CONTEXT:
-- This is follow-up #1 (sent 3 days after initial email)
-- They haven't responded yet
-- Original subject was: "{original_subject}"
-
-CANDIDATE: Carlos Luna-Peña, CS student at Texas A&M (3.62 GPA)
-
-JOB DETAILS:
-- Recipient: {recipient_name}
-- Company: {company_name}
-- Position: {job_title}
-- Matched Skills: {matched_skills}
-- Job Description (excerpt): {job_description[:800]}
-
-INSTRUCTIONS:
-1. Keep it SHORT (under 100 words)
-2. Reference the original email naturally
-3. Add new value - mention something specific from job description
-4. Connect your experience to their needs
-5. Use subject "Re: {original_subject}" to thread the conversation
-6. Be helpful, not pushy
-7. NO emojis, NO exclamation marks
-
-OUTPUT FORMAT (JSON):
-{{"subject": "Re: {original_subject}", "body": "..."}}
-"""
-
-        return self._generate(prompt, job_title, company_name, recipient_name, f"Re: {original_subject}")
+        recipient_name, company_name, job_title = self._names(job_data)
+        prompt = self._user_prompt('followup_1', job_data, original_subject)
+        return self._generate(SYSTEM_PROMPT, prompt, job_title, company_name, recipient_name, f"Re: {original_subject}",
+                              max_tokens=EMAIL_MAX_TOKENS['followup_1'])
 
     def generate_followup_2(self, job_data: Dict, original_subject: str) -> Dict[str, str]:
         """Generate final follow-up email (last attempt, keep door open)."""
-        recipient_name = job_data.get("Name", "Hiring Manager")
-        company_name = job_data.get("CompanyName", "your company")
-        job_title = job_data.get("JobTitle", "the open position")
+        recipient_name, company_name, job_title = self._names(job_data)
+        prompt = self._user_prompt('followup_2', job_data, original_subject)
+        return self._generate(SYSTEM_PROMPT, prompt, job_title, company_name, recipient_name, f"Re: {original_subject}",
+                              max_tokens=EMAIL_MAX_TOKENS['followup_2'])
 
-        prompt = f"""Write a final follow-up email for an internship inquiry.
-
-CONTEXT:
-- This is follow-up #2 (final attempt, 6 days after initial email)
-- They haven't responded to 2 previous emails
-- Original subject was: "{original_subject}"
+    def generate_all(self, jobs: List[Dict]) -> List[Dict[str, str]]:
+        """
+        Generate every job's email, taking the type from job['_email_type'].
+        Jobs are grouped by type, packed up to EMAIL_BATCH_SIZE per OpenAI
+        request, and up to GENERATION_CONCURRENCY requests (across all types)
+        run at once. Results are returned in the order of `jobs`; any job a
+        batch response does not cover is generated individually.
+        """
+        return self._generate_many([(job_data, job_data.get('_email_type', 'initial')) for job_data in jobs])
+
+    def generate_batch(self, jobs: List[Dict], email_type: str) -> List[Dict[str, str]]:
+        """Generate emails of one type for many jobs (see generate_all)."""
+        return self._generate_many([(job_data, email_type) for job_data in jobs])
+
+    def _generate_many(self, items: List[Tuple[Dict, str]]) -> List[Dict[str, str]]:
+        results = asyncio.run(self._generate_many_async(items))
+
+        # Per-email fallback stays on this thread (the SQLite cache is thread-bound)
+        for i, email in enumerate(results):
+            if email is None:
+                results[i] = self.generate(*items[i])
+        return results
+
+    async def _generate_many_async(self, items: List[Tuple[Dict, str]]) -> List[Optional[Dict[str, str]]]:
+        results: List[Optional[Dict[str, str]]] = [None] * len(items)
+
+        # Serve what we can from the cache; queue the rest by type
+        queued: Dict[str, List[Tuple[int, str, str]]] = {}  # type -> [(index, user_prompt, cache_key)]
+        for i, (job_data, email_type) in enumerate(items):
+            original_subject = original_subject_for(job_data) if email_type != 'initial' else ""
+            prompt = self._user_prompt(email_type, job_data, original_subject)
+            cache_key = PromptCache.make_key(SYSTEM_PROMPT + prompt, config.EMAIL_MODEL, config.EMAIL_TEMPERATURE)
+            cached = self.cache.get(cache_key) if self.cache else None
+            if cached:
+                results[i] = cached
+            else:
+                queued.setdefault(email_type, []).append((i, prompt, cache_key))
 
-CANDIDATE: Carlos Luna-Peña, CS student at Texas A&M
+        if not queued:
+            return results
 
-JOB DETAILS:
-- Recipient: {recipient_name}
-- Company: {company_name}
-- Position: {job_title}
+        sem = asyncio.Semaphore(config.GENERATION_CONCURRENCY)
 
-INSTRUCTIONS:
-1. Very SHORT (under 75 words)
-2. Acknowledge this is last follow-up
-3. Keep door open for future opportunities
-4. Offer LinkedIn connection: linkedin.com/in/carlos-luna
-5. Be gracious, not desperate
-6. Use subject "Re: {original_subject}"
-7. NO emojis, NO exclamation marks
+        async def generate_chunk(client: AsyncOpenAI, email_type: str, chunk: List[Tuple[int, str, str]]):
+            batch_prompt = (
+                f"Write one email for EACH of the {len(chunk)} jobs below.\n"
+                'Return JSON: {"emails": [{"id": <job id>, "subject": "...", "body": "..."}]} '
+                "with exactly one entry per job id.\n\n"
+                + "\n".join(f"=== JOB {n} ===\n{prompt}" for n, (_, prompt, _) in enumerate(chunk))
+            )
+            try:
+                async with sem:
+                    response = await client.chat.completions.create(
+                        model=config.EMAIL_MODEL,
+                        messages=[
+                            {"role": "system", "content": SYSTEM_PROMPT},
+                            {"role": "user", "content": batch_prompt}
+                        ],
+                        temperature=config.EMAIL_TEMPERATURE,
+                        max_tokens=EMAIL_MAX_TOKENS[email_type] * len(chunk) + 50,
+                        response_format={"type": "json_object"}
+                    )
+                emails = json_loads(response.choices[0].message.content).get("emails", [])
+                by_id = {str(e.get("id")): e for e in emails if isinstance(e, dict)}
+            except Exception as e:
+                click.secho(f"   [WARN] Batch generation failed, falling back to per-email: {e}", fg="yellow")
+                by_id = {}
+
+            for n, (i, _, cache_key) in enumerate(chunk):
+                entry = by_id.get(str(n))
+                if entry and entry.get("subject") and entry.get("body"):
+                    email = {"subject": str(entry["subject"]), "body": str(entry["body"])}
+                    if self.cache:
+                        self.cache.set(cache_key, email)
+                    results[i] = email
+
+        # The async client's connection pool belongs to this event loop, so it lives only for this call
+        async with AsyncOpenAI(api_key=config.OPENAI_API_KEY) as client:
+            await asyncio.gather(*(
+                generate_chunk(client, email_type, type_queue[start:start + config.EMAIL_BATCH_SIZE])
+                for email_type, type_queue in queued.items()
+                for start in range(0, len(type_queue), config.EMAIL_BATCH_SIZE)
+            ))
+
+        return results
+
+    def chat_request(self, job_data: Dict, email_type: str) -> Dict:
+        """Chat completion request body for one email (used for OpenAI Batch API input)."""
+        original_subject = original_subject_for(job_data) if email_type != 'initial' else ""
+        return {
+            "model": config.EMAIL_MODEL,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": self._user_prompt(email_type, job_data, original_subject)}
+            ],
+            "temperature": config.EMAIL_TEMPERATURE,
+            "max_tokens": EMAIL_MAX_TOKENS[email_type],
+            "response_format": {"type": "json_object"}
+        }
+
+    @staticmethod
+    def _names(job_data: Dict) -> Tuple[str, str, str]:
+        """Return (recipient_name, company_name, job_title) with prompt defaults."""
+        return (
+            job_data.get("Name", "Hiring Manager"),
+            job_data.get("CompanyName", "your company"),
+            job_data.get("JobTitle", "the open position"),
+        )
 
-OUTPUT FORMAT (JSON):
-{{"subject": "Re: {original_subject}", "body": "..."}}
-"""
+    def _user_prompt(self, email_type: str, job_data: Dict, original_subject: str = "") -> str:
+        """Build the per-job user message for an email type."""
+        recipient_name, company_name, job_title = self._names(job_data)
+        fields = {
+            "recipient_name": recipient_name,
+            "company_name": company_name,
+            "job_title": job_title,
+            "original_subject": original_subject,
+            "matched_skills": job_data.get("MatchedSkills", ""),
+        }
 
-        return self._generate(prompt, job_title, company_name, recipient_name, f"Re: {original_subject}")
+        if email_type == 'initial':
+            fields["resume_url"] = job_data.get("ResumePdfUrl", "")
+            fields["job_description"] = job_data.get("JobDescription", "")[:1000]
+            return INITIAL_PROMPT_TEMPLATE.format_map(fields)
+
+        if email_type == 'followup_1':
+            fields["job_description"] = job_data.get("JobDescription", "")[:800]
+            return FOLLOWUP_1_PROMPT_TEMPLATE.format_map(fields)
+
+        return FOLLOWUP_2_PROMPT_TEMPLATE.format_map(fields)
+
+    def _generate(self, system_prompt: str, user_prompt: str, job_title: str, company_name: str,
+                  recipient_name: str, fallback_subject: str = None, max_tokens: int = 300) -> Dict[str, str]:
+        """Generate email using OpenAI (served from the prompt cache when possible)."""
+        cache_key = PromptCache.make_key(system_prompt + user_prompt, config.EMAIL_MODEL, config.EMAIL_TEMPERATURE)
+        if self.cache:
+            cached = self.cache.get(cache_key)
+            if cached:
+                print("   Using cached email")
+                return cached
 
-    def _generate(self, prompt: str, job_title: str, company_name: str,
-                  recipient_name: str, fallback_subject: str = None) -> Dict[str, str]:
-        """Generate email using OpenAI."""
         try:
             response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7,
-                max_tokens=500
+                model=config.EMAIL_MODEL,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=config.EMAIL_TEMPERATURE,
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"}
             )
 
-            content = response.choices[0].message.content.strip()
-
-            # Parse JSON from response
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-
-            result = json.loads(content)
-            return {
+            # JSON mode guarantees a bare object (no ```json fences to strip)
+            result = json_loads(response.choices[0].message.content)
+            email = {
                 "subject": result.get("subject", fallback_subject or f"Interest in {job_title} at {company_name}"),
                 "body": result.get("body", "")
             }
+            if self.cache and email["body"]:
+                self.cache.set(cache_key, email)
+            return email
 
         except Exception as e:
             click.secho(f"   [WARN] Error generating email: {e}", fg="yellow")
@@ -393,13 +852,37 @@ carlunpen@gmail.com | github.com/clmoon2
 # GMAIL SENDER (OAuth2) with Reply Detection
 # =============================================================================
 
+# Rate-limit and transient server errors worth retrying with backoff
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
 class GmailSender:
     """Send emails via Gmail API with reply detection."""
 
     def __init__(self):
-        self.service = None
+        self.creds = None
+        self._local = threading.local()
+        # Headers shared by every message; only To/Subject/body vary per send
+        self._from_header = formataddr((config.SENDER_NAME, config.SENDER_EMAIL), charset='utf-8')
+        self._header_template = (
+            'MIME-Version: 1.0\r\n'
+            'Content-Type: text/plain; charset="utf-8"\r\n'
+            'Content-Transfer-Encoding: base64\r\n'
+            f'From: {self._from_header}\r\n'
+            'To: {to}\r\n'
+            'Subject: {subject}\r\n'
+            '\r\n'
+        )
         self._authenticate()
 
+    @property
+    def service(self):
+        """Gmail service for the calling thread (googleapiclient objects are not thread-safe)."""
+        if self.creds is None:
+            return None
+        if getattr(self._local, "service", None) is None:
+            self._local.service = build_service('gmail', 'v1', self.creds)
+        return self._local.service
+
     def _authenticate(self):
         """Authenticate with Gmail using OAuth2 refresh token."""
         if not all([config.GMAIL_CLIENT_ID, config.GMAIL_CLIENT_SECRET, config.GMAIL_REFRESH_TOKEN]):
@@ -422,12 +905,12 @@ class GmailSender:
             # Refresh the token
             creds.refresh(Request())
 
-            self.service = build('gmail', 'v1', credentials=creds)
+            self.creds = creds
             click.secho("[OK] Gmail authenticated successfully", fg="green")
 
         except Exception as e:
             click.secho(f"[ERROR] Gmail authentication failed: {e}", fg="red")
-            self.service = None
+            self.creds = None
 
     def check_for_reply(self, recipient_email: str, since_date: str) -> bool:
         """
@@ -447,8 +930,8 @@ class GmailSender:
             # Search for messages from this email after the date we sent
             query = f"from:{recipient_email} after:{since_date.replace('-', '/')}"
             results = self.service.users().messages().list(
-                userId='me', q=query, maxResults=1
-            ).execute()
+                userId='me', q=query, maxResults=1, fields='messages/id'
+            ).execute(num_retries=config.API_NUM_RETRIES)
 
             messages = results.get('messages', [])
             return len(messages) > 0
@@ -457,40 +940,477 @@ class GmailSender:
             click.secho(f"   [WARN] Error checking for reply from {recipient_email}: {e}", fg="yellow")
             return False
 
-    def send_email(self, to: str, subject: str, body: str) -> bool:
-        """Send an email via Gmail API."""
+    def _load_history_id(self) -> Optional[str]:
+        try:
+            with open(config.GMAIL_STATE_PATH) as f:
+                return json.load(f).get("last_history_id")
+        except (OSError, ValueError):
+            return None
+
+    def save_history_id(self, history_id: Optional[str]):
+        """Persist the history cursor (call only after replies have been recorded)."""
+        if not history_id:
+            return
+        with open(config.GMAIL_STATE_PATH, "w") as f:
+            json.dump({"last_history_id": str(history_id)}, f)
+
+    def fetch_reply_senders(self) -> Tuple[Optional[Set[str]], Optional[str]]:
+        """
+        Collect sender addresses of every message added since the last run.
+
+        Uses one paginated history.list call plus batched metadata lookups
+        instead of a Gmail search per recipient.
+
+        Returns:
+            (senders, new_history_id). senders is None when there is no usable
+            cursor (first run or expired history) or some messages could not be
+            read, and callers should fall back to fetch_recent_inbound.
+            new_history_id is only safe to save once replies are recorded.
+        """
         if not self.service:
-            click.secho("[ERROR] Gmail service not available", fg="red")
-            return False
+            return None, None
+
+        users = self.service.users()
+        start_id = self._load_history_id()
 
         try:
-            message = MIMEMultipart()
-            message['to'] = to
-            message['from'] = f"{config.SENDER_NAME} <{config.SENDER_EMAIL}>"
-            message['subject'] = subject
+            if not start_id:
+                # Start the cursor now; this run falls back to per-recipient search
+                profile = users.getProfile(userId='me').execute(num_retries=config.API_NUM_RETRIES)
+                return None, profile.get('historyId')
+
+            message_ids = []
+            new_history_id = start_id
+            page_token = None
+            while True:
+                resp = users.history().list(
+                    userId='me', startHistoryId=start_id,
+                    historyTypes=['messageAdded'], pageToken=page_token,
+                    fields='historyId,nextPageToken,history/messagesAdded/message/id'
+                ).execute(num_retries=config.API_NUM_RETRIES)
+                new_history_id = resp.get('historyId', new_history_id)
+                for record in resp.get('history', []):
+                    for added in record.get('messagesAdded', []):
+                        message_ids.append(added['message']['id'])
+                page_token = resp.get('nextPageToken')
+                if not page_token:
+                    break
+        except HttpError as e:
+            # 404 means the stored historyId is too old; restart the cursor
+            click.secho(f"   [WARN] Gmail history unavailable ({e.resp.status}), using per-recipient search", fg="yellow")
+            try:
+                profile = users.getProfile(userId='me').execute(num_retries=config.API_NUM_RETRIES)
+                return None, profile.get('historyId')
+            except HttpError:
+                return None, None
+
+        senders, complete = self._message_senders(message_ids)
+        if not complete:
+            # A reply among the unread messages would be lost once the cursor moves
+            click.secho("   [WARN] Some new messages could not be read, using per-recipient search", fg="yellow")
+            return None, new_history_id
+        return {sender for sender, _ in senders}, new_history_id
+
+    def _message_senders(self, message_ids: List[str]) -> Tuple[List[Tuple[str, int]], bool]:
+        """
+        (lowercase From address, internalDate ms) per message, fetched in batches of
+        100, plus whether every message was read. Gets that fail inside a batch
+        (typically 429s) are retried once in a smaller batch after a short pause.
+        """
+        senders: List[Tuple[str, int]] = []
+        failed: List[str] = []
+
+        def on_message(request_id, response, exception):
+            if exception is not None:
+                failed.append(request_id)
+                return
+            for header in response.get('payload', {}).get('headers', []):
+                if header.get('name', '').lower() == 'from':
+                    address = parseaddr(header.get('value', ''))[1].lower()
+                    senders.append((address, int(response.get('internalDate', 0))))
+
+        def fetch(ids: List[str], batch_size: int):
+            users = self.service.users()
+            for start in range(0, len(ids), batch_size):
+                chunk = ids[start:start + batch_size]
+                batch = self.service.new_batch_http_request(callback=on_message)
+                for message_id in chunk:
+                    batch.add(users.messages().get(
+                        userId='me', id=message_id,
+                        format='metadata', metadataHeaders=['From'],
+                        fields='internalDate,payload/headers'
+                    ), request_id=message_id)
+                try:
+                    batch.execute()
+                except HttpError:
+                    failed.extend(chunk)
+
+        fetch(list(dict.fromkeys(message_ids)), 100)
+        if failed:
+            retry, failed[:] = list(dict.fromkeys(failed)), []
+            time.sleep(config.GMAIL_RETRY_PAUSE_SECONDS)
+            fetch(retry, 10)
+        if failed:
+            click.secho(f"   [WARN] Could not read {len(set(failed))} Gmail messages", fg="yellow")
+        return senders, not failed
+
+    def fetch_recent_inbound(self, since: date) -> Tuple[Dict[str, int], bool]:
+        """
+        Index every message received on or after `since` by sender with one
+        paginated search plus batched metadata lookups, instead of a Gmail
+        search per recipient.
 
-            # Add body
-            message.attach(MIMEText(body, 'plain'))
+        Returns ({lowercase From address: newest internalDate in ms}, complete),
+        where complete is False if the search or any message lookup failed.
+        """
+        if not self.service:
+            return {}, False
 
-            # Encode and send
-            raw = base64.urlsafe_b64encode(message.as_bytes()).decode('utf-8')
+        query = f"after:{since.strftime('%Y/%m/%d')} -from:me -in:chats"
+        message_ids = []
+        page_token = None
+        complete = True
+        try:
+            while True:
+                results = self.service.users().messages().list(
+                    userId='me', q=query, maxResults=500, pageToken=page_token,
+                    fields='messages/id,nextPageToken'
+                ).execute(num_retries=config.API_NUM_RETRIES)
+                message_ids.extend(m['id'] for m in results.get('messages', []))
+                page_token = results.get('nextPageToken')
+                if not page_token:
+                    break
+        except HttpError as e:
+            click.secho(f"   [WARN] Error listing recent messages: {e}", fg="yellow")
+            complete = False
+
+        latest: Dict[str, int] = {}
+        senders, read_all = self._message_senders(message_ids)
+        for sender, internal_ms in senders:
+            if internal_ms > latest.get(sender, -1):
+                latest[sender] = internal_ms
+        return latest, complete and read_all
+
+    def _build_raw(self, to: str, subject: str, body: str) -> str:
+        """Build the base64url-encoded MIME message Gmail expects."""
+        # Header values must stay on one line; non-ASCII subjects need RFC 2047
+        to = " ".join(to.split())
+        subject = " ".join(subject.split())
+        if not subject.isascii():
+            subject = Header(subject, 'utf-8').encode()
+
+        headers = self._header_template.format(to=to, subject=subject).encode('ascii', 'replace')
+        return base64.urlsafe_b64encode(headers + base64.encodebytes(body.encode('utf-8'))).decode('ascii')
+
+    def send_many(self, messages: List[Tuple[str, str, str]]) -> List[bool]:
+        """
+        Send several emails in one multipart Gmail batch request.
 
-            self.service.users().messages().send(
-                userId='me',
-                body={'raw': raw}
-            ).execute()
+        Args:
+            messages: (to, subject, body) tuples, at most 100
 
-            return True
+        Returns:
+            Success flag per message, in input order
+        """
+        if not self.service:
+            click.secho("[ERROR] Gmail service not available", fg="red")
+            return [False] * len(messages)
+        if len(messages) == 1:
+            return [self.send_email(*messages[0])]
+
+        results = [False] * len(messages)
+        errors = {}
+
+        def on_sent(request_id, response, exception):
+            if exception is not None:
+                errors[int(request_id)] = exception
+                return
+            results[int(request_id)] = True
+
+        batch = self.service.new_batch_http_request(callback=on_sent)
+        for i, (to, subject, body) in enumerate(messages):
+            batch.add(
+                self.service.users().messages().send(userId='me', body={'raw': self._build_raw(to, subject, body)}),
+                request_id=str(i)
+            )
 
+        try:
+            batch.execute()
         except HttpError as e:
-            click.secho(f"[ERROR] Error sending email to {to}: {e}", fg="red")
+            click.secho(f"[ERROR] Gmail batch send failed: {e}", fg="red")
+            errors = {i: e for i in range(len(messages))}
+
+        # Throttled or transient failures get the individual retry path
+        for index, error in sorted(errors.items()):
+            if isinstance(error, HttpError) and error.resp.status in RETRYABLE_STATUSES:
+                results[index] = self.send_email(*messages[index], attempted=True)
+            else:
+                click.secho(f"[ERROR] Error sending email to {messages[index][0]}: {error}", fg="red")
+
+        return results
+
+    def _already_sent(self, to: str, subject: str) -> bool:
+        """Check Sent for a message that went out despite an error response."""
+        query = f'in:sent to:{to} subject:"{subject.replace(chr(34), "")}" newer_than:1d'
+        results = self.service.users().messages().list(
+            userId='me', q=query, maxResults=1, fields='messages/id'
+        ).execute(num_retries=config.API_NUM_RETRIES)
+        return bool(results.get('messages'))
+
+    def send_email(self, to: str, subject: str, body: str, attempted: bool = False) -> bool:
+        """
+        Send an email via Gmail API, backing off on 429/5xx.
+
+        Sends are not idempotent, so before every retry (or the first call when
+        `attempted` is set) Sent is checked to make sure nothing goes out twice.
+        """
+        if not self.service:
+            click.secho("[ERROR] Gmail service not available", fg="red")
             return False
 
+        raw = self._build_raw(to, subject, body)
+
+        for attempt in range(config.API_NUM_RETRIES + 1):
+            try:
+                if attempted and self._already_sent(to, subject):
+                    return True
+
+                self.service.users().messages().send(
+                    userId='me',
+                    body={'raw': raw}
+                ).execute()
+
+                return True
+
+            except HttpError as e:
+                if e.resp.status not in RETRYABLE_STATUSES or attempt == config.API_NUM_RETRIES:
+                    click.secho(f"[ERROR] Error sending email to {to}: {e}", fg="red")
+                    return False
+                attempted = True
+                time.sleep(min(60, 2 ** attempt) + random.random())
+
+        return False
+
 
 # =============================================================================
 # MAIN OUTREACH FLOW
 # =============================================================================
 
+async def send_outreach_emails(to_process: List[Dict], sheets: GoogleSheetsClient,
+                               gmail: GmailSender) -> Tuple[int, int]:
+    """
+    Send prepared emails concurrently. At most SEND_CONCURRENCY chunks of
+    SEND_BATCH_SIZE emails are in flight; each worker waits its own random
+    MIN..MAX delay and sends its chunk as one Gmail batch; results are written
+    with one Sheets batchUpdate per SHEETS_FLUSH_ROWS rows. Blocking Google API
+    calls run in worker threads.
+    Replies are checked once up front (phase 1), not per send.
+
+    Returns (sent_count, failed_count).
+    """
+    sem = asyncio.Semaphore(config.SEND_CONCURRENCY)
+    writes = SheetsBatch(sheets, config.GOOGLE_SHEETS_ID)
+    total = len(to_process)
+    batch_size = max(1, min(config.SEND_BATCH_SIZE, 100))
+    counts = {"sent": 0, "failed": 0}
+
+    type_labels = {
+        'initial': 'Initial',
+        'followup_1': 'Follow-up #1',
+        'followup_2': 'Follow-up #2'
+    }
+
+    async def send_chunk(first: int, chunk: List[Dict]):
+        async with sem:
+            await asyncio.sleep(random.uniform(config.MIN_DELAY_SECONDS, config.MAX_DELAY_SECONDS))
+
+            outgoing = []  # (prefix, job_data)
+
+            for i, job_data in enumerate(chunk, first):
+                email_type = job_data.get('_email_type', 'initial')
+                recipient_email = job_data.get("Email", "")
+                prefix = f"[{i}/{total}]"
+
+                print(f"\n{prefix} {type_labels.get(email_type, 'Unknown')}: "
+                      f"{job_data.get('CompanyName', 'Unknown')} - {job_data.get('JobTitle', 'Unknown')}")
+                print(f"{prefix}    To: {recipient_email}")
+                print(f"{prefix}    Subject: {job_data['_prepared_email']['subject']}")
+                outgoing.append((prefix, job_data))
+
+            # Send email(s)
+            results = []
+            if outgoing:
+                try:
+                    results = await asyncio.to_thread(gmail.send_many, [
+                        (job_data.get("Email", ""), job_data['_prepared_email']["subject"], job_data['_prepared_email']["body"])
+                        for _, job_data in outgoing
+                    ])
+                except Exception as e:
+                    # Keep this chunk's failure from cancelling the other workers
+                    click.secho(f"{outgoing[0][0]}    [ERROR] Send failed: {e}", fg="red")
+                    results = [False] * len(outgoing)
+
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            next_followup = (datetime.now() + timedelta(days=config.FOLLOW_UP_DAYS)).strftime('%Y-%m-%d')
+
+            for (prefix, job_data), success in zip(outgoing, results):
+                email_type = job_data.get('_email_type', 'initial')
+                row_number = job_data.get("_row_number", 0)
+                subject = job_data['_prepared_email']["subject"]
+                body = job_data['_prepared_email']["body"]
+                new_count = int(job_data.get("EmailCount", "0") or "0") + 1
+
+                if success:
+                    click.secho(f"{prefix}    [OK] Sent successfully", fg="green")
+
+                    # Determine new status
+                    if new_count >= config.MAX_EMAILS_PER_CONTACT:
+                        new_status = "completed"
+                    elif email_type == 'initial':
+                        new_status = "sent"
+                    elif email_type == 'followup_1':
+                        new_status = "followed_up_1"
+                    else:
+                        new_status = "followed_up_2"
+
+                    writes.queue(row_number, {
+                        "EmailStatus": new_status,
+                        "EmailSentAt": timestamp,
+                        "EmailCount": str(new_count),
+                        "LastEmailSentAt": timestamp,
+                        "NextFollowUpDate": next_followup if new_count < config.MAX_EMAILS_PER_CONTACT else "",
+                        "DraftedEmail": f"Subject: {subject}\n\n{body}",
+                        "PreparedFollowUp": ""
+                    })
+                    counts["sent"] += 1
+                else:
+                    click.secho(f"{prefix}    [ERROR] Failed to send", fg="red")
+                    writes.queue(row_number, {
+                        "DraftedEmail": f"FAILED - Subject: {subject}\n\n{body}"
+                    })
+                    counts["failed"] += 1
+
+            # Update sheet
+            if writes.full:
+                await asyncio.to_thread(writes.flush)
+
+    try:
+        # A worker that raises must not cancel the others; their sends still get recorded
+        outcomes = await asyncio.gather(*(
+            send_chunk(start + 1, to_process[start:start + batch_size])
+            for start in range(0, total, batch_size)
+        ), return_exceptions=True)
+    finally:
+        # Record whatever was sent even if a worker raised
+        recorded = await asyncio.to_thread(writes.flush)
+
+    for outcome in outcomes:
+        if isinstance(outcome, Exception):
+            click.secho(f"[ERROR] Send worker failed: {outcome}", fg="red")
+    if not recorded:
+        click.secho(f"[ERROR] Results for {len(writes.pending)} rows could not be written to the sheet; "
+                    f"check them before the next run so nothing is sent twice", fg="red")
+    return counts["sent"], counts["failed"]
+
+
+# =============================================================================
+# OVERNIGHT FOLLOW-UP BATCH (submitted by prepare_followups.py)
+# =============================================================================
+
+def load_followup_batch_state() -> Optional[Dict]:
+    """
+    Return the batch in flight: {"batch_id": ..., "as_of": "YYYY-MM-DD",
+    "rows": {custom_id: {"email", "status", "count"}}}, or None.
+    """
+    try:
+        with open(config.FOLLOWUP_BATCH_STATE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_followup_batch_state(state: Optional[Dict]):
+    if state is None:
+        if os.path.exists(config.FOLLOWUP_BATCH_STATE_PATH):
+            os.remove(config.FOLLOWUP_BATCH_STATE_PATH)
+        return
+    with open(config.FOLLOWUP_BATCH_STATE_PATH, "w") as f:
+        f.write(json_dumps(state))
+
+
+def collect_followup_batch(email_gen: "EmailGenerator", sheets: GoogleSheetsClient, state: Dict) -> bool:
+    """
+    Write a finished batch's emails to the PreparedFollowUp column of their rows.
+    A draft is only written while its row is still due for the same follow-up
+    it was generated for (same contact, status and email count); rows that
+    replied or were already followed up live are left alone.
+    Returns False while the batch is still running or its results could not
+    be stored (the state is kept so a later run can collect it).
+    """
+    batch = email_gen.client.batches.retrieve(state["batch_id"])
+    if batch.status in ("validating", "in_progress", "finalizing"):
+        click.secho(f"[INFO] Batch {batch.id} still {batch.status}; will collect on the next run", fg="blue")
+        return False
+
+    if batch.status != "completed" or not batch.output_file_id:
+        click.secho(f"[WARN] Batch {batch.id} ended as {batch.status}; follow-ups will be generated live", fg="yellow")
+        save_followup_batch_state(None)
+        return True
+
+    # Re-classify for the day the batch was prepared for; only rows still due qualify
+    as_of = date.fromisoformat(state["as_of"]) if state.get("as_of") else datetime.now().date()
+    classified = sheets.classify_rows(config.GOOGLE_SHEETS_ID, as_of=as_of)
+    still_due = {
+        (row["_row_number"], email_type): row
+        for email_type in ("followup_1", "followup_2")
+        for row in classified[email_type]
+    }
+    updates = {}
+
+    for line in email_gen.client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        record = json_loads(line)
+        custom_id = record.get("custom_id", "")
+        response = record.get("response") or {}
+        if response.get("status_code") != 200:
+            continue
+
+        row_number, email_type = custom_id.split(":", 1)
+        row = still_due.get((int(row_number), email_type))
+        expected = state["rows"].get(custom_id)
+        if isinstance(expected, str):  # State written before status snapshots were kept
+            expected = {"email": expected}
+        if not row or not expected or row.get("Email", "").strip().lower() != expected.get("email"):
+            continue
+        if "status" in expected and (
+            row.get("EmailStatus", "").strip().lower() != expected["status"]
+            or str(row.get("EmailCount", "")).strip() != expected["count"]
+        ):
+            continue
+
+        try:
+            content = response["body"]["choices"][0]["message"]["content"]
+            result = json_loads(content)
+        except (KeyError, IndexError, ValueError):
+            continue
+        if not result.get("subject") or not result.get("body"):
+            continue
+
+        updates[int(row_number)] = {"PreparedFollowUp": json_dumps({
+            "type": email_type,
+            "subject": result["subject"],
+            "body": result["body"]
+        })}
+
+    if updates and not sheets.update_rows(config.GOOGLE_SHEETS_ID, updates):
+        click.secho(f"[WARN] Could not store prepared follow-ups from batch {batch.id}; will retry", fg="yellow")
+        return False
+    click.secho(f"[OK] Stored {len(updates)} prepared follow-ups from batch {batch.id}", fg="green")
+    save_followup_batch_state(None)
+    return True
+
+
 def run_outreach_flow():
     """Main email outreach flow with follow-up support."""
     print("=" * 70)
@@ -506,39 +1426,80 @@ def run_outreach_flow():
         click.secho("\n[ERROR] Gmail not configured. Please run setup_gmail_oauth.py first.", fg="red")
         return
 
+    # Pick up follow-ups the overnight Batch API job prepared for today, so they
+    # are used this morning instead of being generated live
+    batch_state = load_followup_batch_state()
+    if batch_state:
+        try:
+            collect_followup_batch(email_gen, sheets, batch_state)
+        except Exception as e:
+            click.secho(f"[WARN] Could not collect prepared follow-ups: {e}", fg="yellow")
+
     # =========================================================================
     # PHASE 1: Check for replies and update statuses
     # =========================================================================
     print("\n[1/3] Checking for replies...")
 
-    all_rows = sheets.get_all_rows(config.GOOGLE_SHEETS_ID)
+    # One sheet read and one pass yield the reply candidates and every send queue
+    classified = sheets.classify_rows(config.GOOGLE_SHEETS_ID)
     replied_count = 0
 
-    for row in all_rows:
-        email_status = row.get("EmailStatus", "").strip().lower()
-        recipient_email = row.get("Email", "").strip()
-        last_sent = row.get("LastEmailSentAt", "").strip()
-        row_number = row.get("_row_number", 0)
-
-        # Only check active conversations (sent, followed_up_1, followed_up_2)
-        if email_status in ["sent", "followed_up_1", "followed_up_2"] and recipient_email and last_sent:
-            since_date = last_sent[:10]  # YYYY-MM-DD
-            if gmail.check_for_reply(recipient_email, since_date):
-                click.secho(f"   [OK] Reply detected from {recipient_email}", fg="green")
-                sheets.update_row(config.GOOGLE_SHEETS_ID, row_number, {
-                    "EmailStatus": "replied"
-                })
-                replied_count += 1
+    # One history scan for everyone; None means no usable cursor (or unreadable messages)
+    reply_senders, history_id = gmail.fetch_reply_senders()
+    replies_complete = True
+
+    # Only check active conversations (sent, followed_up_1, followed_up_2)
+    active = classified["active"]
+    emails = [row.get("Email", "").strip() for row in active]
+
+    if reply_senders is not None:
+        replies = [email.lower() in reply_senders for email in emails]
+    else:
+        # Index everything received since the oldest open conversation, then
+        # count a reply only if it arrived on or after that row's last send
+        since_ms = []
+        for row in active:
+            try:
+                sent_on = date.fromisoformat(row["_last_sent_date"])
+                since_ms.append(datetime.combine(sent_on, datetime.min.time()).timestamp() * 1000)
+            except ValueError:
+                since_ms.append(None)
+        known = [ms for ms in since_ms if ms is not None]
+        inbound, replies_complete = (
+            gmail.fetch_recent_inbound(date.fromtimestamp(min(known) / 1000)) if known else ({}, True)
+        )
+        replies = [
+            ms is not None and inbound.get(email.lower(), -1) >= ms
+            for email, ms in zip(emails, since_ms)
+        ]
+
+    writes = SheetsBatch(sheets, config.GOOGLE_SHEETS_ID, flush_rows=len(active) or None)
+    replied_rows = set()
+    for row, recipient_email, replied in zip(active, emails, replies):
+        if replied:
+            click.secho(f"   [OK] Reply detected from {recipient_email}", fg="green")
+            writes.queue(row.get("_row_number", 0), {"EmailStatus": "replied"})
+            replied_rows.add(row.get("_row_number", 0))
+            replied_count += 1
+    recorded = writes.flush()
 
     print(f"   Found {replied_count} new replies")
+    # Only move the cursor past messages whose replies are known to be recorded;
+    # otherwise the next run scans the same history again
+    if replies_complete and recorded:
+        gmail.save_history_id(history_id)
+    else:
+        click.secho("   [WARN] Reply check incomplete; keeping the previous Gmail history cursor", fg="yellow")
 
     # =========================================================================
     # PHASE 2: Get follow-ups due and pending new emails
     # =========================================================================
     print("\n[2/3] Gathering emails to send...")
 
-    followup_1, followup_2 = sheets.get_followups_due(config.GOOGLE_SHEETS_ID)
-    pending_new = sheets.get_pending_emails(config.GOOGLE_SHEETS_ID)
+    # Queues come from the phase 1 classification; contacts who just replied drop out
+    followup_1 = [row for row in classified["followup_1"] if row["_row_number"] not in replied_rows]
+    followup_2 = [row for row in classified["followup_2"] if row["_row_number"] not in replied_rows]
+    pending_new = classified["pending"]
 
     print(f"   Follow-up #2 (final): {len(followup_2)}")
     print(f"   Follow-up #1 (bump):  {len(followup_1)}")
@@ -565,7 +1526,9 @@ def run_outreach_flow():
     to_process = all_to_send[:config.DAILY_EMAIL_LIMIT]
     print(f"\n   Total to process: {len(to_process)} (limit: {config.DAILY_EMAIL_LIMIT})")
 
-    estimated_time = len(to_process) * (config.MIN_DELAY_SECONDS + config.MAX_DELAY_SECONDS) / 2 / 60
+    chunks = -(-len(to_process) // max(1, min(config.SEND_BATCH_SIZE, 100)))
+    estimated_time = (chunks * (config.MIN_DELAY_SECONDS + config.MAX_DELAY_SECONDS) / 2 / 60
+                      / config.SEND_CONCURRENCY)
     print(f"   Estimated time: ~{estimated_time:.1f} minutes")
 
     # =========================================================================
@@ -573,104 +1536,24 @@ def run_outreach_flow():
     # =========================================================================
     print("\n[3/3] Sending emails...")
 
-    sent_count = 0
-    failed_count = 0
-
-    for i, job_data in enumerate(to_process, 1):
-        email_type = job_data.get('_email_type', 'initial')
-        recipient_email = job_data.get("Email", "")
-        company = job_data.get("CompanyName", "Unknown")
-        title = job_data.get("JobTitle", "Unknown")
-        row_number = job_data.get("_row_number", 0)
-        current_count = int(job_data.get("EmailCount", "0") or "0")
-
-        type_label = {
-            'initial': 'Initial',
-            'followup_1': 'Follow-up #1',
-            'followup_2': 'Follow-up #2'
-        }.get(email_type, 'Unknown')
-
-        print(f"\n[{i}/{len(to_process)}] {type_label}: {company} - {title}")
-        print(f"   To: {recipient_email}")
-
-        # Check for reply one more time before sending follow-up
-        if email_type in ['followup_1', 'followup_2']:
-            last_sent = job_data.get("LastEmailSentAt", "")[:10]
-            if gmail.check_for_reply(recipient_email, last_sent):
-                print("   [SKIP] Reply detected - skipping follow-up")
-                sheets.update_row(config.GOOGLE_SHEETS_ID, row_number, {
-                    "EmailStatus": "replied"
-                })
-                continue
-
-        # Generate email based on type
-        print("   Generating email...")
-        original_subject = ""
-        drafted = job_data.get("DraftedEmail", "")
-        if drafted and "Subject:" in drafted:
-            original_subject = drafted.split("Subject:")[1].split("\n")[0].strip()
-            # Remove "Re: " prefix if present to get original
-            original_subject = original_subject.replace("Re: ", "").strip()
-
-        if email_type == 'initial':
-            email_content = email_gen.generate_initial_email(job_data)
-        elif email_type == 'followup_1':
-            email_content = email_gen.generate_followup_1(job_data, original_subject or f"Interest in {title}")
-        else:  # followup_2
-            email_content = email_gen.generate_followup_2(job_data, original_subject or f"Interest in {title}")
-
-        subject = email_content["subject"]
-        body = email_content["body"]
-
-        print(f"   Subject: {subject}")
-
-        # Send email
-        print("   Sending...")
-        success = gmail.send_email(
-            to=recipient_email,
-            subject=subject,
-            body=body
-        )
-
-        # Update sheet
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        next_followup = (datetime.now() + timedelta(days=config.FOLLOW_UP_DAYS)).strftime('%Y-%m-%d')
-        new_count = current_count + 1
-
-        if success:
-            click.secho("   [OK] Sent successfully", fg="green")
-
-            # Determine new status
-            if new_count >= config.MAX_EMAILS_PER_CONTACT:
-                new_status = "completed"
-            elif email_type == 'initial':
-                new_status = "sent"
-            elif email_type == 'followup_1':
-                new_status = "followed_up_1"
-            else:
-                new_status = "followed_up_2"
-
-            sheets.update_row(config.GOOGLE_SHEETS_ID, row_number, {
-                "EmailStatus": new_status,
-                "EmailSentAt": timestamp,
-                "EmailCount": str(new_count),
-                "LastEmailSentAt": timestamp,
-                "NextFollowUpDate": next_followup if new_count < config.MAX_EMAILS_PER_CONTACT else "",
-                "DraftedEmail": f"Subject: {subject}\n\n{body}"
-            })
-            sent_count += 1
-        else:
-            click.secho("   [ERROR] Failed to send", fg="red")
-            sheets.update_row(config.GOOGLE_SHEETS_ID, row_number, {
-                "DraftedEmail": f"FAILED - Subject: {subject}\n\n{body}"
-            })
-            failed_count += 1
-
-        # Random delay (skip on last email)
-        if i < len(to_process):
-            delay = random.randint(config.MIN_DELAY_SECONDS, config.MAX_DELAY_SECONDS)
-            print(f"   Waiting {delay}s before next email...")
-            time.sleep(delay)
+    # Follow-ups prepared overnight by prepare_followups.py need no live generation
+    prepared_count = 0
+    for job_data in to_process:
+        if job_data['_email_type'] != 'initial':
+            prepared = prepared_email_for(job_data, job_data['_email_type'])
+            if prepared:
+                job_data['_prepared_email'] = prepared
+                prepared_count += 1
+    if prepared_count:
+        print(f"   Using {prepared_count} follow-ups prepared overnight")
+
+    # Generate the rest up front, one batched OpenAI request per EMAIL_BATCH_SIZE jobs of a type
+    print("   Generating emails...")
+    to_generate = [job_data for job_data in to_process if '_prepared_email' not in job_data]
+    for job_data, email_content in zip(to_generate, email_gen.generate_all(to_generate)):
+        job_data['_prepared_email'] = email_content
+
+    sent_count, failed_count = asyncio.run(send_outreach_emails(to_process, sheets, gmail))
 
     # =========================================================================
     # SUMMARY
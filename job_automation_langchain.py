@@ -27,31 +27,63 @@ Author: Carlos Luna-Peña
 import os
 import json
 import base64
+import functools
+import hashlib
+import io
+import random
 import re
 import time
 import subprocess
 import tempfile
 import shutil
+import string
+import sys
+import sqlite3
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from itertools import zip_longest
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple, Union
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple, Union
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
 # LangChain imports
 from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
+from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser, StrOutputParser
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableLambda
 
 # External API clients
 import requests
+from requests.adapters import HTTPAdapter
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from urllib.parse import urlparse
 import click
 
+try:
+    import orjson  # Optional: faster parsing of Apify datasets and job JSON
+except ImportError:
+    orjson = None
+
+# PDF text extraction for ATS scoring: PyMuPDF (requirements.txt), PyPDF2 as fallback
+try:
+    import pymupdf as fitz  # Current PyMuPDF name; "fitz" is the deprecated alias
+except ImportError:
+    try:
+        import fitz
+    except ImportError:
+        fitz = None
+try:
+    import PyPDF2
+except ImportError:
+    PyPDF2 = None
+
 
 # =============================================================================
 # CONFIGURATION
@@ -59,9 +91,9 @@ import click
 
 load_dotenv()
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Configuration for all API keys and IDs (env-only)."""
+    """Configuration for all API keys and IDs (env-only; read once at import, immutable)."""
     # OpenAI
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     
@@ -97,18 +129,90 @@ class Config:
     REQUEST_TIMEOUT_SECONDS: int = int(os.getenv("REQUEST_TIMEOUT_SECONDS", "45"))
     REQUEST_RETRIES: int = int(os.getenv("REQUEST_RETRIES", "3"))
     REQUEST_RETRY_BACKOFF: int = int(os.getenv("REQUEST_RETRY_BACKOFF", "2"))
+    REQUEST_RETRY_MAX_BACKOFF: int = int(os.getenv("REQUEST_RETRY_MAX_BACKOFF", "60"))
+    JOB_CONCURRENCY: int = int(os.getenv("JOB_CONCURRENCY", "4"))  # Jobs processed at once
+    FILTER_CONCURRENCY: int = int(os.getenv("FILTER_CONCURRENCY", "16"))  # Fit-filter LLM calls in flight
+    SLIDES_CONCURRENCY: int = int(os.getenv("SLIDES_CONCURRENCY", "4"))  # Per-slide retries in flight (429s above ~4)
+    APIFY_RUN_TIMEOUT_SECONDS: int = int(os.getenv("APIFY_RUN_TIMEOUT_SECONDS", "900"))  # Give up polling after this
+
+    # LLM result cache (reposted jobs skip the fit check and content generation)
+    LLM_CACHE_PATH: str = os.getenv("LLM_CACHE_PATH", ".job_llm_cache.sqlite3")
+    LLM_CACHE_TTL_DAYS: int = int(os.getenv("LLM_CACHE_TTL_DAYS", "30"))
+    # Fit verdicts are cached for the TTL above, so the filter must answer deterministically
+    FILTER_TEMPERATURE: float = float(os.getenv("FILTER_TEMPERATURE", "0"))
+
+    # Stamp of the last successful LaTeX check (skips the test compile on later runs)
+    PDFLATEX_CHECK_CACHE_PATH: str = os.getenv("PDFLATEX_CHECK_CACHE_PATH", ".pdflatex_check.json")
+    # Precompiled resume preambles (.fmt); compiles skip package loading when one matches
+    LATEX_FORMAT_CACHE_DIR: str = os.getenv(
+        "LATEX_FORMAT_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "applyeasy")
+    )
 
 
 config = Config()
 
 
+# Packages used by the resume template; a check compile of this must succeed
+_PDFLATEX_TEST_DOCUMENT = r"""
+\documentclass[letterpaper,11pt]{article}
+\usepackage{latexsym}
+\usepackage[empty]{fullpage}
+\usepackage{titlesec}
+\usepackage{marvosym}
+\usepackage[usenames,dvipsnames]{color}
+\usepackage{enumitem}
+\usepackage[hidelinks]{hyperref}
+\usepackage{fancyhdr}
+\usepackage[english]{babel}
+\usepackage{tabularx}
+\begin{document}
+Test
+\end{document}
+"""
+
+
+def _pdflatex_stamp(binary: str) -> Dict[str, Any]:
+    """Identifies the pdflatex install and test document a successful check applies to."""
+    return {
+        "binary": binary,
+        "mtime": os.stat(binary).st_mtime,
+        "test": hashlib.sha256(_PDFLATEX_TEST_DOCUMENT.encode("utf-8")).hexdigest()
+    }
+
+
+@functools.lru_cache(maxsize=1)
 def check_pdflatex_installed() -> Tuple[bool, str]:
     """
     Check if pdflatex is available and required packages are installed.
+    A success is remembered (in-process and on disk, keyed on the pdflatex binary
+    and its mtime) so later runs skip the version check and test compile.
 
     Returns:
         Tuple of (success: bool, error_message: str)
     """
+    binary = shutil.which('pdflatex')
+    if not binary:
+        return False, "pdflatex not found. Please install texlive."
+    stamp = _pdflatex_stamp(binary)
+    try:
+        with open(config.PDFLATEX_CHECK_CACHE_PATH) as f:
+            if json.load(f) == stamp:
+                return True, ""
+    except (OSError, ValueError):
+        pass
+
+    ok, error = _run_pdflatex_check()
+    if ok:
+        try:
+            with open(config.PDFLATEX_CHECK_CACHE_PATH, "w") as f:
+                json.dump(stamp, f)
+        except OSError:
+            pass
+    return ok, error
+
+
+def _run_pdflatex_check() -> Tuple[bool, str]:
+    """Run pdflatex --version and a test compile of _PDFLATEX_TEST_DOCUMENT."""
     # First check if pdflatex binary exists
     try:
         result = subprocess.run(
@@ -124,22 +228,7 @@ def check_pdflatex_installed() -> Tuple[bool, str]:
         return False, "pdflatex version check timed out"
 
     # Test compilation with packages used by resume template
-    test_latex = r"""
-\documentclass[letterpaper,11pt]{article}
-\usepackage{latexsym}
-\usepackage[empty]{fullpage}
-\usepackage{titlesec}
-\usepackage{marvosym}
-\usepackage[usenames,dvipsnames]{color}
-\usepackage{enumitem}
-\usepackage[hidelinks]{hyperref}
-\usepackage{fancyhdr}
-\usepackage[english]{babel}
-\usepackage{tabularx}
-\begin{document}
-Test
-\end{document}
-"""
+    test_latex = _PDFLATEX_TEST_DOCUMENT
 
     temp_dir = tempfile.mkdtemp(prefix='latex_test_')
     test_tex = Path(temp_dir) / "test.tex"
@@ -222,6 +311,48 @@ or
 {{"verdict":"false"}}
 """
 
+# The filter prompt has a single placeholder, so it is split around it once at
+# import; each job is then one concatenation instead of a template parse.
+# format() with no arguments only unescapes the {{ }} literals.
+_FILTER_SYSTEM_TEXT = JOB_FILTER_SYSTEM_PROMPT.format()
+_FILTER_USER_PREFIX, _, _FILTER_USER_SUFFIX = JOB_FILTER_USER_PROMPT.partition("{job_description}")
+_FILTER_USER_PREFIX = _FILTER_USER_PREFIX.format()
+_FILTER_USER_SUFFIX = _FILTER_USER_SUFFIX.format()
+
+
+def render_filter_messages(inputs: Dict[str, str]) -> List[Any]:
+    """Chat messages for one job-filter call (same text the prompt template produced)."""
+    return [
+        SystemMessage(content=_FILTER_SYSTEM_TEXT),
+        HumanMessage(content=f"{_FILTER_USER_PREFIX}{inputs['job_description']}{_FILTER_USER_SUFFIX}"),
+    ]
+
+
+# Cheap title checks run before the LLM filter. Each only rejects jobs the
+# FIT CRITERIA above would reject anyway: senior titles (level is intern),
+# other role families unless the title also names software work (so
+# "Hardware/Software Co-design Intern" still reaches the LLM), and postings
+# with no internship/entry-level signal anywhere.
+_PREFILTER_SENIORITY = re.compile(r'\b(director|principal|senior)\b', re.IGNORECASE)
+_PREFILTER_REJECT = re.compile(
+    r'\b(sales|finance|accounting|staff|lead|manager|'
+    r'marketing|hardware|firmware|IT support|helpdesk)\b',
+    re.IGNORECASE
+)
+_PREFILTER_SOFTWARE = re.compile(r'\b(software|engineer|engineering|developer|ml|data)\b', re.IGNORECASE)
+_PREFILTER_REQUIRE = re.compile(r'\b(intern|internships?|co-op|coop|new grad|entry|junior)\b', re.IGNORECASE)
+
+
+def passes_prefilter(job: Dict) -> bool:
+    """Rule-based rejection that saves an LLM call; True means "ask the LLM"."""
+    title = job.get('title', '') or ''
+    if _PREFILTER_SENIORITY.search(title):
+        return False
+    if _PREFILTER_REJECT.search(title) and not _PREFILTER_SOFTWARE.search(title):
+        return False
+    return bool(_PREFILTER_REQUIRE.search(title) or _PREFILTER_REQUIRE.search(job.get('descriptionHtml', '') or ''))
+
+
 RESUME_SYSTEM_PROMPT = """You are an expert ATS-optimized resume generator using Jake Gutierrez's sb2nov LaTeX template.
 
 YOUR PRIMARY GOAL: Maximize keyword match rate to pass Applicant Tracking Systems while maintaining natural, compelling content.
@@ -344,16 +475,53 @@ BEGIN GENERATING THE ATS-OPTIMIZED RESUME NOW:"""
 # UTILITY FUNCTIONS
 # =============================================================================
 
+# Compiled once; these helpers run for every scraped job
+_CONTROL_CHARS = str.maketrans('', '', '\r\n\t')
+_DASH_RUN_RE = re.compile(r'-{2,}')
+
+
+class _SlugTable(dict):
+    """str.translate table for slugify: keeps [a-z0-9-], maps whitespace to '-', drops the rest."""
+
+    def __missing__(self, codepoint: int) -> Optional[str]:
+        # Characters outside the seeded set are classified once, then memoized
+        value = '-' if chr(codepoint).isspace() else None
+        self[codepoint] = value
+        return value
+
+
+_SLUG_TABLE = _SlugTable({ord(c): c for c in 'abcdefghijklmnopqrstuvwxyz0123456789-'})
+_SLUG_TABLE.update(dict.fromkeys(map(ord, '\r\n\t')))  # Deleted, as in clean_string
+
+
+class _DigitsOnlyTable(dict):
+    """str.translate table that keeps ASCII digits and drops everything else."""
+
+    def __missing__(self, codepoint: int) -> None:
+        self[codepoint] = None
+        return None
+
+
+_DIGITS_ONLY_TABLE = _DigitsOnlyTable({ord(c): c for c in '0123456789'})
+# Markdown fences (with any language tag) and stray backticks, in one pass
+_CODE_FENCE_RE = re.compile(r'```(?:latex|tex)?\s*|`', re.IGNORECASE)
+_ORPHAN_BRACE_RE = re.compile(r'^\s*\}\s*\{', re.MULTILINE)
+_BARE_TITLEFORMAT_ARGS_RE = re.compile(r'\}\s*\{\}\s*\{\}\s*\{')
+_TITLEFORMAT_RE = re.compile(r'\\titleformat\s*\{')
+_LATEX_REQUIRED_ELEMENTS = ("\\documentclass", "\\begin{document}", "\\end{document}")
+# Compile in tmpfs when available: the .tex/.aux/.log/.pdf round-trips never touch disk
+_LATEX_TMP_ROOT = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+# Commands whose output is only right after a second pdflatex pass
+_LATEX_RERUN_TOKENS = ("\\ref", "\\pageref", "\\cite", "\\tableofcontents", "\\bibliography", "LastPage")
+
+
 def slugify(text: str) -> str:
     """Convert text to URL-safe slug"""
     if not text:
         return "na"
-    text = re.sub(r'[\r\n\t]', '', text)
-    text = text.strip().lower()
-    text = re.sub(r'\s+', '-', text)
-    text = re.sub(r'[^a-z0-9-]', '', text)
-    text = re.sub(r'-+', '-', text)
-    text = re.sub(r'^-+|-+$', '', text)
+    # One C-level pass replaces the control-char, whitespace and invalid-char steps
+    text = text.lower().translate(_SLUG_TABLE)
+    text = _DASH_RUN_RE.sub('-', text).strip('-')
     return text or "na"
 
 
@@ -361,37 +529,53 @@ def clean_string(text: str) -> str:
     """Remove newlines and extra whitespace"""
     if not text:
         return ""
-    return re.sub(r'[\r\n\t]', '', str(text)).strip()
+    return str(text).translate(_CONTROL_CHARS).strip()
 
 
 def clean_latex(raw: str) -> str:
     """Clean LaTeX output from LLM"""
     # Remove markdown code fences
-    raw = re.sub(r'```latex\s*', '', raw, flags=re.IGNORECASE)
-    raw = re.sub(r'```tex\s*', '', raw, flags=re.IGNORECASE)
-    raw = re.sub(r'```\s*', '', raw)
-    raw = raw.replace('`', '')
-    raw = raw.strip()
+    raw = _CODE_FENCE_RE.sub('', raw).strip()
     
-    # Find documentclass
-    doc_class_idx = raw.find('\\documentclass')
-    if doc_class_idx > 0:
-        raw = raw[doc_class_idx:]
+    # Start at documentclass (drops any preamble chatter)
+    start = max(raw.find('\\documentclass'), 0)
     
-    # Ensure proper ending
-    if not raw.endswith('\\end{document}'):
-        end_doc_idx = raw.rfind('\\end{document}')
-        if end_doc_idx > 0:
-            raw = raw[:end_doc_idx + 14]
-        else:
-            raw = raw + '\n\\end{document}'
-    
-    # Remove trailing whitespace
-    return raw.rstrip()
-
-
-def make_credentials(scopes: List[str]) -> service_account.Credentials:
-    """Create service account credentials from env-provided JSON or file path."""
+    # Ensure proper ending; both bounds are applied in a single slice
+    if raw.endswith('\\end{document}'):
+        return raw[start:].rstrip()
+    end_doc_idx = raw.rfind('\\end{document}', start)
+    if end_doc_idx > start:
+        return raw[start:end_doc_idx + 14].rstrip()
+    return raw[start:] + '\n\\end{document}'
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON with orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def job_to_json(job: Dict) -> str:
+    """Pretty-printed job JSON for prompts and ATS scoring."""
+    if orjson is not None:
+        return orjson.dumps(job, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(job, indent=2)
+
+
+def column_letter(col_index: int) -> str:
+    """Convert a 0-based column index to A1 letters (0=A, 25=Z, 26=AA)."""
+    letters = ""
+    col_index += 1
+    while col_index:
+        col_index, rem = divmod(col_index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+@functools.lru_cache(maxsize=1)
+def _service_account_info() -> Dict[str, Any]:
+    """Parsed service account JSON from env-provided JSON or file path (read once)."""
     source = config.GOOGLE_SERVICE_ACCOUNT_JSON
     if not source:
         # Graceful fallback to local file for convenience
@@ -402,66 +586,188 @@ def make_credentials(scopes: List[str]) -> service_account.Credentials:
             raise ValueError("GOOGLE_SERVICE_ACCOUNT_JSON is required for Google API access")
     
     if os.path.isfile(source):
-        with open(source, "r", encoding="utf-8") as f:
+        # Bytes go straight to orjson without a utf-8 decode step
+        with open(source, "rb") as f:
             raw_json = f.read()
     else:
         raw_json = source
     
     try:
-        info = json.loads(raw_json)
-    except json.JSONDecodeError as e:
+        return json_loads(raw_json)
+    except ValueError as e:  # json.JSONDecodeError and orjson.JSONDecodeError
         raise ValueError("Invalid GOOGLE_SERVICE_ACCOUNT_JSON content") from e
-    return service_account.Credentials.from_service_account_info(info, scopes=scopes)
 
 
-def request_with_retries(method: str, url: str, *, retries: int = None, timeout: int = None, backoff: int = None, **kwargs):
-    """HTTP helper with retries and backoff."""
+def make_credentials(scopes: Iterable[str]) -> service_account.Credentials:
+    """Service account credentials for the given scopes (one object per scope set)."""
+    return _credentials_for(tuple(scopes))
+
+
+@functools.lru_cache(maxsize=8)
+def _credentials_for(scopes: Tuple[str, ...]) -> service_account.Credentials:
+    return service_account.Credentials.from_service_account_info(_service_account_info(), scopes=list(scopes))
+
+
+# Scopes for every Google client the pipeline builds; they share one
+# credentials object, so the service-account token is fetched once per run
+GOOGLE_SCOPES = (
+    'https://www.googleapis.com/auth/spreadsheets',
+    'https://www.googleapis.com/auth/documents.readonly',
+    'https://www.googleapis.com/auth/presentations',
+)
+
+
+def shared_credentials() -> service_account.Credentials:
+    """Service account credentials for all pipeline Google clients."""
+    return make_credentials(GOOGLE_SCOPES)
+
+
+def build_google_service(api: str, version: str, creds):
+    """Build a client from the discovery document bundled with google-api-python-client (no HTTPS fetch)."""
+    return build(api, version, credentials=creds, static_discovery=True, cache_discovery=False)
+
+
+# Throttling and transient server errors; any other 4xx fails immediately
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+def make_http_session(headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """
+    Keep-alive session with a pooled adapter so repeated calls reuse TCP+TLS
+    connections. Retries are handled by request_with_retries, not urllib3.
+    """
+    session = requests.Session()
+    session.headers.update({"User-Agent": "langchain-job-search/1.0"})
+    if headers:
+        session.headers.update(headers)
+    for prefix in ("http://", "https://"):
+        session.mount(prefix, HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=0))
+    return session
+
+
+# Default session for calls without a client-specific one
+_HTTP = make_http_session()
+
+
+def _retry_after_seconds(resp: Optional[requests.Response]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date), if present."""
+    value = resp.headers.get("Retry-After") if resp is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def request_with_retries(method: str, url: str, *, retries: int = None, timeout: int = None, backoff: int = None,
+                         session: Optional[requests.Session] = None, **kwargs):
+    """HTTP helper with exponential backoff (full jitter) that honors Retry-After."""
     retries = retries if retries is not None else config.REQUEST_RETRIES
     timeout = timeout if timeout is not None else config.REQUEST_TIMEOUT_SECONDS
     backoff = backoff if backoff is not None else config.REQUEST_RETRY_BACKOFF
+    max_backoff = config.REQUEST_RETRY_MAX_BACKOFF
     
     last_exc = None
     for attempt in range(retries):
+        resp = None
         try:
-            resp = requests.request(method, url, timeout=timeout, **kwargs)
+            resp = (session or _HTTP).request(method, url, timeout=timeout, **kwargs)
             resp.raise_for_status()
             return resp
-        except requests.RequestException as e:
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code not in RETRYABLE_STATUS_CODES:
+                raise
             last_exc = e
-            if attempt == retries - 1:
-                break
-            time.sleep(backoff * (attempt + 1))
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+            last_exc = e
+        if attempt == retries - 1:
+            break
+        delay = _retry_after_seconds(resp)
+        if delay is None:
+            delay = random.uniform(0, min(max_backoff, backoff * 2 ** attempt))
+        time.sleep(delay)
     raise last_exc
 
 
-def build_job_key(job: Dict) -> str:
-    """Build a stable dedup key for a job."""
-    parts = [
+def _job_key_fields(job: Dict) -> Tuple[str, ...]:
+    """The identifying fields of a job as a hashable tuple (falsy fields omitted)."""
+    parts = (
         job.get('id', ''),
         job.get('companyName', ''),
         job.get('title', ''),
         job.get('postedAt', ''),
         job.get('link', '') or job.get('applyUrl', '')
-    ]
-    combined = "-".join([clean_string(str(p)) for p in parts if p])
-    key = slugify(combined)
-    return key or "na"
+    )
+    return tuple(str(p) for p in parts if p)
+
 
+def build_job_key(job: Dict) -> str:
+    """Build a stable dedup key for a job (128-bit BLAKE2b hex digest)."""
+    return _job_key_for(_job_key_fields(job))
 
+
+@functools.lru_cache(maxsize=4096)
+def _job_key_for(fields: Tuple[str, ...]) -> str:
+    joined = "|".join(clean_string(f) for f in fields)
+    return hashlib.blake2b(joined.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def legacy_job_key(job: Dict) -> str:
+    """Slug-style key written to the JobKey column before keys were hashed."""
+    return _legacy_job_key_for(_job_key_fields(job))
+
+
+@functools.lru_cache(maxsize=4096)
+def _legacy_job_key_for(fields: Tuple[str, ...]) -> str:
+    return slugify("-".join(clean_string(f) for f in fields))
+
+
+# Keys produced by build_job_key; anything else in the sheet is a legacy slug or JobID
+_HASHED_JOB_KEY_RE = re.compile(r'[0-9a-f]{32}')
+
+
+def dedup_id(key: str) -> int:
+    """64-bit integer fingerprint of a dedup key (JobKey, JobID or legacy slug) for the seen-set."""
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+_URL_SCHEME_CHARS = frozenset(string.ascii_letters + string.digits + "+-.")
+
+
+@functools.lru_cache(maxsize=4096)
 def extract_domain(url_or_domain: str) -> str:
     """Normalize a company website to a bare domain for email lookup."""
     if not url_or_domain:
         return ""
-    parsed = urlparse(url_or_domain if "://" in url_or_domain else f"http://{url_or_domain}")
-    hostname = parsed.hostname or ""
-    hostname = hostname.lower()
+    # Hand-rolled authority split (same result as urlparse(...).hostname for
+    # website values, without building a ParseResult)
+    text = url_or_domain.strip()
+    scheme_end = text.find("://")
+    if scheme_end >= 0:
+        scheme = text[:scheme_end]
+        if not (scheme[:1].isalpha() and _URL_SCHEME_CHARS.issuperset(scheme)):
+            return ""
+        text = text[scheme_end + 3:]
+    for delimiter in "/?#":
+        cut = text.find(delimiter)
+        if cut >= 0:
+            text = text[:cut]
+    hostname = text.rpartition("@")[2].partition(":")[0].lower()
     if hostname.startswith("www."):
         hostname = hostname[4:]
     return hostname
 
 
-def generate_file_path(company_name: str, title: str, posted_at: str = None) -> str:
-    """Generate the file path for the resume"""
+def generate_file_path(company_name: str, title: str, posted_at: str = None, job_key: str = "") -> str:
+    """
+    Generate the file path for the resume. Jobs run concurrently, so postings
+    with the same company, title and date can be named in the same second;
+    the job key's prefix keeps their paths apart.
+    """
     company_slug = slugify(company_name) or "unknown-company"
     title_slug = slugify(title) or "unknown-position"
 
@@ -469,15 +775,17 @@ def generate_file_path(company_name: str, title: str, posted_at: str = None) ->
     company_slug = company_slug[:50]
     title_slug = title_slug[:50]
 
+    # One clock read serves both the fallback date and the uniqueness timestamp
+    timestamp = time.time_ns() // 1_000_000_000
+
     # Extract digits from posted_at, fallback to current date if empty
-    if posted_at:
-        date_part = re.sub(r'[^0-9]', '', posted_at)
-    if not posted_at or not date_part:  # Handle empty string after digit extraction
-        date_part = datetime.now().strftime('%Y%m%d')
-
-    # Add timestamp for uniqueness
-    timestamp = int(time.time())
-    filename = f"carlos-luna-pena-{company_slug}-{title_slug}-{date_part}-{timestamp}.tex"
+    date_part = posted_at.translate(_DIGITS_ONLY_TABLE) if posted_at else ""
+    if not date_part:  # Handle empty string after digit extraction
+        now = time.localtime(timestamp)
+        date_part = f"{now.tm_year:04d}{now.tm_mon:02d}{now.tm_mday:02d}"
+
+    key_part = f"-{slugify(job_key)[:8]}" if job_key else ""
+    filename = f"carlos-luna-pena-{company_slug}-{title_slug}-{date_part}-{timestamp}{key_part}.tex"
     return f"resumes/tex/{filename}"
 
 
@@ -499,13 +807,35 @@ def validate_required_config() -> None:
         click.secho("[WARN] ANYMAILFINDER_API_KEY not set; decision-maker email lookup may be skipped.", fg="yellow")
 
 
+# Fields that already hold a display-ready salary string
+_SALARY_TEXT_KEYS = ("displayValue", "value", "label", "text")
+_SALARY_LOW_KEYS = ("min", "from", "low")
+_SALARY_HIGH_KEYS = ("max", "to", "high")
+_SALARY_CURRENCY_KEYS = ("currency", "curr")
+_SALARY_PERIOD_KEYS = ("period", "unit")
+
+
+def _first_truthy(data: Dict, keys: Tuple[str, ...]) -> Any:
+    """First truthy value among keys (same as chaining data.get(k) with `or`)."""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return None
+
+
 def format_salary_info(salary_info: Any) -> str:
     """Return a safe, human-readable salary string from varied Apify payloads."""
     if not salary_info:
         return "Not specified"
+    # Apify payloads are decoded JSON, so exact type checks suffice (no MRO walk)
+    kind = type(salary_info)
+    # Plain strings are the common case from Apify
+    if kind is str:
+        return clean_string(salary_info) or "Not specified"
     
     # Handle lists or tuples by taking the first usable entry
-    if isinstance(salary_info, (list, tuple)):
+    if kind is list or kind is tuple:
         for entry in salary_info:
             formatted = format_salary_info(entry)
             if formatted != "Not specified":
@@ -513,15 +843,15 @@ def format_salary_info(salary_info: Any) -> str:
         return "Not specified"
     
     # Handle dict structures with common fields
-    if isinstance(salary_info, dict):
-        for key in ("displayValue", "value", "label", "text"):
-            if salary_info.get(key):
-                return clean_string(str(salary_info[key]))
+    if kind is dict:
+        text = _first_truthy(salary_info, _SALARY_TEXT_KEYS)
+        if text:
+            return clean_string(str(text))
         
-        low = salary_info.get("min") or salary_info.get("from") or salary_info.get("low")
-        high = salary_info.get("max") or salary_info.get("to") or salary_info.get("high")
-        currency = salary_info.get("currency") or salary_info.get("curr")
-        period = salary_info.get("period") or salary_info.get("unit")
+        low = _first_truthy(salary_info, _SALARY_LOW_KEYS)
+        high = _first_truthy(salary_info, _SALARY_HIGH_KEYS)
+        currency = _first_truthy(salary_info, _SALARY_CURRENCY_KEYS)
+        period = _first_truthy(salary_info, _SALARY_PERIOD_KEYS)
         
         parts = []
         if currency:
@@ -540,7 +870,7 @@ def format_salary_info(salary_info: Any) -> str:
             return clean_string(" ".join(parts))
         return "Not specified"
     
-    # Fallback for strings or other primitives
+    # Fallback for other primitives
     return clean_string(str(salary_info)) or "Not specified"
 
 
@@ -551,50 +881,43 @@ def extract_pdf_text(pdf_source: Union[str, bytes]) -> str:
         pdf_source: Either a file path (str) or PDF bytes (bytes)
     """
     try:
-        import fitz  # PyMuPDF - more reliable than PyPDF2
-        if isinstance(pdf_source, bytes):
-            doc = fitz.open(stream=pdf_source, filetype="pdf")
-        else:
-            doc = fitz.open(pdf_source)
-        text = ""
-        for page in doc:
-            text += page.get_text()
-        doc.close()
-        return text
-    except ImportError:
-        try:
-            # Fallback to PyPDF2 (only works with file paths)
-            import PyPDF2
+        if fitz is not None:  # PyMuPDF - more reliable than PyPDF2
             if isinstance(pdf_source, bytes):
-                import io
-                f = io.BytesIO(pdf_source)
+                doc = fitz.open(stream=pdf_source, filetype="pdf")
             else:
-                f = open(pdf_source, 'rb')
-            try:
-                reader = PyPDF2.PdfReader(f)
-                text = ""
-                for page in reader.pages:
-                    text += page.extract_text() or ""
-                return text
-            finally:
-                f.close()
-        except ImportError:
-            click.secho("   [WARN] Neither PyMuPDF nor PyPDF2 installed, skipping text extraction", fg="yellow")
-            return ""
+                doc = fitz.open(pdf_source)
+            with doc:
+                return "".join(page.get_text() for page in doc)
+        if PyPDF2 is not None:
+            f = io.BytesIO(pdf_source) if isinstance(pdf_source, bytes) else open(pdf_source, 'rb')
+            with f:
+                return "".join(page.extract_text() or "" for page in PyPDF2.PdfReader(f).pages)
+        click.secho("   [WARN] Neither PyMuPDF nor PyPDF2 installed, skipping text extraction", fg="yellow")
+        return ""
     except Exception as e:
         click.secho(f"   [WARN] PDF text extraction failed: {e}", fg="yellow")
         return ""
 
 
-def validate_latex_output(latex: str) -> bool:
-    """Validate LaTeX output to avoid uploading malformed files that will fail compilation."""
+def validate_latex_output(latex: str, begin_doc_idx: Optional[int] = None) -> bool:
+    """
+    Validate LaTeX output to avoid uploading malformed files that will fail compilation.
+    Callers that already located \\begin{document} can pass its index to skip the search.
+    """
     if not latex:
         return False
 
-    # Check for required structural elements
-    required_elements = ["\\documentclass", "\\begin{document}", "\\end{document}"]
-    for element in required_elements:
-        if element not in latex:
+    # Check for required structural elements. Each is searched from the end it
+    # normally sits at, so a valid document is scanned about once in total.
+    if begin_doc_idx is None:
+        begin_doc_idx = latex.find("\\begin{document}")
+    found = (
+        "\\documentclass" in latex,  # First line: found immediately
+        begin_doc_idx >= 0,
+        latex.rfind("\\end{document}") >= 0,
+    )
+    for element, present in zip(_LATEX_REQUIRED_ELEMENTS, found):
+        if not present:
             click.secho(f"   [WARN] LaTeX validation failed: missing {element}", fg="yellow")
             return False
 
@@ -603,26 +926,24 @@ def validate_latex_output(latex: str) -> bool:
         click.secho("   [WARN] LaTeX validation failed: content too short", fg="yellow")
         return False
 
-    # Check for malformed titleformat commands (orphaned braces before \begin{document})
-    begin_doc_idx = latex.find("\\begin{document}")
-    preamble = latex[:begin_doc_idx] if begin_doc_idx > 0 else ""
+    # Check for malformed titleformat commands (orphaned braces before \begin{document}).
+    # The preamble is scanned in place via search/count bounds rather than sliced out.
 
     # Detect orphaned closing braces at line start (common LLM truncation pattern)
-    orphan_brace_pattern = re.compile(r'^\s*\}\s*\{', re.MULTILINE)
-    if orphan_brace_pattern.search(preamble):
+    if _ORPHAN_BRACE_RE.search(latex, 0, begin_doc_idx):
         click.secho("   [WARN] LaTeX validation failed: detected malformed command (orphaned braces in preamble)", fg="yellow")
         return False
 
     # Check for incomplete titleformat (pattern: }{}{}{ without preceding \titleformat)
-    if re.search(r'\}\s*\{\}\s*\{\}\s*\{', preamble):
-        incomplete_titleformat = not re.search(r'\\titleformat\s*\{', preamble)
+    if _BARE_TITLEFORMAT_ARGS_RE.search(latex, 0, begin_doc_idx):
+        incomplete_titleformat = not _TITLEFORMAT_RE.search(latex, 0, begin_doc_idx)
         if incomplete_titleformat:
             click.secho("   [WARN] LaTeX validation failed: incomplete \\titleformat command", fg="yellow")
             return False
 
     # Basic brace balance check in preamble
-    open_braces = preamble.count('{')
-    close_braces = preamble.count('}')
+    open_braces = latex.count('{', 0, begin_doc_idx)
+    close_braces = latex.count('}', 0, begin_doc_idx)
     if abs(open_braces - close_braces) > 5:  # Allow some tolerance for edge cases
         click.secho(f"   [WARN] LaTeX validation failed: brace imbalance in preamble ({open_braces} open, {close_braces} close)", fg="yellow")
         return False
@@ -630,6 +951,85 @@ def validate_latex_output(latex: str) -> bool:
     return True
 
 
+# Failed-compile artifacts are written off the job's thread; one writer keeps them ordered
+_FAILED_TEX_DIR = Path("tex/failed")
+_failure_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="latex-failures")
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_failed_tex_dir() -> Path:
+    _FAILED_TEX_DIR.mkdir(parents=True, exist_ok=True)
+    return _FAILED_TEX_DIR
+
+
+def _write_failure_artifacts(files: Dict[Path, str]) -> None:
+    try:
+        _ensure_failed_tex_dir()
+        for path, text in files.items():
+            path.write_text(text, encoding='utf-8')
+    except OSError as e:
+        click.secho(f"   [WARN] Could not save failed LaTeX artifacts: {e}", fg="yellow")
+
+
+def save_failed_latex(base_filename: str, suffix: str, latex_content: str, log: Optional[str] = None) -> Path:
+    """Queue the failed .tex (and pdflatex log) for tex/failed without waiting; returns the .tex path."""
+    failed_tex = _FAILED_TEX_DIR / f"{base_filename}_{suffix}.tex"
+    files = {failed_tex: latex_content}
+    if log is not None:
+        files[_FAILED_TEX_DIR / f"{base_filename}_pdflatex.log"] = log
+    _failure_writer.submit(_write_failure_artifacts, files)
+    return failed_tex
+
+
+_LATEX_FORMAT_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=8)
+def preamble_format(preamble: str) -> Optional[str]:
+    """
+    Path (without .fmt) of a pdflatex format with this preamble already loaded,
+    built once with mylatexformat and reused across runs. None if it can't be built.
+    """
+    binary = shutil.which('pdflatex')
+    if not binary or not preamble:
+        return None
+    # Keyed on the preamble and the pdflatex install: formats don't survive TeX upgrades
+    stamp = f"{binary}\0{os.stat(binary).st_mtime}\0{preamble}".encode("utf-8")
+    name = f"resume_preamble_{hashlib.sha1(stamp).hexdigest()[:16]}"
+    fmt_base = os.path.join(config.LATEX_FORMAT_CACHE_DIR, name)
+
+    with _LATEX_FORMAT_LOCK:
+        if os.path.isfile(fmt_base + ".fmt"):
+            return fmt_base
+        build_dir = tempfile.mkdtemp(prefix='latex_fmt_', dir=_LATEX_TMP_ROOT)
+        try:
+            with open(os.path.join(build_dir, "preamble.tex"), "w", encoding="utf-8") as f:
+                f.write(preamble)
+                f.write("\\begin{document}\n\\end{document}\n")
+            result = subprocess.run(
+                ['pdflatex', '-ini', '-interaction=nonstopmode', '-halt-on-error', f'-jobname={name}',
+                 '&pdflatex', 'mylatexformat.ltx', 'preamble.tex'],
+                cwd=build_dir,
+                capture_output=True,
+                timeout=120,
+                text=True
+            )
+            built = os.path.join(build_dir, f"{name}.fmt")
+            if result.returncode != 0 or not os.path.isfile(built):
+                click.secho("   [INFO] Could not precompile the LaTeX preamble (is mylatexformat installed?); "
+                            "compiling without it", fg="blue")
+                return None
+            os.makedirs(config.LATEX_FORMAT_CACHE_DIR, exist_ok=True)
+            os.replace(built, fmt_base + ".fmt")
+            print(f"   [INFO] Precompiled LaTeX preamble to {fmt_base}.fmt")
+            return fmt_base
+        except (OSError, subprocess.TimeoutExpired) as e:
+            click.secho(f"   [INFO] Could not precompile the LaTeX preamble ({e}); compiling without it", fg="blue")
+            return None
+        finally:
+            shutil.rmtree(build_dir, ignore_errors=True)
+
+
 def compile_latex_to_pdf(latex_content: str, base_filename: str) -> Optional[Tuple[str, bytes]]:
     """
     Compile LaTeX content to PDF using pdflatex.
@@ -642,41 +1042,49 @@ def compile_latex_to_pdf(latex_content: str, base_filename: str) -> Optional[Tup
         Tuple of (pdf_path, pdf_bytes) if successful, None if compilation fails
     """
     # Create temp directory for compilation
-    temp_dir = tempfile.mkdtemp(prefix='latex_compile_')
-    tex_path = Path(temp_dir) / f"{base_filename}.tex"
-    pdf_path = Path(temp_dir) / f"{base_filename}.pdf"
+    temp_dir = tempfile.mkdtemp(prefix='latex_compile_', dir=_LATEX_TMP_ROOT)
+    tex_name = f"{base_filename}.tex"
+    pdf_path = os.path.join(temp_dir, f"{base_filename}.pdf")
     compilation_succeeded = False
 
     try:
-        # Write LaTeX content to temp file
-        tex_path.write_text(latex_content, encoding='utf-8')
-
-        # Run pdflatex twice (for references/TOC)
-        for pass_num in range(2):
+        # Write LaTeX content to temp file (plain paths and bytes; no Path objects per compile)
+        with open(os.path.join(temp_dir, tex_name), 'wb') as f:
+            f.write(latex_content.encode('utf-8'))
+
+        # The resume template has no cross-references, so one pass is enough;
+        # a second pass only runs for documents that resolve refs/TOC/citations
+        passes = 2 if any(token in latex_content for token in _LATEX_RERUN_TOKENS) else 1
+        # With a precompiled preamble, pdflatex skips straight to \begin{document}
+        begin_doc_idx = latex_content.find('\\begin{document}')
+        fmt = preamble_format(latex_content[:begin_doc_idx]) if begin_doc_idx > 0 else None
+        pass_num = 0
+        while pass_num < passes:
+            command = ['pdflatex', '-interaction=nonstopmode', '-halt-on-error', '-synctex=0', '-no-shell-escape']
+            if fmt:
+                command.append(f'-fmt={fmt}')
             result = subprocess.run(
-                ['pdflatex', '-interaction=nonstopmode', '-halt-on-error', tex_path.name],
+                command + [tex_name],
                 cwd=temp_dir,
                 capture_output=True,
                 timeout=60,
                 text=True
             )
 
+            if result.returncode != 0 and fmt:
+                # Never let the format be the reason a resume fails; redo it the normal way
+                click.secho("   [WARN] Compile with precompiled preamble failed; retrying without it", fg="yellow")
+                fmt = None
+                pass_num = 0
+                continue
+
             if result.returncode != 0:
                 # Save failed .tex file and full pdflatex output for debugging
-                failed_dir = Path("tex/failed")
-                failed_dir.mkdir(parents=True, exist_ok=True)
-
-                # Save .tex file
-                failed_tex = failed_dir / f"{base_filename}_FAILED.tex"
-                shutil.copy(tex_path, failed_tex)
-
-                # Save full pdflatex output to log file
-                log_file = failed_dir / f"{base_filename}_pdflatex.log"
-                log_file.write_text(result.stdout, encoding='utf-8')
+                failed_tex = save_failed_latex(base_filename, "FAILED", latex_content, log=result.stdout)
 
                 print(f"   pdflatex pass {pass_num + 1} failed:")
                 print(f"   Failed .tex saved to: {failed_tex}")
-                print(f"   Full log saved to: {log_file}")
+                print(f"   Full log saved to: {_FAILED_TEX_DIR / f'{base_filename}_pdflatex.log'}")
 
                 # Print last 30 lines for immediate context
                 stderr_lines = result.stdout.split('\n')[-30:]
@@ -686,32 +1094,30 @@ def compile_latex_to_pdf(latex_content: str, base_filename: str) -> Optional[Tup
 
                 print(f"   Temp dir preserved for debugging: {temp_dir}")
                 return None
+            pass_num += 1
 
         # Verify PDF was created and is non-empty
-        if not pdf_path.exists() or pdf_path.stat().st_size == 0:
+        try:
+            with open(pdf_path, 'rb') as f:
+                pdf_bytes = f.read()
+        except FileNotFoundError:
+            pdf_bytes = b""
+        if not pdf_bytes:
             # Save failed .tex file for debugging
-            failed_dir = Path("tex/failed")
-            failed_dir.mkdir(parents=True, exist_ok=True)
-            failed_tex = failed_dir / f"{base_filename}_FAILED_NO_PDF.tex"
-            shutil.copy(tex_path, failed_tex)
+            failed_tex = save_failed_latex(base_filename, "FAILED_NO_PDF", latex_content)
 
             print("   PDF file was not created or is empty")
             print(f"   Failed .tex saved to: {failed_tex}")
             print(f"   Temp dir preserved for debugging: {temp_dir}")
             return None
 
-        # Read PDF bytes
-        pdf_bytes = pdf_path.read_bytes()
         compilation_succeeded = True
 
-        return (str(pdf_path), pdf_bytes)
+        return (pdf_path, pdf_bytes)
 
     except subprocess.TimeoutExpired:
         # Save failed .tex file for debugging
-        failed_dir = Path("tex/failed")
-        failed_dir.mkdir(parents=True, exist_ok=True)
-        failed_tex = failed_dir / f"{base_filename}_FAILED_TIMEOUT.tex"
-        shutil.copy(tex_path, failed_tex)
+        failed_tex = save_failed_latex(base_filename, "FAILED_TIMEOUT", latex_content)
 
         print("   pdflatex compilation timed out (60s)")
         print(f"   Failed .tex saved to: {failed_tex}")
@@ -719,14 +1125,8 @@ def compile_latex_to_pdf(latex_content: str, base_filename: str) -> Optional[Tup
         return None
     except Exception as e:
         # Save failed .tex file for debugging
-        failed_dir = Path("tex/failed")
-        failed_dir.mkdir(parents=True, exist_ok=True)
-        failed_tex = failed_dir / f"{base_filename}_FAILED_EXCEPTION.tex"
-        try:
-            shutil.copy(tex_path, failed_tex)
-            print(f"   Failed .tex saved to: {failed_tex}")
-        except:
-            pass
+        failed_tex = save_failed_latex(base_filename, "FAILED_EXCEPTION", latex_content)
+        print(f"   Failed .tex saved to: {failed_tex}")
 
         print(f"   LaTeX compilation error: {e}")
         print(f"   Temp dir preserved for debugging: {temp_dir}")
@@ -748,31 +1148,51 @@ class GoogleSheetsClient:
     """Client for Google Sheets operations"""
     
     def __init__(self):
-        scopes = ['https://www.googleapis.com/auth/spreadsheets']
-        self.creds = make_credentials(scopes)
-        self.service = build('sheets', 'v4', credentials=self.creds)
+        self.creds = shared_credentials()
+        self._local = threading.local()
+        self._header_cache: Dict[Tuple[str, str], List[str]] = {}
+
+    @property
+    def service(self):
+        """Sheets service for the calling thread (googleapiclient objects are not thread-safe)."""
+        if getattr(self._local, "service", None) is None:
+            self._local.service = build_google_service('sheets', 'v4', self.creds)
+        return self._local.service
     
     def get_headers(self, spreadsheet_id: str, sheet_name: str = "Sheet1") -> List[str]:
-        """Fetch header row to align appends."""
+        """Fetch header row to align appends (cached per sheet after the first read)."""
+        key = (spreadsheet_id, sheet_name)
+        if key in self._header_cache:
+            return self._header_cache[key]
         try:
             result = self.service.spreadsheets().values().get(
                 spreadsheetId=spreadsheet_id,
-                range=f"{sheet_name}!1:1"
+                range=f"{sheet_name}!1:1",
+                fields='values'
             ).execute(num_retries=2)
             values = result.get('values', [])
             if not values:
                 return []
+            self._header_cache[key] = values[0]
             return values[0]
         except HttpError as e:
             print(f"Error reading headers: {e}")
             return []
+
+    def invalidate_headers(self, spreadsheet_id: str = None, sheet_name: str = "Sheet1"):
+        """Drop cached header rows (all sheets, or one) after the schema changes."""
+        if spreadsheet_id is None:
+            self._header_cache.clear()
+        else:
+            self._header_cache.pop((spreadsheet_id, sheet_name), None)
     
     def read_sheet(self, spreadsheet_id: str, range_name: str = "A:J") -> List[Dict]:
         """Read all rows from a sheet"""
         try:
             result = self.service.spreadsheets().values().get(
                 spreadsheetId=spreadsheet_id,
-                range=range_name
+                range=range_name,
+                fields='values'
             ).execute(num_retries=2)
             
             values = result.get('values', [])
@@ -780,25 +1200,51 @@ class GoogleSheetsClient:
                 return []
             
             headers = values[0]
-            rows = []
-            for row in values[1:]:
-                row_dict = {}
-                for i, header in enumerate(headers):
-                    row_dict[header] = row[i] if i < len(row) else ""
-                rows.append(row_dict)
-            return rows
+            width = len(headers)
+            # Cells past the last header are dropped, short rows padded with ""
+            return [dict(zip_longest(headers, row[:width], fillvalue="")) for row in values[1:]]
         except HttpError as e:
             print(f"Error reading sheet: {e}")
             return []
     
+    def read_columns(self, spreadsheet_id: str, names: List[str], sheet_name: str = "Sheet1") -> Dict[str, List[str]]:
+        """Read only the named columns (below the header row) with one batchGet."""
+        headers = self.get_headers(spreadsheet_id, sheet_name)
+        present = [name for name in names if name in headers]
+        if not present:
+            return {}
+        ranges = []
+        for name in present:
+            letter = column_letter(headers.index(name))
+            ranges.append(f"{sheet_name}!{letter}2:{letter}")
+        try:
+            result = self.service.spreadsheets().values().batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=ranges,
+                majorDimension="COLUMNS",
+                fields='valueRanges/values'
+            ).execute(num_retries=2)
+            return {
+                name: (value_range.get('values') or [[]])[0]
+                for name, value_range in zip(present, result.get('valueRanges', []))
+            }
+        except HttpError as e:
+            print(f"Error reading columns: {e}")
+            return {}
+    
     def append_row_dict(self, spreadsheet_id: str, row: Dict[str, Any], sheet_name: str = "Sheet1"):
         """Append a row using header alignment."""
+        self.append_rows_batch(spreadsheet_id, [row], sheet_name)
+
+    def append_rows_batch(self, spreadsheet_id: str, rows: List[Dict[str, Any]], sheet_name: str = "Sheet1") -> bool:
+        """Append several rows (header-aligned) with a single values.append call."""
+        if not rows:
+            return True
         try:
             headers = self.get_headers(spreadsheet_id, sheet_name)
             if not headers:
-                headers = list(row.keys())
-            values = [row.get(h, "") for h in headers]
-            body = {'values': [values]}
+                headers = list(rows[0].keys())
+            body = {'values': [[row.get(h, "") for h in headers] for row in rows]}
             self.service.spreadsheets().values().append(
                 spreadsheetId=spreadsheet_id,
                 range=f"{sheet_name}!A1",
@@ -806,32 +1252,35 @@ class GoogleSheetsClient:
                 insertDataOption='INSERT_ROWS',
                 body=body
             ).execute(num_retries=2)
+            return True
         except HttpError as e:
-            print(f"Error appending row: {e}")
+            print(f"Error appending rows: {e}")
+            return False
 
 
 class GoogleDocsClient:
     """Client for Google Docs operations"""
     
     def __init__(self):
-        scopes = ['https://www.googleapis.com/auth/documents.readonly']
-        self.creds = make_credentials(scopes)
-        self.service = build('docs', 'v1', credentials=self.creds)
+        self.creds = shared_credentials()
+        self.service = build_google_service('docs', 'v1', self.creds)
     
     def get_document_content(self, document_id: str) -> str:
         """Get the text content of a Google Doc"""
         try:
-            doc = self.service.documents().get(documentId=document_id).execute(num_retries=2)
-            content = doc.get('body', {}).get('content', [])
-            
-            text_parts = []
-            for element in content:
-                if 'paragraph' in element:
-                    for para_element in element['paragraph'].get('elements', []):
-                        if 'textRun' in para_element:
-                            text_parts.append(para_element['textRun'].get('content', ''))
+            # Partial response: only paragraph text runs, not styles/lists/inline objects
+            doc = self.service.documents().get(
+                documentId=document_id,
+                fields='body/content/paragraph/elements/textRun/content'
+            ).execute(num_retries=2)
+            content = doc.get('body', {}).get('content') or []
             
-            return ''.join(text_parts)
+            return ''.join(
+                para_element['textRun'].get('content', '')
+                for element in content if 'paragraph' in element
+                for para_element in element['paragraph'].get('elements', ())
+                if 'textRun' in para_element
+            )
         except HttpError as e:
             print(f"Error reading document: {e}")
             return ""
@@ -839,14 +1288,125 @@ class GoogleDocsClient:
 
 class GoogleSlidesClient:
     """Client for Google Slides operations"""
+
+    # Requests per batchUpdate; queued slides are grouped (never split) under this
+    MAX_BATCH_REQUESTS = 500
+
+    # Right box text and its link ranges are the same for every slide, so the
+    # offsets are computed once here rather than per job
+    RIGHT_BOX_TEXT = 'RESUME\nOpen PDF Resume\n\nLINKEDIN\nView Job Posting\n\nAPPLY\nQuick Apply Link'
+    RESUME_LINK_RANGE = (RIGHT_BOX_TEXT.find('Open PDF Resume'),
+                         RIGHT_BOX_TEXT.find('Open PDF Resume') + len('Open PDF Resume'))
+    JOB_LINK_RANGE = (RIGHT_BOX_TEXT.find('View Job Posting'),
+                      RIGHT_BOX_TEXT.find('View Job Posting') + len('View Job Posting'))
+    APPLY_LINK_RANGE = (RIGHT_BOX_TEXT.find('Quick Apply Link'),
+                        RIGHT_BOX_TEXT.find('Quick Apply Link') + len('Quick Apply Link'))
+    # Constant style fragments shared by reference (requests are only serialized)
+    LINK_COLOR = {'opaqueColor': {'rgbColor': {'red': 0.102, 'green': 0.4, 'blue': 0.898}}}
     
     def __init__(self):
-        scopes = ['https://www.googleapis.com/auth/presentations']
-        self.creds = make_credentials(scopes)
-        self.service = build('slides', 'v1', credentials=self.creds)
+        self.creds = shared_credentials()
+        self._local = threading.local()
+        # (label, requests) per queued slide, sent together by flush()
+        self._pending: List[Tuple[str, List[Dict]]] = []
+        self._pending_lock = threading.Lock()
+
+    @property
+    def service(self):
+        """Slides service for the calling thread (googleapiclient objects are not thread-safe)."""
+        if getattr(self._local, "service", None) is None:
+            self._local.service = build_google_service('slides', 'v1', self.creds)
+        return self._local.service
     
     def create_job_slide(self, presentation_id: str, job: Dict, resume_pdf_url: str) -> bool:
         """Create a slide for a job application. Returns True on success, False on failure."""
+        label = f"{job.get('companyName', 'Unknown Company')} - {job.get('title', 'Unknown Position')}"
+        return self._send(presentation_id, self.build_job_slide_requests(job, resume_pdf_url), label)
+
+    def queue_job_slide(self, job: Dict, resume_pdf_url: str):
+        """Queue a job's slide; flush() creates every queued slide in one batchUpdate."""
+        label = f"{job.get('companyName', 'Unknown Company')} - {job.get('title', 'Unknown Position')}"
+        requests_body = self.build_job_slide_requests(job, resume_pdf_url)
+        with self._pending_lock:
+            self._pending.append((label, requests_body))
+
+    def discard_queued(self, link_urls: Set[str]) -> int:
+        """Drop queued slides that link to any of these URLs (e.g. a PDF that never got committed)."""
+        def links(requests_body: List[Dict]) -> Iterator[str]:
+            for request in requests_body:
+                yield ((request.get('updateTextStyle') or {}).get('style') or {}).get('link', {}).get('url')
+
+        with self._pending_lock:
+            kept = [item for item in self._pending if link_urls.isdisjoint(links(item[1]))]
+            dropped = len(self._pending) - len(kept)
+            self._pending = kept
+        return dropped
+
+    def flush(self, presentation_id: str) -> int:
+        """
+        Create all queued slides with as few batchUpdates as MAX_BATCH_REQUESTS
+        allows (usually one). batchUpdate is atomic, so if one fails each of its
+        slides is retried on its own to isolate the bad one.
+        Returns the number of slides created.
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return 0
+        print(f"\n[INFO] Creating {len(pending)} presentation slides...")
+        created = 0
+        for group in self._batch_groups(pending):
+            all_requests = [request for _, requests_body in group for request in requests_body]
+            if self._send(presentation_id, all_requests, f"{len(group)} jobs"):
+                created += len(group)
+                continue
+            click.secho("   [WARN] Retrying slides one at a time...", fg="yellow")
+            # Each worker thread gets its own service (see the service property)
+            with ThreadPoolExecutor(max_workers=max(1, min(config.SLIDES_CONCURRENCY, len(group)))) as pool:
+                created += sum(pool.map(
+                    lambda item: self._send(presentation_id, item[1], item[0]), group
+                ))
+        return created
+
+    def _batch_groups(self, pending: List[Tuple[str, List[Dict]]]) -> Iterator[List[Tuple[str, List[Dict]]]]:
+        """Consecutive runs of queued slides whose requests fit in one batchUpdate."""
+        group, size = [], 0
+        for item in pending:
+            if group and size + len(item[1]) > self.MAX_BATCH_REQUESTS:
+                yield group
+                group, size = [], 0
+            group.append(item)
+            size += len(item[1])
+        if group:
+            yield group
+
+    def _send(self, presentation_id: str, requests_body: List[Dict], label: str) -> bool:
+        try:
+            # Replies aren't read; keep the response to the created slide IDs
+            self.service.presentations().batchUpdate(
+                presentationId=presentation_id,
+                body={'requests': requests_body},
+                fields='replies/createSlide/objectId'
+            ).execute(num_retries=2)
+            click.secho(f"   [OK] Created slide(s) for {label}", fg="green")
+            return True
+        except HttpError as e:
+            click.secho(f"   [ERROR] Error creating slide for {label}: {e}", fg="red")
+            return False
+
+    def _link_request(self, object_id: str, text_range: Tuple[int, int], url: str) -> Dict:
+        """updateTextStyle request that turns one range of a text box into a link."""
+        return {
+            'updateTextStyle': {
+                'objectId': object_id,
+                'textRange': {'type': 'FIXED_RANGE', 'startIndex': text_range[0], 'endIndex': text_range[1]},
+                'style': {'link': {'url': url}, 'foregroundColor': self.LINK_COLOR, 'underline': True},
+                'fields': 'link,foregroundColor,underline'
+            }
+        }
+
+    def build_job_slide_requests(self, job: Dict, resume_pdf_url: str) -> List[Dict]:
+        """Slides API requests that create one job's slide (not executed)."""
         # Use UUID suffix to ensure globally unique object IDs (prevents collision if same job ID)
         job_id = f"{job.get('id', 'noid')}_{uuid.uuid4().hex[:8]}"
         title = job.get('title', 'Unknown Position')
@@ -864,14 +1424,6 @@ class GoogleSlidesClient:
         job_link = job.get('link', '') or job.get('applyUrl', '') or 'https://linkedin.com/jobs'
         apply_url = job.get('applyUrl', '') or 'https://people.tamu.edu/~carlunpen/'
 
-        # Define right box text and calculate link indices dynamically (prevents hardcoding bugs)
-        right_box_text = 'RESUME\nOpen PDF Resume\n\nLINKEDIN\nView Job Posting\n\nAPPLY\nQuick Apply Link'
-        resume_link_start = right_box_text.find('Open PDF Resume')
-        resume_link_end = resume_link_start + len('Open PDF Resume')
-        job_link_start = right_box_text.find('View Job Posting')
-        job_link_end = job_link_start + len('View Job Posting')
-        apply_link_start = right_box_text.find('Quick Apply Link')
-        apply_link_end = apply_link_start + len('Quick Apply Link')
 
         requests_body = [
             # Create blank slide
@@ -959,72 +1511,15 @@ class GoogleSlidesClient:
                 'insertText': {
                     'objectId': f'right_box_{job_id}',
                     'insertionIndex': 0,
-                    'text': right_box_text
-                }
-            },
-            # Add hyperlink to "Open PDF Resume" (dynamically calculated indices)
-            {
-                'updateTextStyle': {
-                    'objectId': f'right_box_{job_id}',
-                    'textRange': {
-                        'type': 'FIXED_RANGE',
-                        'startIndex': resume_link_start,
-                        'endIndex': resume_link_end
-                    },
-                    'style': {
-                        'link': {'url': resume_pdf_url},
-                        'foregroundColor': {
-                            'opaqueColor': {
-                                'rgbColor': {'red': 0.102, 'green': 0.4, 'blue': 0.898}
-                            }
-                        },
-                        'underline': True
-                    },
-                    'fields': 'link,foregroundColor,underline'
-                }
-            },
-            # Add hyperlink to "View Job Posting" (dynamically calculated indices)
-            {
-                'updateTextStyle': {
-                    'objectId': f'right_box_{job_id}',
-                    'textRange': {
-                        'type': 'FIXED_RANGE',
-                        'startIndex': job_link_start,
-                        'endIndex': job_link_end
-                    },
-                    'style': {
-                        'link': {'url': job_link},
-                        'foregroundColor': {
-                            'opaqueColor': {
-                                'rgbColor': {'red': 0.102, 'green': 0.4, 'blue': 0.898}
-                            }
-                        },
-                        'underline': True
-                    },
-                    'fields': 'link,foregroundColor,underline'
-                }
-            },
-            # Add hyperlink to "Quick Apply Link" (dynamically calculated indices)
-            {
-                'updateTextStyle': {
-                    'objectId': f'right_box_{job_id}',
-                    'textRange': {
-                        'type': 'FIXED_RANGE',
-                        'startIndex': apply_link_start,
-                        'endIndex': apply_link_end
-                    },
-                    'style': {
-                        'link': {'url': apply_url},
-                        'foregroundColor': {
-                            'opaqueColor': {
-                                'rgbColor': {'red': 0.102, 'green': 0.4, 'blue': 0.898}
-                            }
-                        },
-                        'underline': True
-                    },
-                    'fields': 'link,foregroundColor,underline'
+                    'text': self.RIGHT_BOX_TEXT
                 }
             },
+            # Add hyperlink to "Open PDF Resume" (precomputed indices)
+            self._link_request(f'right_box_{job_id}', self.RESUME_LINK_RANGE, resume_pdf_url),
+            # Add hyperlink to "View Job Posting" (precomputed indices)
+            self._link_request(f'right_box_{job_id}', self.JOB_LINK_RANGE, job_link),
+            # Add hyperlink to "Quick Apply Link" (precomputed indices)
+            self._link_request(f'right_box_{job_id}', self.APPLY_LINK_RANGE, apply_url),
             # Style title box: 32pt, bold, dark gray, centered
             {
                 'updateTextStyle': {
@@ -1148,73 +1643,128 @@ class GoogleSlidesClient:
                 }
             },
         ]
-        
-        try:
-            self.service.presentations().batchUpdate(
-                presentationId=presentation_id,
-                body={'requests': requests_body}
-            ).execute()
-            click.secho(f"   [OK] Created slide for {company} - {title}", fg="green")
-            return True
-        except HttpError as e:
-            click.secho(f"   [ERROR] Error creating slide: {e}", fg="red")
-            return False
+        return requests_body
 
 
 class ApifyClient:
     """Client for Apify LinkedIn job scraping"""
     
+    TERMINAL_RUN_STATUSES = ("SUCCEEDED", "FAILED", "ABORTED", "TIMED-OUT")
+    
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://api.apify.com/v2"
+        self.session = make_http_session({
+            "Accept": "application/json",
+            "Authorization": f"Bearer {api_key}"
+        })
     
     def scrape_linkedin_jobs(self, search_url: str, count: int = 100) -> List[Dict]:
         """Scrape LinkedIn jobs using Apify actor"""
-        url = f"{self.base_url}/acts/{config.APIFY_ACTOR_ID}/run-sync-get-dataset-items"
-        
-        headers = {
-            "Accept": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
-        }
-        
+        return list(self.iter_linkedin_jobs(search_url, count))
+
+    def start_linkedin_run(self, search_url: str, count: int = 100) -> Dict:
+        """Start the Apify actor without waiting; returns the run object (id, defaultDatasetId, ...)."""
         payload = {
             "count": count,
             "scrapeCompany": True,
             "urls": [search_url]
         }
-        
+        return request_with_retries(
+            "POST",
+            f"{self.base_url}/acts/{config.APIFY_ACTOR_ID}/runs",
+            session=self.session,
+            json=payload
+        ).json()["data"]
+
+    def iter_linkedin_jobs(self, search_url: str, count: int = 100, page_size: int = 50,
+                           run: Optional[Dict] = None) -> Iterator[Dict]:
+        """
+        Yield dataset items of an Apify run (started here unless `run` is given) page
+        by page while it is still scraping, so callers can work on the first jobs early.
+        """
         try:
-            response = request_with_retries(
-                "POST",
-                url,
-                headers=headers,
-                json=payload,
-                timeout=max(config.REQUEST_TIMEOUT_SECONDS, 300)
-            )
-            return response.json()
-        except requests.RequestException as e:
+            if run is None:
+                run = self.start_linkedin_run(search_url, count)
+            
+            offset = 0
+            wait = 2
+            finished = False
+            deadline = time.monotonic() + config.APIFY_RUN_TIMEOUT_SECONDS
+            while True:
+                items = self._dataset_page(run["defaultDatasetId"], offset, page_size)
+                if items:
+                    offset += len(items)
+                    wait = 2
+                    yield from items
+                    continue
+                # One last page is read after the run ends to catch its final writes
+                if finished:
+                    break
+                if time.monotonic() > deadline:
+                    click.secho(f"   [WARN] Apify run {run['id']} still going after {config.APIFY_RUN_TIMEOUT_SECONDS}s; "
+                                f"continuing with {offset} jobs", fg="yellow")
+                    break
+                status = self._wait_for_run(run["id"], wait)
+                finished = status in self.TERMINAL_RUN_STATUSES
+                if finished and status != "SUCCEEDED":
+                    click.secho(f"   [WARN] Apify run {run['id']} ended as {status}", fg="yellow")
+                wait = min(wait * 2, 60)
+        except (requests.RequestException, KeyError, ValueError) as e:
             print(f"Error scraping LinkedIn: {e}")
-            return []
+
+    def _dataset_page(self, dataset_id: str, offset: int, limit: int) -> List[Dict]:
+        response = request_with_retries(
+            "GET",
+            f"{self.base_url}/datasets/{dataset_id}/items",
+            session=self.session,
+            params={"format": "json", "clean": "true", "offset": offset, "limit": limit}
+        )
+        return json_loads(response.content)
+
+    def _wait_for_run(self, run_id: str, seconds: int) -> str:
+        """Long-poll the run for up to `seconds` (returns early once it finishes); returns its status."""
+        response = request_with_retries(
+            "GET",
+            f"{self.base_url}/actor-runs/{run_id}",
+            session=self.session,
+            params={"waitForFinish": seconds},
+            timeout=config.REQUEST_TIMEOUT_SECONDS + seconds
+        )
+        return response.json()["data"]["status"]
 
 
 class GitHubClient:
     """Client for GitHub file operations"""
     
-    def __init__(self, token: str, repo: str):
+    def __init__(self, token: str, repo: str, branch: str = "main"):
         self.token = token
         self.repo = repo
-        self.base_url = f"https://api.github.com/repos/{repo}/contents"
+        self.branch = branch
+        self.api_url = f"https://api.github.com/repos/{repo}"
+        self.base_url = f"{self.api_url}/contents"
+        self.session = make_http_session({
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github.v3+json"
+        })
+        # Every contents-API write is a commit on the branch; concurrent writes
+        # race on the branch head (409), so jobs upload one at a time
+        self._commit_lock = threading.Lock()
+        self._sha_cache: Dict[str, str] = {}  # path -> blob SHA from our own uploads
+        # (path, content, blob SHA, label) uploaded as blobs, awaiting commit_staged()
+        self._staged: List[Tuple[str, bytes, str, str]] = []
+        self._staged_lock = threading.Lock()
+
+    def raw_url(self, file_path: str) -> str:
+        """Public raw URL a file will have once it is committed to the branch."""
+        return f"https://raw.githubusercontent.com/{self.repo}/{self.branch}/{file_path}"
     
     def get_file_sha(self, file_path: str) -> Optional[str]:
         """Get SHA of existing file (needed for updates)"""
         url = f"{self.base_url}/{file_path}"
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Accept": "application/vnd.github.v3+json"
-        }
         
         try:
-            response = request_with_retries("GET", url, headers=headers)
+            response = request_with_retries("GET", url, session=self.session)
             if response.status_code == 200:
                 return response.json().get('sha')
             return None
@@ -1223,62 +1773,142 @@ class GitHubClient:
     
     def create_or_update_file(self, file_path: str, content: str, message: str) -> Dict:
         """Create or update a file on GitHub"""
-        url = f"{self.base_url}/{file_path}"
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Accept": "application/vnd.github.v3+json",
-            "Content-Type": "application/json"
-        }
-        
-        # Base64 encode content
-        content_b64 = base64.b64encode(content.encode('utf-8')).decode('utf-8')
-        
-        payload = {
-            "message": message,
-            "content": content_b64
-        }
-        
-        # Check if file exists and get SHA
-        sha = self.get_file_sha(file_path)
-        if sha:
-            payload["sha"] = sha
-        
         try:
-            response = request_with_retries("PUT", url, headers=headers, json=payload)
-            return response.json()
+            return self._put_contents(file_path, content.encode('utf-8'), message)
         except requests.RequestException as e:
             print(f"Error uploading to GitHub: {e}")
             return {}
 
     def upload_binary_file(self, file_path: str, content_bytes: bytes, message: str) -> Dict:
         """Upload a binary file (like PDF) to GitHub."""
-        url = f"{self.base_url}/{file_path}"
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Accept": "application/vnd.github.v3+json",
-            "Content-Type": "application/json"
-        }
-
-        # Base64 encode binary content
-        content_b64 = base64.b64encode(content_bytes).decode('utf-8')
-
-        payload = {
-            "message": message,
-            "content": content_b64
-        }
-
-        # Check if file exists and get SHA
-        sha = self.get_file_sha(file_path)
-        if sha:
-            payload["sha"] = sha
-
         try:
-            response = request_with_retries("PUT", url, headers=headers, json=payload)
-            return response.json()
+            return self._put_contents(file_path, content_bytes, message)
         except requests.RequestException as e:
             print(f"Error uploading binary to GitHub: {e}")
             return {}
 
+    def _put_contents(self, file_path: str, content_bytes: bytes, message: str) -> Dict:
+        """
+        PUT a file optimistically: new files need no SHA, and overwrites of a path
+        uploaded earlier this run use the cached SHA. Only when GitHub rejects the
+        write (422 SHA missing / 409 SHA stale) is the current SHA fetched.
+        Re-uploading identical content to a path we wrote this run is skipped.
+        """
+        url = f"{self.base_url}/{file_path}"
+        # GitHub reports content.sha as the git blob SHA, so it can be compared locally
+        blob_sha = hashlib.sha1(b"blob %d\0" % len(content_bytes) + content_bytes).hexdigest()
+
+        with self._commit_lock:
+            if self._sha_cache.get(file_path) == blob_sha:
+                return {"content": {"path": file_path, "sha": blob_sha}}
+            payload = {
+                "message": message,
+                "content": base64.b64encode(content_bytes).decode('utf-8')
+            }
+            if file_path in self._sha_cache:
+                payload["sha"] = self._sha_cache[file_path]
+            try:
+                response = request_with_retries("PUT", url, session=self.session, json=payload)
+            except requests.HTTPError as e:
+                if e.response is None or e.response.status_code not in (409, 422):
+                    raise
+                sha = self.get_file_sha(file_path)
+                if not sha:
+                    raise
+                payload["sha"] = sha
+                response = request_with_retries("PUT", url, session=self.session, json=payload)
+
+            result = response.json()
+            sha = (result.get("content") or {}).get("sha")
+            if sha:
+                self._sha_cache[file_path] = sha
+            return result
+
+    # -------------------------------------------------------------------------
+    # Git Data API: upload blobs as jobs finish, commit them all at once
+    # -------------------------------------------------------------------------
+
+    def stage_file(self, file_path: str, content_bytes: bytes, label: str) -> bool:
+        """
+        Upload a file's blob now (blobs don't touch the branch, so jobs can do this
+        concurrently); commit_staged() later adds every staged file in one commit.
+        """
+        blob_sha = hashlib.sha1(b"blob %d\0" % len(content_bytes) + content_bytes).hexdigest()
+        if self._sha_cache.get(file_path) == blob_sha:
+            return True
+        try:
+            response = request_with_retries("POST", f"{self.api_url}/git/blobs", session=self.session, json={
+                "content": base64.b64encode(content_bytes).decode('utf-8'),
+                "encoding": "base64"
+            })
+            blob_sha = response.json()["sha"]
+        except (requests.RequestException, KeyError, ValueError) as e:
+            print(f"Error uploading blob to GitHub: {e}")
+            return False
+        with self._staged_lock:
+            self._staged.append((file_path, content_bytes, blob_sha, label))
+        return True
+
+    def commit_staged(self, title: str) -> List[str]:
+        """
+        Commit every staged file with one tree + commit + ref update (5 requests
+        however many files). If that fails, each file is PUT on its own as before.
+        Returns the paths that could not be committed.
+        """
+        with self._staged_lock:
+            staged, self._staged = self._staged, []
+        if not staged:
+            return []
+        message = f"{title}\n\n" + "\n".join(f"- {label}" for _, _, _, label in staged)
+
+        with self._commit_lock:
+            for attempt in range(2):
+                try:
+                    self._commit_tree(staged, message)
+                    for path, _, blob_sha, _ in staged:
+                        self._sha_cache[path] = blob_sha
+                    return []
+                except requests.HTTPError as e:
+                    # 422 on the ref update: the branch moved under us; rebuild on the new head once
+                    if attempt == 0 and e.response is not None and e.response.status_code == 422:
+                        continue
+                    print(f"Error committing staged files to GitHub: {e}")
+                    break
+                except (requests.RequestException, KeyError, ValueError) as e:
+                    print(f"Error committing staged files to GitHub: {e}")
+                    break
+
+        click.secho(f"   [WARN] Falling back to one commit per file for {len(staged)} files", fg="yellow")
+        failed = []
+        for path, content_bytes, _, label in staged:
+            result = self.upload_binary_file(path, content_bytes, f"Add compiled PDF for {label}")
+            if not result.get('content'):
+                failed.append(path)
+        return failed
+
+    def _commit_tree(self, staged: List[Tuple[str, bytes, str, str]], message: str):
+        head = request_with_retries(
+            "GET", f"{self.api_url}/git/ref/heads/{self.branch}", session=self.session
+        ).json()["object"]["sha"]
+        base_tree = request_with_retries(
+            "GET", f"{self.api_url}/git/commits/{head}", session=self.session
+        ).json()["tree"]["sha"]
+        tree = request_with_retries("POST", f"{self.api_url}/git/trees", session=self.session, json={
+            "base_tree": base_tree,
+            "tree": [
+                {"path": path, "mode": "100644", "type": "blob", "sha": blob_sha}
+                for path, _, blob_sha, _ in staged
+            ]
+        }).json()["sha"]
+        commit = request_with_retries("POST", f"{self.api_url}/git/commits", session=self.session, json={
+            "message": message,
+            "tree": tree,
+            "parents": [head]
+        }).json()["sha"]
+        request_with_retries(
+            "PATCH", f"{self.api_url}/git/refs/heads/{self.branch}", session=self.session, json={"sha": commit}
+        )
+
 
 class AnyMailFinderClient:
     """Client for finding decision-maker emails"""
@@ -1286,6 +1916,7 @@ class AnyMailFinderClient:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://api.anymailfinder.com/v5.1"
+        self.session = make_http_session({"Authorization": api_key})
     
     def find_decision_maker(self, domain: str, categories: List[str] = None) -> Dict:
         """Find decision-maker email for a company"""
@@ -1293,20 +1924,86 @@ class AnyMailFinderClient:
             categories = ["engineering", "hr", "ceo"]
         
         url = f"{self.base_url}/find-email/decision-maker"
-        headers = {"Authorization": self.api_key}
         payload = {
             "domain": domain,
             "decision_maker_category": categories
         }
         
         try:
-            response = request_with_retries("POST", url, headers=headers, json=payload)
+            response = request_with_retries("POST", url, session=self.session, json=payload)
             return response.json()
         except requests.RequestException as e:
             print(f"Error finding email: {e}")
             return {}
 
 
+# =============================================================================
+# LLM RESULT CACHE (SQLite)
+# =============================================================================
+
+# Per-listing fields that differ between reposts of the same posting
+_VOLATILE_JOB_FIELDS = frozenset({'id', 'postedAt', 'link', 'applyUrl', 'jobKey', 'companyDomain'})
+
+
+def job_content_hash(job: Dict) -> str:
+    """SHA-256 of a job's content, ignoring per-listing fields so reposts hash alike."""
+    content = {k: v for k, v in job.items() if k not in _VOLATILE_JOB_FIELDS}
+    payload = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResultCache:
+    """Disk cache of JSON-serializable LLM results, shared by the job worker threads."""
+
+    def __init__(self, path: str = None, ttl_days: int = None):
+        self.path = path or config.LLM_CACHE_PATH
+        self.ttl_seconds = (ttl_days if ttl_days is not None else config.LLM_CACHE_TTL_DAYS) * 86400
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache "
+            "(key TEXT PRIMARY KEY, value TEXT, ts REAL)"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Key from e.g. (kind, model, prompt, job content hash); prompt edits invalidate old entries."""
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Any:
+        """Return the cached result for key, or None if missing or expired."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT value, ts FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if not row:
+                return None
+            value, ts = row
+            if time.time() - ts > self.ttl_seconds:
+                self.conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self.conn.commit()
+                return None
+        return json_loads(value)
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, ts) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time())
+            )
+            self.conn.commit()
+
+
+def open_llm_cache() -> Optional[LLMResultCache]:
+    """Open the LLM result cache, or return None (uncached) if SQLite is unavailable."""
+    try:
+        return LLMResultCache()
+    except sqlite3.Error as e:
+        click.secho(f"   [WARN] LLM cache unavailable, running without it: {e}", fg="yellow")
+        return None
+
+
 # =============================================================================
 # LANGCHAIN CHAINS
 # =============================================================================
@@ -1314,33 +2011,71 @@ class AnyMailFinderClient:
 class JobFilterChain:
     """LangChain chain for filtering jobs based on fit"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[LLMResultCache] = None):
+        self.cache = cache or open_llm_cache()
         self.llm = ChatOpenAI(
             model="gpt-4o-mini",
-            temperature=0.7,
+            temperature=config.FILTER_TEMPERATURE,
             api_key=config.OPENAI_API_KEY
         )
         
-        self.prompt = ChatPromptTemplate.from_messages([
-            SystemMessagePromptTemplate.from_template(JOB_FILTER_SYSTEM_PROMPT),
-            HumanMessagePromptTemplate.from_template(JOB_FILTER_USER_PROMPT)
-        ])
+        # Pre-split prompt instead of a ChatPromptTemplate parse per job
+        self.prompt = RunnableLambda(render_filter_messages)
         
         self.chain = self.prompt | self.llm | JsonOutputParser()
     
     def filter_job(self, job: Dict) -> bool:
-        """Return True if job is a good fit"""
-        try:
-            job_description = json.dumps(job, indent=2)
-            result = self.chain.invoke({"job_description": job_description})
-            verdict = result.get("verdict") if isinstance(result, dict) else None
-            if not verdict:
-                print(f"LLM filter returned unexpected response: {result}")
-                return False
-            return str(verdict).lower() == "true"
-        except Exception as e:
-            print(f"Error filtering job: {e}")
-            return False
+        """Return True if job is a good fit (callers apply passes_prefilter first)"""
+        return self.filter_jobs([job])[0]
+
+    def filter_jobs(self, jobs: List[Dict]) -> List[bool]:
+        """
+        Fit verdict per job, with up to FILTER_CONCURRENCY LLM calls in flight.
+        Jobs whose content was judged before (e.g. reposts) are answered from the cache.
+        """
+        if not jobs:
+            return []
+        verdicts: List[Optional[bool]] = [None] * len(jobs)
+        keys = [self._cache_key(job) for job in jobs] if self.cache else []
+        if self.cache:
+            for i, key in enumerate(keys):
+                verdicts[i] = self.cache.get(key)
+            hits = len(jobs) - verdicts.count(None)
+            if hits:
+                print(f"   [INFO] {hits} fit verdicts served from cache")
+
+        misses = [i for i, verdict in enumerate(verdicts) if verdict is None]
+        if misses:
+            results = self.chain.batch(
+                [{"job_description": job_to_json(jobs[i])} for i in misses],
+                config={"max_concurrency": max(1, config.FILTER_CONCURRENCY)},
+                return_exceptions=True
+            )
+            for i, result in zip(misses, results):
+                verdict = self._verdict(result)
+                # Failed calls count as "no fit" this run but are not cached
+                if verdict is not None and self.cache:
+                    self.cache.set(keys[i], verdict)
+                verdicts[i] = bool(verdict)
+        return verdicts
+
+    def _cache_key(self, job: Dict) -> str:
+        return LLMResultCache.make_key(
+            "filter", self.llm.model_name, str(self.llm.temperature),
+            JOB_FILTER_SYSTEM_PROMPT, JOB_FILTER_USER_PROMPT, job_content_hash(job)
+        )
+
+    @staticmethod
+    def _verdict(result: Any) -> Optional[bool]:
+        """Parsed verdict, or None when the call failed or the response was unusable."""
+        if isinstance(result, Exception):
+            print(f"Error filtering job: {result}")
+            return None
+        verdict = result.get("verdict") if isinstance(result, dict) else None
+        if not verdict:
+            print(f"LLM filter returned unexpected response: {result}")
+            return None
+        return str(verdict).lower() == "true"
 
 
 # =============================================================================
@@ -1358,9 +2093,12 @@ class HybridContentGenerator:
     - Templates: LaTeX formatting (how to say it)
     """
 
+    # Everything before {job_description} is identical for every job in a run, so
+    # the per-job part goes last and OpenAI's automatic prompt caching can reuse
+    # the long shared prefix (rules + background data + schema) across calls.
     CONTENT_GENERATION_PROMPT = """You are an expert resume content generator for internship applications.
 
-Your task: Analyze this job description and the candidate's background, then select and tailor the MOST COMPELLING content for this specific role.
+Your task: Analyze the job description at the end and the candidate's background, then select and tailor the MOST COMPELLING content for this specific role.
 
 **Critical Rules:**
 1. Return ONLY valid JSON (no markdown, no code fences, no LaTeX, no explanation)
@@ -1370,9 +2108,6 @@ Your task: Analyze this job description and the candidate's background, then sel
 5. Reorder skills to put job-matching technologies FIRST
 6. Use EXACT terminology from the job description (e.g., if JD says "React.js", use "React.js")
 
-**Job Description:**
-{job_description}
-
 **Candidate Background Data:**
 {resume_data}
 
@@ -1442,10 +2177,14 @@ Your task: Analyze this job description and the candidate's background, then sel
 - Include 3-4 bullets per experience, 2 bullets per project
 - Escape special characters: & becomes \\&, % becomes \\%
 - Use -- for date ranges (not -)
-- Return ONLY the JSON object, nothing else"""
+- Return ONLY the JSON object, nothing else
 
-    def __init__(self):
+**Job Description:**
+{job_description}"""
+
+    def __init__(self, cache: Optional[LLMResultCache] = None):
         try:
+            self.cache = cache or open_llm_cache()
             self.llm = ChatOpenAI(
                 model="gpt-4o",
                 temperature=0.7,  # Creative but controlled
@@ -1471,7 +2210,15 @@ Your task: Analyze this job description and the candidate's background, then sel
             JSON dict with experiences, projects, skills, education_bullets
         """
         try:
-            job_description = json.dumps(job, indent=2)
+            cache_key = LLMResultCache.make_key(
+                "content", self.llm.model_name, self.CONTENT_GENERATION_PROMPT, resume_data, job_content_hash(job)
+            )
+            cached = self.cache.get(cache_key) if self.cache else None
+            if cached:
+                click.secho("   [OK] Reused tailored content from cache (same posting seen before)", fg="green")
+                return cached
+
+            job_description = job_to_json(job)
             content = self.chain.invoke({
                 "job_description": job_description,
                 "resume_data": resume_data
@@ -1488,6 +2235,8 @@ Your task: Analyze this job description and the candidate's background, then sel
             num_proj = len(content.get("projects", []))
             click.secho(f"   [OK] Generated tailored content: {num_exp} experiences, {num_proj} projects", fg="green")
 
+            if self.cache:
+                self.cache.set(cache_key, content)
             return content
 
         except Exception as e:
@@ -1501,6 +2250,29 @@ class ATSScorer:
     Provides objective quality metrics before submission.
     """
 
+    # Common technical keywords to look for (lowercase; matched as substrings)
+    TECH_KEYWORDS = (
+        # Languages
+        "python", "javascript", "typescript", "java", "c++", "c#", "go", "rust",
+        "sql", "html", "css", "bash", "shell",
+        # Frameworks
+        "react", "react.js", "next.js", "nextjs", "node.js", "nodejs", "express",
+        "fastapi", "django", "flask", "spring", "angular", "vue", "svelte",
+        "tailwind", "tailwindcss",
+        # Databases
+        "postgresql", "postgres", "mysql", "mongodb", "redis", "sqlite",
+        "dynamodb", "cassandra", "elasticsearch",
+        # Tools/Platforms
+        "docker", "kubernetes", "k8s", "aws", "azure", "gcp", "linux", "git",
+        "github", "gitlab", "jenkins", "ci/cd", "terraform", "ansible",
+        # AI/ML
+        "machine learning", "ml", "ai", "deep learning", "pytorch", "tensorflow",
+        "langchain", "openai", "llm", "nlp", "computer vision",
+        # Concepts
+        "rest", "restful", "api", "microservices", "agile", "scrum",
+        "tdd", "testing", "unit test", "integration test"
+    )
+
     def __init__(self):
         self.initialized = True
         print("   [INFO] ATSScorer initialized")
@@ -1539,7 +2311,7 @@ class ATSScorer:
             missing = []
 
             for keyword in job_keywords:
-                if keyword.lower() in resume_lower:
+                if keyword in resume_lower:
                     matched.append(keyword)
                 else:
                     missing.append(keyword)
@@ -1580,37 +2352,8 @@ class ATSScorer:
 
     def _extract_keywords(self, job_description: str) -> List[str]:
         """Extract important keywords from job description."""
-        # Common technical keywords to look for
-        tech_keywords = [
-            # Languages
-            "python", "javascript", "typescript", "java", "c++", "c#", "go", "rust",
-            "sql", "html", "css", "bash", "shell",
-            # Frameworks
-            "react", "react.js", "next.js", "nextjs", "node.js", "nodejs", "express",
-            "fastapi", "django", "flask", "spring", "angular", "vue", "svelte",
-            "tailwind", "tailwindcss",
-            # Databases
-            "postgresql", "postgres", "mysql", "mongodb", "redis", "sqlite",
-            "dynamodb", "cassandra", "elasticsearch",
-            # Tools/Platforms
-            "docker", "kubernetes", "k8s", "aws", "azure", "gcp", "linux", "git",
-            "github", "gitlab", "jenkins", "ci/cd", "terraform", "ansible",
-            # AI/ML
-            "machine learning", "ml", "ai", "deep learning", "pytorch", "tensorflow",
-            "langchain", "openai", "llm", "nlp", "computer vision",
-            # Concepts
-            "rest", "restful", "api", "microservices", "agile", "scrum",
-            "tdd", "testing", "unit test", "integration test"
-        ]
-
         job_lower = job_description.lower()
-        found_keywords = []
-
-        for keyword in tech_keywords:
-            if keyword in job_lower:
-                found_keywords.append(keyword)
-
-        return found_keywords
+        return [keyword for keyword in self.TECH_KEYWORDS if keyword in job_lower]
 
     def _score_format(self, resume_text: str) -> int:
         """Score resume format/structure (0-100)."""
@@ -1939,6 +2682,10 @@ class ContentSelector:
             return skills
 
 
+# Unescaped LaTeX specials handled by LaTeXBuilder.escape_latex
+_LATEX_SPECIAL_RE = re.compile(r'(?<!\\)([&%$#_])')
+
+
 class LaTeXBuilder:
     """Builds complete LaTeX resume from components with proper escaping."""
 
@@ -1948,19 +2695,8 @@ class LaTeXBuilder:
         if not text:
             return ""
         # Don't double-escape already-escaped characters
-        # Only escape raw special characters: & % $ # _ { } ~ ^
-        replacements = {
-            '&': r'\&',
-            '%': r'\%',
-            '$': r'\$',
-            '#': r'\#',
-            '_': r'\_',
-        }
-        result = text
-        for char, escaped in replacements.items():
-            # Only replace if not already escaped
-            result = re.sub(f'(?<!\\\\){re.escape(char)}', escaped, result)
-        return result
+        # Only escape raw special characters: & % $ # _ (one pass)
+        return _LATEX_SPECIAL_RE.sub(r'\\\1', text)
 
     def build_resume(
         self,
@@ -2193,6 +2929,54 @@ class HybridResumeGenerator:
             return ""
 
 
+# =============================================================================
+# PER-JOB OUTPUT BUFFERING
+# =============================================================================
+
+class JobOutputBuffer:
+    """
+    sys.stdout stand-in for concurrent job workers: print/click.secho output from a
+    thread inside captured() is held in memory and written as one block when its job
+    ends, so lines from different jobs never interleave. Other threads write through.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def write(self, text: str) -> int:
+        if not isinstance(text, str):
+            # Text-only, like sys.stdout (click probes with bytes to pick its writer)
+            raise TypeError(f"write() argument must be str, not {type(text).__name__}")
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is not None:
+            buffer.append(text)
+            return len(text)
+        with self._lock:
+            return self._stream.write(text)
+
+    def flush(self):
+        if getattr(self._local, "buffer", None) is None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        # isatty, encoding, fileno, ... come from the real stream (keeps click's colours)
+        return getattr(self._stream, name)
+
+    @contextmanager
+    def captured(self):
+        self._local.buffer = []
+        try:
+            yield
+        finally:
+            text = "".join(self._local.buffer)
+            self._local.buffer = None
+            with self._lock:
+                self._stream.write(text)
+                self._stream.flush()
+
+
 # =============================================================================
 # MAIN PIPELINE
 # =============================================================================
@@ -2227,6 +3011,9 @@ class JobApplicationPipeline:
         self.apify_client = ApifyClient(config.APIFY_API_KEY)
         self.github_client = GitHubClient(config.GITHUB_TOKEN, config.GITHUB_REPO)
         self.email_finder = AnyMailFinderClient(config.ANYMAILFINDER_API_KEY)
+        # One pool for every job's decision-maker lookup (at most one per job in flight)
+        self._lookup_pool = ThreadPoolExecutor(max_workers=max(1, config.JOB_CONCURRENCY),
+                                               thread_name_prefix="email-lookup")
         
         # Initialize LangChain components
         self.job_filter = JobFilterChain()
@@ -2235,17 +3022,23 @@ class JobApplicationPipeline:
 
         # State
         self.applied_job_ids: set = set()
+        self.has_legacy_job_keys: bool = False
+        self._pending_rows: List[Dict] = []  # Tracking-sheet rows awaiting flush_sheet_rows
+        self._pending_lock = threading.Lock()
+        self._failure_log_lock = threading.Lock()  # compilation_failures.csv is appended from job threads
         self.resume_template: str = ""  # Kept for compatibility, not used anymore
     
     def load_applied_jobs(self) -> None:
         """Load already-applied job IDs from Google Sheets"""
         print("[INFO] Loading already-applied jobs...")
-        rows = self.sheets_client.read_sheet(config.GOOGLE_SHEETS_ID)
-        self.applied_job_ids = set()
-        for row in rows:
-            key = row.get('JobKey') or row.get('JobID') or ""
-            if key:
-                self.applied_job_ids.add(str(key))
+        # Only the two key columns are fetched; one set serves every lookup below
+        columns = self.sheets_client.read_columns(config.GOOGLE_SHEETS_ID, ["JobKey", "JobID"])
+        job_keys = {key for key in columns.get("JobKey", []) if key}
+        job_ids = {job_id for job_id in columns.get("JobID", []) if job_id}
+        # Stored as 64-bit fingerprints: far smaller than the strings for long seen-lists
+        self.applied_job_ids = {dedup_id(key) for key in job_keys | job_ids}
+        # Older rows hold slug keys; only then is the slower legacy key worth computing
+        self.has_legacy_job_keys = any(not _HASHED_JOB_KEY_RE.fullmatch(k) for k in job_keys)
         print(f"   Found {len(self.applied_job_ids)} previously applied jobs")
     
     def load_resume_template(self) -> None:
@@ -2256,42 +3049,102 @@ class JobApplicationPipeline:
             raise ValueError(f"Resume template not found: {template_path}")
         click.secho(f"   [OK] Template file verified: {template_path}", fg="green")
     
-    def scrape_jobs(self) -> List[Dict]:
-        """Scrape jobs from LinkedIn via Apify"""
+    def start_scrape(self) -> Optional[Dict]:
+        """Kick off the Apify run so LinkedIn is scraped while the rest of startup finishes"""
+        print("[INFO] Starting LinkedIn scrape...")
+        try:
+            return self.apify_client.start_linkedin_run(config.LINKEDIN_SEARCH_URL)
+        except (requests.RequestException, KeyError, ValueError) as e:
+            print(f"Error scraping LinkedIn: {e}")
+            return None
+    
+    def scrape_jobs(self, run: Optional[Dict] = None) -> Iterator[Dict]:
+        """Scrape jobs from LinkedIn via Apify (streamed; consumed by filter_duplicates)"""
         print("[INFO] Scraping LinkedIn jobs...")
-        jobs = self.apify_client.scrape_linkedin_jobs(config.LINKEDIN_SEARCH_URL)
-        if not jobs:
-            click.secho("   [WARN] No jobs returned from Apify. Check search URL or API status.", fg="yellow")
-        else:
-            print(f"   Found {len(jobs)} jobs")
-        return jobs
+        return self.apify_client.iter_linkedin_jobs(config.LINKEDIN_SEARCH_URL, run=run)
     
-    def filter_duplicates(self, jobs: List[Dict]) -> List[Dict]:
-        """Filter out already-applied jobs"""
+    def filter_duplicates(self, jobs: Iterable[Dict]) -> List[Dict]:
+        """
+        Filter out already-applied jobs and title-prefilter rejects as rows
+        stream in; only survivors are kept in memory.
+        """
         print("[INFO] Filtering duplicates...")
-        new_jobs = []
-        seen_in_run = set()
+        counts = {"scanned": 0, "prefiltered": 0}
+        new_jobs = list(self._iter_new_jobs(jobs, counts))
+        self._report_new_jobs(counts, len(new_jobs))
+        return new_jobs
+    
+    def screen_jobs(self, jobs: Iterable[Dict]) -> List[Dict]:
+        """
+        filter_duplicates followed by filter_by_fit, except that fit checks for each
+        chunk of survivors start while later Apify pages are still being scraped.
+        """
+        print("[INFO] Filtering duplicates (fit checks start as jobs arrive)...")
+        counts = {"scanned": 0, "prefiltered": 0}
+        chunk_size = max(1, config.FILTER_CONCURRENCY)
+        new_jobs, chunk, verdict_futures = [], [], []
+        # One worker keeps at most FILTER_CONCURRENCY LLM calls in flight
+        with ThreadPoolExecutor(max_workers=1) as fit_pool:
+            for job in self._iter_new_jobs(jobs, counts):
+                new_jobs.append(job)
+                chunk.append(job)
+                if len(chunk) == chunk_size:
+                    verdict_futures.append(fit_pool.submit(self.job_filter.filter_jobs, chunk))
+                    chunk = []
+            if chunk:
+                verdict_futures.append(fit_pool.submit(self.job_filter.filter_jobs, chunk))
+            self._report_new_jobs(counts, len(new_jobs))
+            verdicts = [fits for future in verdict_futures for fits in future.result()]
+        return self.filter_by_fit(new_jobs, verdicts)
+    
+    def _iter_new_jobs(self, jobs: Iterable[Dict], counts: Dict[str, int]) -> Iterator[Dict]:
+        """Yield jobs that are neither already applied to, repeated in this run, nor prefiltered."""
+        # One set answers "applied before" and "seen this run"; prefilter rejects are
+        # recorded too, which is harmless since they would be rejected again
+        seen = self.applied_job_ids
+        make_key, fingerprint = build_job_key, dedup_id
+        check_legacy = self.has_legacy_job_keys
         for j in jobs:
-            job_key = build_job_key(j)
+            counts["scanned"] += 1
+            job_key = make_key(j)
             j['jobKey'] = job_key
-            if job_key and job_key not in self.applied_job_ids and job_key not in seen_in_run:
-                new_jobs.append(j)
-                seen_in_run.add(job_key)
-                self.applied_job_ids.add(job_key)
-        print(f"   {len(new_jobs)} new jobs after deduplication")
-        return new_jobs
+            key_id = fingerprint(job_key)
+            if key_id in seen:
+                continue
+            # Rows without a JobKey are matched on the Apify job id
+            job_id = str(j.get('id') or '')
+            if job_id and fingerprint(job_id) in seen:
+                continue
+            if check_legacy and fingerprint(legacy_job_key(j)) in seen:
+                continue
+            seen.add(key_id)
+            if not passes_prefilter(j):
+                counts["prefiltered"] += 1
+                continue
+            yield j
+    
+    @staticmethod
+    def _report_new_jobs(counts: Dict[str, int], kept: int) -> None:
+        if not counts["scanned"]:
+            click.secho("   [WARN] No jobs returned from Apify. Check search URL or API status.", fg="yellow")
+        else:
+            print(f"   Found {counts['scanned']} jobs")
+        print(f"   {kept} new jobs after deduplication ({counts['prefiltered']} rejected by title prefilter)")
     
-    def filter_by_fit(self, jobs: List[Dict]) -> List[Dict]:
-        """Filter jobs using AI to check fit"""
+    def filter_by_fit(self, jobs: List[Dict], verdicts: Optional[List[bool]] = None) -> List[Dict]:
+        """Filter jobs using AI to check fit (verdicts may be precomputed by screen_jobs)"""
         print("[INFO] AI-filtering jobs for fit...")
         matching_jobs = []
         
-        for i, job in enumerate(jobs):
+        # All fit checks run concurrently; decisions are logged in job order
+        if verdicts is None:
+            verdicts = self.job_filter.filter_jobs(jobs)
+        for i, (job, fits) in enumerate(zip(jobs, verdicts)):
             company = job.get('companyName', 'Unknown')
             title = job.get('title', 'Unknown')
             domain = extract_domain(job.get('companyWebsite', ''))
             
-            if self.job_filter.filter_job(job):
+            if fits:
                 job['companyDomain'] = domain
                 matching_jobs.append(job)
                 if domain:
@@ -2323,7 +3176,7 @@ class JobApplicationPipeline:
             return None
         
         # 2. Generate file paths (same base name for both .tex and .pdf)
-        tex_file_path = generate_file_path(company, title, posted_at)
+        tex_file_path = generate_file_path(company, title, posted_at, job_key)
         base_name = Path(tex_file_path).stem
         pdf_file_path = tex_file_path.replace('/tex/', '/pdf/').replace('.tex', '.pdf')
 
@@ -2332,13 +3185,15 @@ class JobApplicationPipeline:
         compile_result = compile_latex_to_pdf(latex, base_name)
         if compile_result is None:
             # Log compilation failure to CSV for tracking
+            # (locked: concurrent jobs would race on the header and interleave rows)
             failure_log = Path("compilation_failures.csv")
-            if not failure_log.exists():
-                failure_log.write_text("timestamp,company,title,tex_file\n", encoding='utf-8')
+            with self._failure_log_lock:
+                if not failure_log.exists():
+                    failure_log.write_text("timestamp,company,title,tex_file\n", encoding='utf-8')
 
-            with open(failure_log, "a", encoding='utf-8') as f:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                f.write(f"{timestamp},{company},{title},{tex_file_path}\n")
+                with open(failure_log, "a", encoding='utf-8') as f:
+                    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    f.write(f"{timestamp},{company},{title},{tex_file_path}\n")
 
             click.secho("   [ERROR] Failed to compile LaTeX to PDF - skipping GitHub push", fg="red")
             return None
@@ -2349,7 +3204,7 @@ class JobApplicationPipeline:
         # 4. ATS Scoring (NEW - score resume before proceeding)
         print("   [INFO] Scoring resume with ATS simulator...")
         resume_text = extract_pdf_text(pdf_bytes)
-        job_desc_str = json.dumps(job, indent=2)
+        job_desc_str = job_to_json(job)
         ats_scores = self.ats_scorer.score_resume(resume_text, job_desc_str)
 
         print(f"   [INFO] ATS Score: {ats_scores['overall_score']}/100 ({ats_scores['recommendation']})")
@@ -2374,32 +3229,34 @@ class JobApplicationPipeline:
             click.secho(f"   [ERROR] Failed to save .tex locally: {e}", fg="red")
             return None
 
-        # 5. Upload .pdf file to GitHub (needed for slide links)
+        # Start the decision-maker lookup now so it overlaps the upload below.
+        # Not earlier: jobs rejected by compilation, ATS or the local save never spend a lookup.
+        domain = job.get('companyDomain') or extract_domain(job.get('companyWebsite', ''))
+        email_lookup = None
+        if domain:
+            email_lookup = self._lookup_pool.submit(self.email_finder.find_decision_maker, domain)
+
+        # 5. Upload .pdf to GitHub as a blob (needed for slide links); every job's
+        # PDF is committed together by flush_batched_writes, before slides and rows
         print("   [INFO] Uploading .pdf to GitHub...")
-        pdf_response = self.github_client.upload_binary_file(
-            pdf_file_path,
-            pdf_bytes,
-            f"Add compiled PDF for {company} - {title}"
-        )
-        if pdf_response.get('message') or not pdf_response.get('content'):
-            click.secho(f"   [ERROR] Failed to upload .pdf file: {pdf_response.get('message', 'No content returned')}", fg="red")
+        if not self.github_client.stage_file(pdf_file_path, pdf_bytes, f"{company} - {title}"):
+            click.secho("   [ERROR] Failed to upload .pdf file", fg="red")
+            if email_lookup:
+                email_lookup.cancel()  # Skips the lookup if it is still queued behind other jobs
             return None
-        click.secho(f"   [OK] Uploaded: {pdf_file_path}", fg="green")
+        click.secho(f"   [OK] Uploaded: {pdf_file_path} (committed with the batch)", fg="green")
 
-        # PDF URL is available immediately (no waiting needed!)
-        pdf_url = f"https://raw.githubusercontent.com/{config.GITHUB_REPO}/main/{pdf_file_path}"
-        print(f"   [INFO] PDF ready: {pdf_url}")
+        # Raw URL is known up front; it resolves once the batch commit lands
+        pdf_url = self.github_client.raw_url(pdf_file_path)
+        print(f"   [INFO] PDF URL: {pdf_url}")
 
-        # 6. Create Google Slide
-        print("   [INFO] Creating presentation slide...")
-        slide_created = self.slides_client.create_job_slide(config.GOOGLE_SLIDES_ID, job, pdf_url)
-        if not slide_created:
-            click.secho("   [WARN] Slide creation failed but continuing with remaining steps...", fg="yellow")
+        # 6. Queue Google Slide (created with every other job's slide by flush_batched_writes)
+        self.slides_client.queue_job_slide(job, pdf_url)
+        print("   [INFO] Queued presentation slide")
 
-        # 7. Find decision-maker email
+        # 7. Collect the decision-maker email lookup started after ATS scoring
         print("   [INFO] Finding decision-maker email...")
-        domain = job.get('companyDomain') or extract_domain(job.get('companyWebsite', ''))
-        email_result = self.email_finder.find_decision_maker(domain) if domain else {}
+        email_result = email_lookup.result() if email_lookup else {}
         email = email_result.get('valid_email', '')
         person_name = email_result.get('person_full_name', '')
         person_title = email_result.get('person_job_title', '')
@@ -2410,8 +3267,8 @@ class JobApplicationPipeline:
         else:
             click.secho("   [WARN] No email found", fg="yellow")
 
-        # 9. Append to Google Sheets (with ATS metrics + email outreach fields)
-        print("   [INFO] Appending to tracking sheet...")
+        # 9. Queue the tracking-sheet row (with ATS metrics + email outreach fields);
+        # run() appends every queued row in one call via flush_sheet_rows
         row_values = {
             # Core fields (matching spreadsheet headers)
             "Email": email,
@@ -2422,6 +3279,7 @@ class JobApplicationPipeline:
             "ResumePdfUrl": pdf_url,
             "ApplyLink": job.get('applyUrl', ''),
             "JobID": str(job.get('id', '')),
+            "JobKey": job_key,
             "JobDescription": job.get('descriptionHtml', ''),  # Full description, no truncation
             # New fields for email outreach
             "CompanyName": job.get('companyName', ''),
@@ -2436,7 +3294,9 @@ class JobApplicationPipeline:
             "LastEmailSentAt": "",     # Timestamp of most recent email
             "NextFollowUpDate": "",    # When to send next follow-up
         }
-        self.sheets_client.append_row_dict(config.GOOGLE_SHEETS_ID, row_values)
+        with self._pending_lock:
+            self._pending_rows.append(row_values)
+        print("   [INFO] Queued row for tracking sheet")
 
         return {
             'job': job,
@@ -2447,35 +3307,96 @@ class JobApplicationPipeline:
             'ats_scores': ats_scores
         }
     
+    def flush_batched_writes(self) -> None:
+        """Commit staged PDFs, then create queued slides and append queued sheet rows (one API call each)."""
+        self.flush_uploads()
+        self.flush_slides()
+        self.flush_sheet_rows()
+
+    def flush_uploads(self) -> None:
+        """
+        Commit every staged PDF in one GitHub commit. Slides and rows of jobs whose
+        PDF could not be committed are dropped, as a failed upload always did.
+        """
+        failed = self.github_client.commit_staged("Add compiled PDFs")
+        if not failed:
+            return
+        click.secho(f"   [ERROR] {len(failed)} PDFs could not be committed; dropping their slides and rows", fg="red")
+        failed_urls = {self.github_client.raw_url(path) for path in failed}
+        self.slides_client.discard_queued(failed_urls)
+        with self._pending_lock:
+            self._pending_rows = [row for row in self._pending_rows if row.get("ResumePdfUrl") not in failed_urls]
+
+    def flush_slides(self) -> None:
+        """Create every queued job slide with one Slides batchUpdate."""
+        self.slides_client.flush(config.GOOGLE_SLIDES_ID)
+
+    def flush_sheet_rows(self) -> None:
+        """Append every queued tracking row to the sheet with one API call."""
+        with self._pending_lock:
+            rows, self._pending_rows = self._pending_rows, []
+        if not rows:
+            return
+        print(f"\n[INFO] Appending {len(rows)} rows to tracking sheet...")
+        if self.sheets_client.append_rows_batch(config.GOOGLE_SHEETS_ID, rows):
+            click.secho(f"   [OK] Appended {len(rows)} rows", fg="green")
+        else:
+            click.secho(f"   [ERROR] Failed to append {len(rows)} rows to tracking sheet", fg="red")
+
+    def process_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Run process_job for every job on a pool of JOB_CONCURRENCY threads
+        (each job mostly waits on OpenAI, GitHub, Slides and AnyMailFinder).
+        Results keep job order; a failing job does not stop the others.
+        """
+        outcomes: List[Optional[Dict]] = [None] * len(jobs)
+        output = JobOutputBuffer(sys.stdout)
+
+        def process_buffered(job: Dict) -> Optional[Dict]:
+            with output.captured():
+                return self.process_job(job)
+
+        sys.stdout = output
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, config.JOB_CONCURRENCY)) as ex:
+                futures = {ex.submit(process_buffered, job): i for i, job in enumerate(jobs)}
+                for done, future in enumerate(as_completed(futures), 1):
+                    try:
+                        outcomes[futures[future]] = future.result()
+                    except Exception as e:
+                        click.secho(f"   [ERROR] {e}", fg="red")
+                    print(f"\n[{done}/{len(jobs)}] jobs finished")
+        finally:
+            sys.stdout = output._stream
+        return [result for result in outcomes if result]
+
     def run(self, max_jobs: int = None) -> List[Dict]:
         """Run the entire pipeline"""
         click.secho("\n" + "="*60, fg="blue")
         click.secho("STARTING JOB APPLICATION PIPELINE", fg="blue", bold=True)
         click.secho("="*60 + "\n", fg="blue")
         
-        # Initialize
-        self.load_applied_jobs()
-        self.load_resume_template()
+        # Initialize; the sheet read, template check and Apify run start are independent
+        with ThreadPoolExecutor(max_workers=3) as startup:
+            applied = startup.submit(self.load_applied_jobs)
+            template = startup.submit(self.load_resume_template)
+            scrape_run = startup.submit(self.start_scrape)
+            applied.result()
+            template.result()
+            scrape_run = scrape_run.result()
         
         # Scrape and filter
-        jobs = self.scrape_jobs()
-        jobs = self.filter_duplicates(jobs)
-        jobs = self.filter_by_fit(jobs)
+        jobs = self.screen_jobs(self.scrape_jobs(scrape_run) if scrape_run else iter(()))
         
         if max_jobs:
             jobs = jobs[:max_jobs]
         
-        # Process each job
-        results = []
-        for i, job in enumerate(jobs):
-            print(f"\n[{i+1}/{len(jobs)}] Processing job...")
-            try:
-                result = self.process_job(job)
-                if result:
-                    results.append(result)
-            except Exception as e:
-                click.secho(f"   [ERROR] {e}", fg="red")
-                continue
+        # Process jobs concurrently (each stage is I/O bound on a different service);
+        # queued sheet rows are written even if processing stops early
+        try:
+            results = self.process_jobs(jobs)
+        finally:
+            self.flush_batched_writes()
         
         # Summary
         click.secho("\n" + "="*60, fg="blue")
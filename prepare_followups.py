@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Overnight Follow-Up Preparation
+===============================
+Generates tomorrow's follow-up emails through the OpenAI Batch API (half the
+price of live requests, results within 24h) so the morning outreach run only
+has to generate initial emails in real time.
+
+Each run:
+- Collects a previously submitted batch that the morning outreach run could
+  not collect yet (email_outreach_flow.py collects first thing each morning)
+- Submits a new batch for follow-ups due tomorrow that have nothing prepared yet
+
+Drafts are only stored on rows still due for the same follow-up; follow-ups
+whose batch has not finished by the morning are generated live by
+email_outreach_flow.py as before.
+
+Schedule: Nightly, well before the 8:30am outreach run.
+
+Run manually:
+    .venv/bin/python prepare_followups.py
+"""
+
+import io
+from datetime import datetime, timedelta
+
+import click
+
+from email_outreach_flow import (
+    EmailGenerator,
+    GoogleSheetsClient,
+    collect_followup_batch,
+    config,
+    json_dumps,
+    load_followup_batch_state,
+    prepared_email_for,
+    save_followup_batch_state,
+)
+
+
+# =============================================================================
+# SUBMIT
+# =============================================================================
+
+def submit_batch(email_gen: EmailGenerator, sheets: GoogleSheetsClient):
+    """Submit one Batch API job covering every follow-up due tomorrow."""
+    tomorrow = datetime.now().date() + timedelta(days=1)
+    classified = sheets.classify_rows(config.GOOGLE_SHEETS_ID, as_of=tomorrow)
+
+    lines = []
+    rows = {}
+    for email_type in ('followup_2', 'followup_1'):
+        for job_data in classified[email_type]:
+            if prepared_email_for(job_data, email_type):
+                continue
+            custom_id = f"{job_data['_row_number']}:{email_type}"
+            # Snapshot of what made this row due; collection skips rows that moved on
+            rows[custom_id] = {
+                "email": job_data.get("Email", "").strip().lower(),
+                "status": job_data.get("EmailStatus", "").strip().lower(),
+                "count": str(job_data.get("EmailCount", "")).strip(),
+            }
+            lines.append(json_dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": email_gen.chat_request(job_data, email_type)
+            }))
+
+    if not lines:
+        click.secho("[OK] No follow-ups to prepare for tomorrow.", fg="green")
+        return
+
+    payload = io.BytesIO("\n".join(lines).encode("utf-8"))
+    input_file = email_gen.client.files.create(file=("followups.jsonl", payload), purpose="batch")
+    batch = email_gen.client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    save_followup_batch_state({"batch_id": batch.id, "as_of": tomorrow.isoformat(), "rows": rows})
+    click.secho(f"[OK] Submitted batch {batch.id} with {len(lines)} follow-ups", fg="green")
+
+
+def run_prepare_followups():
+    print("=" * 70)
+    print(f"PREPARE FOLLOW-UPS - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 70)
+
+    sheets = GoogleSheetsClient()
+    email_gen = EmailGenerator()
+
+    state = load_followup_batch_state()
+    if state and not collect_followup_batch(email_gen, sheets, state):
+        return
+
+    submit_batch(email_gen, sheets)
+
+
+if __name__ == "__main__":
+    run_prepare_followups()
@@ -9,19 +9,25 @@ echo "Installing email outreach systemd timer..."
 # Copy service and timer files
 sudo cp email-outreach.service /etc/systemd/system/
 sudo cp email-outreach.timer /etc/systemd/system/
+sudo cp prepare-followups.service /etc/systemd/system/
+sudo cp prepare-followups.timer /etc/systemd/system/
 
 # Set correct permissions
 sudo chmod 644 /etc/systemd/system/email-outreach.service
 sudo chmod 644 /etc/systemd/system/email-outreach.timer
+sudo chmod 644 /etc/systemd/system/prepare-followups.service
+sudo chmod 644 /etc/systemd/system/prepare-followups.timer
 
 # Reload systemd
 sudo systemctl daemon-reload
 
 # Enable the timer (starts on boot)
 sudo systemctl enable email-outreach.timer
+sudo systemctl enable prepare-followups.timer
 
 # Start the timer now
 sudo systemctl start email-outreach.timer
+sudo systemctl start prepare-followups.timer
 
 echo ""
 echo "Installation complete!"
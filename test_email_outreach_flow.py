@@ -0,0 +1,363 @@
+import dataclasses
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+import email_outreach_flow as mod
+
+
+def _http_error(status):
+    return HttpError(httplib2.Response({"status": status}), b"")
+
+
+class FakeGmailService:
+    """Enough of the Gmail service for batched metadata gets; ids in fail_once/fail_always error out."""
+
+    def __init__(self, senders, fail_once=(), fail_always=()):
+        self.senders = senders
+        self.fail_once = set(fail_once)
+        self.fail_always = set(fail_always)
+        self.batches = []
+
+    def users(self):
+        return self
+
+    def messages(self):
+        return self
+
+    def get(self, userId, id, **kwargs):
+        return id
+
+    def new_batch_http_request(self, callback):
+        service = self
+
+        class Batch:
+            def __init__(self):
+                self.ids = []
+
+            def add(self, message_id, request_id=None):
+                self.ids.append(message_id)
+
+            def execute(self):
+                service.batches.append(list(self.ids))
+                for message_id in self.ids:
+                    if message_id in service.fail_always or message_id in service.fail_once:
+                        service.fail_once.discard(message_id)
+                        callback(message_id, None, _http_error(429))
+                    else:
+                        callback(message_id, {
+                            "internalDate": "1000",
+                            "payload": {"headers": [{"name": "From", "value": service.senders[message_id]}]}
+                        }, None)
+
+        return Batch()
+
+
+def _completion(payload):
+    """Chat completion response whose message content is the JSON of payload."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=mod.json_dumps(payload)))])
+
+
+class ColumnLetterTestCase(unittest.TestCase):
+    def test_col_to_letter_boundaries(self):
+        self.assertEqual(mod.col_to_letter(0), "A")
+        self.assertEqual(mod.col_to_letter(25), "Z")
+        self.assertEqual(mod.col_to_letter(26), "AA")
+        self.assertEqual(mod.col_to_letter(51), "AZ")
+        self.assertEqual(mod.col_to_letter(52), "BA")
+        self.assertEqual(mod.col_to_letter(701), "ZZ")
+        self.assertEqual(mod.col_to_letter(702), "AAA")
+
+
+class OriginalSubjectTestCase(unittest.TestCase):
+    def test_original_subject_strips_reply_prefix(self):
+        job = {"DraftedEmail": "Subject: Re: Interest in SWE Intern\n\nHi there", "JobTitle": "SWE Intern"}
+        self.assertEqual(mod.original_subject_for(job), "Interest in SWE Intern")
+
+    def test_original_subject_without_body(self):
+        job = {"DraftedEmail": "Subject: Interest in ML Intern", "JobTitle": "ML Intern"}
+        self.assertEqual(mod.original_subject_for(job), "Interest in ML Intern")
+
+    def test_original_subject_defaults_to_job_title(self):
+        self.assertEqual(mod.original_subject_for({"JobTitle": "Data Analyst"}), "Interest in Data Analyst")
+
+
+class SheetsBatchTestCase(unittest.TestCase):
+    def test_failed_flush_is_reported_and_requeued_under_newer_updates(self):
+        sheets = mock.Mock()
+        sheets.update_rows.side_effect = [False, True]
+        writes = mod.SheetsBatch(sheets, "sheet", flush_rows=10)
+        writes.queue(2, {"EmailStatus": "replied", "DraftedEmail": "old"})
+        self.assertFalse(writes.flush())
+        writes.queue(2, {"DraftedEmail": "new"})
+        self.assertTrue(writes.flush())
+        self.assertEqual(sheets.update_rows.call_args.args[1], {2: {"EmailStatus": "replied", "DraftedEmail": "new"}})
+        self.assertEqual(writes.pending, {})
+
+
+class ClassifyRowsTestCase(unittest.TestCase):
+    def test_rows_are_split_by_status_count_and_due_date(self):
+        sheets = mod.GoogleSheetsClient.__new__(mod.GoogleSheetsClient)
+        columns = {
+            "_row_number": [2, 3, 4, 5, 6, 7],
+            "Email": ["a@x.com", "b@x.com", "c@x.com", "d@x.com", "", "f@x.com"],
+            "EmailStatus": ["Pending", "sent", "followed_up_1", "sent", "pending", "replied"],
+            "EmailCount": ["0", "1", "2", "1", "0", "1"],
+            "LastEmailSentAt": ["", "2024-03-01 09:00:00", "2024-02-20 09:00:00", "2024-03-03 09:00:00", "", "2024-03-01"],
+            "_last_sent_date": ["", "2024-03-01", "2024-02-20", "2024-03-03", "", "2024-03-01"],
+        }
+        with mock.patch.object(sheets, "get_columns", return_value=columns):
+            classified = sheets.classify_rows("sheet", as_of=mod.date(2024, 3, 4))
+
+        def rows(key):
+            return [row["_row_number"] for row in classified[key]]
+        self.assertEqual(rows("pending"), [2])
+        self.assertEqual(rows("followup_1"), [3])       # row 5 was emailed too recently
+        self.assertEqual(rows("followup_2"), [4])
+        self.assertEqual(rows("active"), [3, 4, 5])
+
+
+class PromptCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "cache.sqlite3")
+
+    def test_entries_survive_reopening_until_they_expire(self):
+        key = mod.PromptCache.make_key("prompt", "gpt-4o-mini", 0.0)
+        cache = mod.PromptCache(self.path, ttl_days=7)
+        cache.set(key, {"subject": "Hi", "body": "Body"})
+        cache.conn.close()
+
+        reopened = mod.PromptCache(self.path, ttl_days=7)
+        self.assertEqual(reopened.get(key), {"subject": "Hi", "body": "Body"})
+        with mock.patch.object(mod.time, "time", return_value=mod.time.time() + 8 * 86400):
+            self.assertIsNone(reopened.get(key))
+        self.assertIsNone(reopened.get(key))
+
+    def test_key_covers_model_prompt_and_temperature(self):
+        key = mod.PromptCache.make_key("prompt", "gpt-4o-mini", 0.0)
+        self.assertEqual(key, mod.PromptCache.make_key("prompt", "gpt-4o-mini", 0.0))
+        self.assertNotEqual(key, mod.PromptCache.make_key("prompt", "gpt-4o-mini", 0.7))
+        self.assertNotEqual(key, mod.PromptCache.make_key("prompt", "gpt-4o", 0.0))
+        self.assertNotEqual(key, mod.PromptCache.make_key("prompt!", "gpt-4o-mini", 0.0))
+
+
+class FakeAsyncOpenAI:
+    """Async client whose batched call only covers the first job."""
+
+    def __init__(self, api_key=None):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=mock.AsyncMock(
+            return_value=_completion({"emails": [{"id": 0, "subject": "Batched", "body": "Batched body"}]})
+        )))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class GenerateAllTestCase(unittest.TestCase):
+    def test_jobs_missing_from_the_batch_are_generated_individually(self):
+        email_gen = mod.EmailGenerator.__new__(mod.EmailGenerator)
+        email_gen.cache = mod.PromptCache(":memory:")
+        email_gen.client = mock.Mock()
+        email_gen.client.chat.completions.create.return_value = _completion({"subject": "Single", "body": "Single body"})
+        jobs = [
+            {"_email_type": "initial", "CompanyName": "Acme", "JobTitle": "Engineer"},
+            {"_email_type": "initial", "CompanyName": "Globex", "JobTitle": "Analyst"},
+        ]
+
+        with mock.patch.object(mod, "AsyncOpenAI", FakeAsyncOpenAI), mock.patch("builtins.print"):
+            emails = email_gen.generate_all(jobs)
+
+        self.assertEqual([email["subject"] for email in emails], ["Batched", "Single"])
+        email_gen.client.chat.completions.create.assert_called_once()
+        # Both results are cached, so a second run makes no requests at all
+        email_gen.client.chat.completions.create.reset_mock()
+        with mock.patch.object(mod, "AsyncOpenAI", side_effect=AssertionError("no batch expected")), \
+                mock.patch("builtins.print"):
+            self.assertEqual(email_gen.generate_all(jobs), emails)
+        email_gen.client.chat.completions.create.assert_not_called()
+
+
+class SendManyTestCase(unittest.TestCase):
+    def test_throttled_sends_are_retried_and_other_failures_reported(self):
+        errors = [None, _http_error(429), _http_error(400)]
+
+        def new_batch_http_request(callback):
+            added = []
+            batch = mock.Mock()
+            batch.add.side_effect = lambda request, request_id: added.append(request_id)
+            batch.execute.side_effect = lambda: [
+                callback(request_id, None if error else {"id": request_id}, error)
+                for request_id, error in zip(added, errors)
+            ]
+            return batch
+
+        service = mock.Mock()
+        service.new_batch_http_request.side_effect = new_batch_http_request
+        gmail = mod.GmailSender()
+        messages = [(f"{n}@x.com", "Hi", "Body") for n in range(3)]
+        with mock.patch.object(mod.GmailSender, "service", new_callable=mock.PropertyMock, return_value=service), \
+                mock.patch.object(gmail, "send_email", return_value=True) as send_email, \
+                mock.patch("click.secho"):
+            self.assertEqual(gmail.send_many(messages), [True, True, False])
+        send_email.assert_called_once_with("1@x.com", "Hi", "Body", attempted=True)
+
+
+class ReplyDetectionTestCase(unittest.TestCase):
+    def setUp(self):
+        self.gmail = mod.GmailSender.__new__(mod.GmailSender)
+        sleep = mock.patch.object(mod.time, "sleep")
+        sleep.start()
+        self.addCleanup(sleep.stop)
+
+    def _with_service(self, service):
+        patcher = mock.patch.object(mod.GmailSender, "service", new_callable=mock.PropertyMock, return_value=service)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_rejected_gets_are_retried_once(self):
+        service = FakeGmailService({"m1": "A <a@x.com>", "m2": "b@y.com"}, fail_once={"m2"})
+        self._with_service(service)
+        senders, complete = self.gmail._message_senders(["m1", "m2", "m1"])
+        self.assertTrue(complete)
+        self.assertEqual(sorted(senders), [("a@x.com", 1000), ("b@y.com", 1000)])
+        self.assertEqual(service.batches, [["m1", "m2"], ["m2"]])
+
+    def test_unreadable_history_falls_back_without_losing_the_new_cursor(self):
+        service = FakeGmailService({"m1": "a@x.com", "m2": "b@y.com"}, fail_always={"m2"})
+        service.history = lambda: mock.Mock(list=mock.Mock(return_value=mock.Mock(execute=mock.Mock(return_value={
+            "historyId": "99",
+            "history": [{"messagesAdded": [{"message": {"id": "m1"}}, {"message": {"id": "m2"}}]}]
+        }))))
+        self._with_service(service)
+        with mock.patch.object(self.gmail, "_load_history_id", return_value="42"), mock.patch("click.secho"):
+            self.assertEqual(self.gmail.fetch_reply_senders(), (None, "99"))
+
+
+class OutreachCursorTestCase(unittest.TestCase):
+    """run_outreach_flow must only move the Gmail cursor once replies are safely recorded."""
+
+    def _run(self, reply_senders, update_ok, inbound=({}, True)):
+        row = {"_row_number": 2, "Email": "a@x.com", "_last_sent_date": "2024-01-01"}
+        sheets = mock.Mock()
+        sheets.classify_rows.return_value = {"active": [row], "followup_1": [], "followup_2": [], "pending": []}
+        sheets.update_rows.return_value = update_ok
+        gmail = mock.Mock()
+        gmail.fetch_reply_senders.return_value = (reply_senders, "99")
+        gmail.fetch_recent_inbound.return_value = inbound
+        with mock.patch.object(mod, "GoogleSheetsClient", return_value=sheets), \
+                mock.patch.object(mod, "EmailGenerator"), \
+                mock.patch.object(mod, "GmailSender", return_value=gmail), \
+                mock.patch.object(mod, "load_followup_batch_state", return_value=None), \
+                mock.patch("builtins.print"), mock.patch("click.secho"):
+            mod.run_outreach_flow()
+        return sheets, gmail
+
+    def test_cursor_saved_after_replies_are_written(self):
+        sheets, gmail = self._run({"a@x.com"}, update_ok=True)
+        sheets.update_rows.assert_called_once()
+        gmail.save_history_id.assert_called_once_with("99")
+
+    def test_cursor_kept_when_sheet_write_fails(self):
+        _, gmail = self._run({"a@x.com"}, update_ok=False)
+        gmail.save_history_id.assert_not_called()
+
+    def test_cursor_kept_when_fallback_search_is_incomplete(self):
+        _, gmail = self._run(None, update_ok=True, inbound=({}, False))
+        gmail.fetch_recent_inbound.assert_called_once()
+        gmail.save_history_id.assert_not_called()
+
+
+class SendOutreachTestCase(unittest.TestCase):
+    def setUp(self):
+        fast = dataclasses.replace(mod.config, MIN_DELAY_SECONDS=0, MAX_DELAY_SECONDS=0, SEND_BATCH_SIZE=1)
+        patcher = mock.patch.object(mod, "config", fast)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_one_crashing_worker_does_not_lose_the_others_results(self):
+        rows = [
+            {"_row_number": n, "Email": f"{n}@x.com", "EmailCount": "0", "_email_type": "initial",
+             "_prepared_email": {"subject": "Hi", "body": "Body"}}
+            for n in (2, 3)
+        ]
+
+        def send_many(messages):
+            if messages[0][0] == "2@x.com":
+                raise RuntimeError("connection reset")
+            return [True]
+
+        gmail = mock.Mock()
+        gmail.send_many.side_effect = send_many
+        sheets = mock.Mock()
+        sheets.update_rows.return_value = True
+        with mock.patch("builtins.print"), mock.patch("click.secho"):
+            counts = mod.asyncio.run(mod.send_outreach_emails(rows, sheets, gmail))
+
+        self.assertEqual(counts, (1, 1))
+        written = {}
+        for call in sheets.update_rows.call_args_list:
+            written.update(call.args[1])
+        self.assertEqual(written[3]["EmailStatus"], "sent")
+        self.assertTrue(written[2]["DraftedEmail"].startswith("FAILED"))
+
+
+class FollowupBatchCollectTestCase(unittest.TestCase):
+    """Prepared drafts only land on rows still due for the follow-up they were written for."""
+
+    def _collect(self, due_rows, state_rows, update_ok=True):
+        output = "\n".join(mod.json_dumps({
+            "custom_id": custom_id,
+            "response": {"status_code": 200, "body": {"choices": [{"message": {
+                "content": mod.json_dumps({"subject": "Re: hi", "body": f"draft {custom_id}"})
+            }}]}}
+        }) for custom_id in state_rows)
+        email_gen = mock.Mock()
+        email_gen.client.batches.retrieve.return_value = mock.Mock(id="b1", status="completed", output_file_id="f1")
+        email_gen.client.files.content.return_value.text = output
+        sheets = mock.Mock()
+        sheets.classify_rows.return_value = {"followup_1": due_rows, "followup_2": []}
+        sheets.update_rows.return_value = update_ok
+        state = {"batch_id": "b1", "as_of": "2024-03-02", "rows": state_rows}
+        with mock.patch.object(mod, "save_followup_batch_state") as save_state, mock.patch("click.secho"):
+            collected = mod.collect_followup_batch(email_gen, sheets, state)
+        return collected, sheets, save_state
+
+    def test_only_unchanged_due_rows_get_a_draft(self):
+        due = [
+            {"_row_number": 2, "Email": "a@x.com", "EmailStatus": "sent", "EmailCount": "1"},
+            {"_row_number": 3, "Email": "new@x.com", "EmailStatus": "sent", "EmailCount": "1"},
+        ]
+        snapshot = {"status": "sent", "count": "1"}
+        collected, sheets, save_state = self._collect(due, {
+            "2:followup_1": {"email": "a@x.com", **snapshot},
+            "3:followup_1": {"email": "b@x.com", **snapshot},   # contact replaced
+            "4:followup_1": {"email": "c@x.com", **snapshot},   # no longer due
+        })
+        self.assertTrue(collected)
+        self.assertEqual(sheets.classify_rows.call_args.kwargs["as_of"], mod.date(2024, 3, 2))
+        updates = sheets.update_rows.call_args.args[1]
+        self.assertEqual(list(updates), [2])
+        self.assertEqual(mod.json_loads(updates[2]["PreparedFollowUp"])["type"], "followup_1")
+        save_state.assert_called_once_with(None)
+
+    def test_failed_write_keeps_the_batch_for_the_next_run(self):
+        due = [{"_row_number": 2, "Email": "a@x.com", "EmailStatus": "sent", "EmailCount": "1"}]
+        collected, _, save_state = self._collect(
+            due, {"2:followup_1": {"email": "a@x.com", "status": "sent", "count": "1"}}, update_ok=False
+        )
+        self.assertFalse(collected)
+        save_state.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,37 @@
+import io
+import json
+import os
+import tempfile
+import threading
 import unittest
+from unittest import mock
+
+import requests
 
 import job_automation_langchain as mod
 
 
+def _response(status, headers=None, body=None):
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers.update(headers or {})
+    if body is not None:
+        resp._content = body.encode("utf-8")
+    return resp
+
+
+def _json_response(status, payload):
+    return _response(status, body=json.dumps(payload))
+
+
+def _bare(cls, **attrs):
+    """Instance of cls without running __init__ (no credentials or network), with attrs set."""
+    obj = cls.__new__(cls)
+    for name, value in attrs.items():
+        setattr(obj, name, value)
+    return obj
+
+
 class UtilsTestCase(unittest.TestCase):
     def test_format_salary_handles_structs(self):
         payload = [{"min": 100000, "max": 120000, "currency": "USD", "period": "year"}]
@@ -30,12 +59,229 @@ class UtilsTestCase(unittest.TestCase):
         self.assertEqual(key1, key2)
         self.assertTrue(key1)
 
+    def test_build_job_key_is_hashed_and_keeps_legacy_slug(self):
+        job = {"id": "123", "companyName": "OpenAI", "title": "ML Intern"}
+        key = mod.build_job_key(job)
+        self.assertRegex(key, r"^[0-9a-f]{32}$")
+        self.assertNotEqual(key, mod.build_job_key({**job, "title": "SWE Intern"}))
+        self.assertEqual(mod.legacy_job_key(job), "123-openai-ml-intern")
+
+    def test_filter_duplicates_matches_sheet_keys(self):
+        seen = {"title": "ML Intern", "companyName": "OpenAI", "id": "1"}
+        by_id = {"title": "SWE Intern", "companyName": "OpenAI", "id": "2"}
+        fresh = {"title": "Data Intern", "companyName": "OpenAI", "id": "3"}
+        pipeline = _bare(
+            mod.JobApplicationPipeline,
+            applied_job_ids={mod.dedup_id(mod.build_job_key(seen)), mod.dedup_id("2")},
+            has_legacy_job_keys=False,
+        )
+        with mock.patch("builtins.print"):
+            kept = pipeline.filter_duplicates([seen, by_id, fresh, dict(fresh)])
+        self.assertEqual([job["id"] for job in kept], ["3"])
+
+    def test_same_second_file_paths_differ_per_job(self):
+        first = {"id": "1", "companyName": "Acme", "title": "SWE Intern", "postedAt": "2024-01-01"}
+        second = {**first, "id": "2"}  # Same internship posted for another location
+        with mock.patch.object(mod.time, "time_ns", return_value=1_700_000_000 * 10**9):
+            paths = [
+                mod.generate_file_path("Acme", "SWE Intern", "2024-01-01", mod.build_job_key(job))
+                for job in (first, second)
+            ]
+        self.assertNotEqual(paths[0], paths[1])
+        self.assertTrue(all(path.startswith("resumes/tex/carlos-luna-pena-acme-swe-intern-20240101-") for path in paths))
+
+    def test_column_letter(self):
+        self.assertEqual([mod.column_letter(i) for i in (0, 25, 26, 701, 702)], ["A", "Z", "AA", "ZZ", "AAA"])
+
+    def test_prefilter_rejects_by_title(self):
+        self.assertTrue(mod.passes_prefilter({"title": "Software Engineering Intern"}))
+        self.assertTrue(mod.passes_prefilter({"title": "Backend Engineer", "descriptionHtml": "<p>Summer internship</p>"}))
+        self.assertFalse(mod.passes_prefilter({"title": "Senior Software Engineer"}))
+        self.assertFalse(mod.passes_prefilter({"title": "Sales Intern"}))
+        self.assertFalse(mod.passes_prefilter({"title": "Software Engineer", "descriptionHtml": "5+ years"}))
+
+    def test_prefilter_leaves_mixed_titles_to_the_llm(self):
+        # Another role family in a software title is not a rejection on its own
+        self.assertTrue(mod.passes_prefilter({"title": "Hardware/Software Co-design Intern"}))
+        self.assertTrue(mod.passes_prefilter({"title": "Software Engineering Intern – Finance Platform"}))
+        self.assertFalse(mod.passes_prefilter({"title": "Finance Intern"}))
+        self.assertFalse(mod.passes_prefilter({"title": "Senior Software Engineering Intern"}))
+
     def test_validate_latex_output_guards_length(self):
         self.assertFalse(mod.validate_latex_output("short"))
         valid = "\\documentclass{article}\n\\begin{document}\n" + ("a" * 210) + "\n\\end{document}"
         self.assertTrue(mod.validate_latex_output(valid))
 
+    def test_job_output_buffer_keeps_each_jobs_lines_together(self):
+        stream = io.StringIO()
+        output = mod.JobOutputBuffer(stream)
+        first_started, second_done = threading.Event(), threading.Event()
+
+        def first_job():
+            with output.captured():
+                output.write("a1\n")
+                first_started.set()
+                second_done.wait(5)
+                output.write("a2\n")
+
+        worker = threading.Thread(target=first_job)
+        worker.start()
+        first_started.wait(5)
+        with output.captured():
+            output.write("b1\n")
+        second_done.set()
+        worker.join()
+        self.assertEqual(stream.getvalue(), "b1\na1\na2\n")
+        with self.assertRaises(TypeError):
+            output.write(b"")
+
+
+class RequestWithRetriesTestCase(unittest.TestCase):
+    def test_retries_throttling_and_honors_retry_after(self):
+        responses = [_response(429, {"Retry-After": "7"}), _response(200)]
+        with mock.patch.object(mod._HTTP, "request", side_effect=responses) as req, \
+                mock.patch.object(mod.time, "sleep") as sleep:
+            resp = mod.request_with_retries("GET", "https://example.com", retries=3)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(req.call_count, 2)
+        sleep.assert_called_once_with(7.0)
+
+    def test_client_errors_are_not_retried(self):
+        with mock.patch.object(mod._HTTP, "request", return_value=_response(404)) as req, \
+                mock.patch.object(mod.time, "sleep"):
+            with self.assertRaises(requests.HTTPError):
+                mod.request_with_retries("GET", "https://example.com", retries=3)
+        self.assertEqual(req.call_count, 1)
+
+
+class GitHubClientTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = mod.GitHubClient("token", "owner/repo")
+
+    def test_put_fetches_sha_only_when_required_then_caches_it(self):
+        responses = [
+            _json_response(422, {"message": '"sha" wasn\'t supplied.'}),
+            _json_response(200, {"sha": "old"}),
+            _json_response(200, {"content": {"sha": "new"}}),
+            _json_response(200, {"content": {"sha": "newer"}}),
+        ]
+        with mock.patch.object(self.client.session, "request", side_effect=responses) as req:
+            self.client.upload_binary_file("pdf/a.pdf", b"1", "first")
+            self.client.upload_binary_file("pdf/a.pdf", b"2", "second")
+        methods = [call.args[0] for call in req.call_args_list]
+        self.assertEqual(methods, ["PUT", "GET", "PUT", "PUT"])
+        self.assertEqual(req.call_args_list[2].kwargs["json"]["sha"], "old")
+        self.assertEqual(req.call_args_list[3].kwargs["json"]["sha"], "new")
+
+    def test_unchanged_content_is_not_uploaded_again(self):
+        # git hash-object of b"1"
+        blob_sha = "56a6051ca2b02b04ef92d5150c9ef600403cb1de"
+        response = _json_response(201, {"content": {"sha": blob_sha}})
+        with mock.patch.object(self.client.session, "request", return_value=response) as req:
+            self.client.upload_binary_file("pdf/a.pdf", b"1", "first")
+            result = self.client.upload_binary_file("pdf/a.pdf", b"1", "again")
+        self.assertEqual(req.call_count, 1)
+        self.assertEqual(result["content"]["sha"], blob_sha)
+
+    def test_staged_files_land_in_one_commit(self):
+        patches = iter([_json_response(422, {"message": "Update is not a fast forward"}),
+                        _json_response(200, {})])
+
+        def fake_request(method, url, **kwargs):
+            if url.endswith("/git/blobs"):
+                return _json_response(201, {"sha": f"blob-{kwargs['json']['content']}"})
+            if "/git/ref/heads/main" in url:
+                return _json_response(200, {"object": {"sha": "head"}})
+            if "/git/commits/head" in url:
+                return _json_response(200, {"tree": {"sha": "base"}})
+            if url.endswith("/git/trees"):
+                return _json_response(201, {"sha": "tree"})
+            if url.endswith("/git/commits"):
+                return _json_response(201, {"sha": "commit"})
+            response = next(patches)
+            response.raise_for_status()
+            return response
+
+        with mock.patch.object(mod, "request_with_retries", side_effect=fake_request) as request:
+            self.assertTrue(self.client.stage_file("pdf/a.pdf", b"1", "Acme - Intern"))
+            self.assertTrue(self.client.stage_file("pdf/b.pdf", b"2", "Initech - Intern"))
+            self.assertEqual(self.client.commit_staged("Add compiled PDFs"), [])
+        methods = [c.args[0] for c in request.call_args_list]
+        # Two blobs, then tree/commit/ref; the ref update raced once and was rebuilt
+        self.assertEqual(methods, ["POST", "POST"] + ["GET", "GET", "POST", "POST", "PATCH"] * 2)
+        tree = next(c.kwargs["json"]["tree"] for c in request.call_args_list if c.args[1].endswith("/git/trees"))
+        self.assertEqual([entry["path"] for entry in tree], ["pdf/a.pdf", "pdf/b.pdf"])
+        self.assertEqual(self.client.raw_url("pdf/a.pdf"), "https://raw.githubusercontent.com/owner/repo/main/pdf/a.pdf")
+
+
+class ApifyClientTestCase(unittest.TestCase):
+    def test_yields_dataset_pages_until_the_run_finishes(self):
+        pages = iter(['[{"id": "1"}, {"id": "2"}]', '[]', '[{"id": "3"}]', '[]', '[]'])
+        statuses = iter(["RUNNING", "SUCCEEDED"])
+
+        def fake_request(method, url, **kwargs):
+            if method == "POST":
+                return _json_response(201, {"data": {"id": "run1", "defaultDatasetId": "ds1"}})
+            if "/datasets/ds1/items" in url:
+                return _response(200, body=next(pages))
+            return _json_response(200, {"data": {"status": next(statuses)}})
+
+        client = mod.ApifyClient("token")
+        with mock.patch.object(mod, "request_with_retries", side_effect=fake_request) as request:
+            jobs = [job["id"] for job in client.iter_linkedin_jobs("https://example.com/search")]
+        self.assertEqual(jobs, ["1", "2", "3"])
+        offsets = [c.kwargs["params"]["offset"] for c in request.call_args_list if "/items" in c.args[1]]
+        self.assertEqual(offsets, [0, 2, 2, 3, 3])
+
+
+class LLMResultCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".sqlite3")
+        os.close(handle)
+        self.cache = mod.LLMResultCache(path=self.path, ttl_days=1)
+
+    def tearDown(self):
+        self.cache.conn.close()
+        os.remove(self.path)
+
+    def test_reposted_job_is_filtered_from_cache(self):
+        job = {"id": "1", "title": "ML Intern", "companyName": "OpenAI", "postedAt": "2024-01-01"}
+        repost = {**job, "id": "2", "postedAt": "2024-02-01"}
+        self.assertEqual(mod.job_content_hash(job), mod.job_content_hash(repost))
+
+        chain = _bare(mod.JobFilterChain, cache=self.cache, llm=mock.Mock(model_name="test-model", temperature=0.0),
+                      chain=mock.Mock())
+        chain.chain.batch.return_value = [{"verdict": "true"}, RuntimeError("timeout")]
+        failing = {"id": "3", "title": "SWE Intern", "companyName": "Acme"}
+        with mock.patch("builtins.print"):
+            self.assertEqual(chain.filter_jobs([job, failing]), [True, False])
+            chain.chain.batch.reset_mock()
+            chain.chain.batch.return_value = [{"verdict": "false"}]
+            self.assertEqual(chain.filter_jobs([repost, failing]), [True, False])
+        # Only the job whose earlier call failed is sent again
+        self.assertEqual(len(chain.chain.batch.call_args[0][0]), 1)
+
+    def test_filter_verdicts_are_keyed_by_temperature(self):
+        job = {"id": "1", "title": "ML Intern", "companyName": "OpenAI"}
+        deterministic = _bare(mod.JobFilterChain, llm=mock.Mock(model_name="test-model", temperature=0.0))
+        sampled = _bare(mod.JobFilterChain, llm=mock.Mock(model_name="test-model", temperature=0.7))
+        self.assertNotEqual(deterministic._cache_key(job), sampled._cache_key(job))
+
+
+class GoogleSlidesClientTestCase(unittest.TestCase):
+    def test_flush_groups_whole_slides_under_the_request_limit(self):
+        slides = _bare(
+            mod.GoogleSlidesClient,
+            _pending_lock=threading.Lock(),
+            _pending=[(f"job {i}", [{"n": i}] * 200) for i in range(5)],
+        )
+        with mock.patch.object(slides, "_send", return_value=True) as send, \
+                mock.patch("builtins.print"):
+            self.assertEqual(slides.flush("deck"), 5)
+        # 200-request slides: two per 500-request batchUpdate, none split
+        self.assertEqual([len(c.args[1]) for c in send.call_args_list], [400, 400, 200])
+        self.assertEqual(slides._pending, [])
+
 
 if __name__ == "__main__":
     unittest.main()
-